@@ -0,0 +1,392 @@
+"""Render benchmark for the wallet canvas.
+
+Drives WalletUI painting, pointer sweeps, wheel scrolling and the token details
+screen against a recording canvas and reports, per frame, the items created,
+the canvas (Tcl) calls issued and the wall time, for several token counts.
+The background gradients are on, except that first_paint starts with the
+flat stand-in and swaps the gradients in on the next turn, as at startup.
+
+    python scripts/bench_render.py                    # recording canvas, no display needed
+    python scripts/bench_render.py --tk               # real Tk canvas (e.g. under xvfb-run)
+    python scripts/bench_render.py --json bench.json  # save results as a baseline
+    python scripts/bench_render.py --compare bench.json
+
+With --compare the run fails when items or calls per frame grow beyond the
+tolerance; wall times are only shown, they are too noisy to gate on.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.ui import token_details_screen, wallet_ui  # noqa: E402
+from src.ui.hit_index import HitIndex  # noqa: E402
+
+TOKEN_COUNTS = (2, 100, 1000, 10000)
+
+
+class RecordingCanvas:
+    """Canvas stand-in that counts every call crossing into Tcl.
+
+    Without a target it keeps a minimal display list itself (ids, tags and
+    stacking order) so the scene code sees the same answers Tk would give.
+    With a target (a real tk.Canvas) every call is forwarded and only counted.
+    """
+
+    def __init__(self, target=None):
+        self.target = target
+        self.calls = 0
+        self.created = 0
+        self._items: Dict[int, set] = {}
+        self._order: List[int] = []
+        self._next = 0
+
+    def reset_counters(self) -> None:
+        self.calls = 0
+        self.created = 0
+
+    def item_count(self) -> int:
+        if self.target is not None:
+            return len(self.target.find_all())
+        return len(self._order)
+
+    # ---- Recorded calls ----
+    def __getattr__(self, name: str) -> Callable[..., Any]:
+        if name.startswith('create_'):
+            def create(*args, **kw):
+                self.calls += 1
+                self.created += 1
+                if self.target is not None:
+                    return getattr(self.target, name)(*args, **kw)
+                tags = kw.get('tags', ())
+                self._next += 1
+                self._items[self._next] = {tags} if isinstance(tags, str) else set(tags)
+                self._order.append(self._next)
+                return self._next
+            return create
+        raise AttributeError(name)
+
+    def _forward(self, name: str, *args, **kw):
+        self.calls += 1
+        if self.target is not None:
+            return getattr(self.target, name)(*args, **kw)
+        return None
+
+    def _ids(self, tag_or_id) -> List[int]:
+        if isinstance(tag_or_id, int):
+            return [tag_or_id] if tag_or_id in self._items else []
+        if tag_or_id == 'all':
+            return list(self._order)
+        return [i for i in self._order if tag_or_id in self._items[i]]
+
+    def delete(self, tag_or_id) -> None:
+        self._forward('delete', tag_or_id)
+        if self.target is None:
+            for i in self._ids(tag_or_id):
+                self._order.remove(i)
+                del self._items[i]
+
+    def coords(self, iid, *coords):
+        return self._forward('coords', iid, *coords)
+
+    def itemconfigure(self, iid, **opts):
+        return self._forward('itemconfigure', iid, **opts)
+
+    itemconfig = itemconfigure
+
+    def move(self, tag_or_id, dx, dy) -> None:
+        self._forward('move', tag_or_id, dx, dy)
+
+    def configure(self, **opts):
+        return self._forward('configure', **opts)
+
+    config = configure
+
+    def find_withtag(self, tag_or_id):
+        found = self._forward('find_withtag', tag_or_id)
+        return found if self.target is not None else tuple(self._ids(tag_or_id))
+
+    def tag_raise(self, tag_or_id, above=None) -> None:
+        self._forward('tag_raise', tag_or_id, *(() if above is None else (above,)))
+        if self.target is None:
+            ids = self._ids(tag_or_id)
+            for i in ids:
+                self._order.remove(i)
+            k = len(self._order) if above is None else self._order.index(self._ids(above)[-1]) + 1
+            self._order[k:k] = ids
+
+    def tag_lower(self, tag_or_id, below=None) -> None:
+        self._forward('tag_lower', tag_or_id, *(() if below is None else (below,)))
+        if self.target is None:
+            ids = self._ids(tag_or_id)
+            for i in ids:
+                self._order.remove(i)
+            k = 0 if below is None else self._order.index(self._ids(below)[0])
+            self._order[k:k] = ids
+
+    def bind(self, *args, **kw):
+        if self.target is not None:
+            return self.target.bind(*args, **kw)
+        return None
+
+
+class EventLoop:
+    """Deterministic after/after_idle queue; each callback run is one loop turn."""
+
+    def __init__(self):
+        self._queue: List[Optional[Callable[[], None]]] = []
+
+    def after(self, _ms, func=None, *args):
+        self._queue.append(lambda: func(*args))
+        return str(len(self._queue) - 1)
+
+    def after_idle(self, func, *args):
+        return self.after(0, func, *args)
+
+    def after_cancel(self, ident) -> None:
+        self._queue[int(ident)] = None
+
+    def run(self, canvas: RecordingCanvas, frames: List[Dict[str, float]]) -> None:
+        # Run until idle, recording one frame per callback
+        pos = 0
+        while pos < len(self._queue):
+            func = self._queue[pos]
+            pos += 1
+            if func is None:
+                continue
+            canvas.reset_counters()
+            t0 = time.perf_counter()
+            func()
+            ms = (time.perf_counter() - t0) * 1000
+            frames.append({'created': canvas.created, 'calls': canvas.calls, 'ms': ms})
+        self._queue.clear()
+
+
+class _Event:
+    def __init__(self, x: float, y: float):
+        self.x, self.y = x, y
+
+
+def _placeholder_image(*_args, **_kw) -> str:
+    # Without Tk there is no PhotoImage; the canvas only needs a handle
+    return 'bench-gradient'
+
+
+def _tokens(n: int) -> List[Dict[str, Any]]:
+    return [{"name": f"Token {i}", "symbol": f"T{i}", "contract": f"con_bench_{i}",
+             "balance": i * 1.5, "icon": "TK"} for i in range(n)]
+
+
+def make_wallet_ui(n: int, target=None, gradients: bool = False):
+    """
+    WalletUI painting into a RecordingCanvas, without a window or network.
+    With gradients=False the background is the flat stand-in painted before
+    Pillow is loaded (as in the first frame at startup).
+    """
+    ui = wallet_ui.WalletUI.__new__(wallet_ui.WalletUI)
+    loop = EventLoop()
+    ui.after, ui.after_idle, ui.after_cancel = loop.after, loop.after_idle, loop.after_cancel
+    ui._init_view_state()
+    ui._gradients_ready = gradients
+    ui.active_tab = _Var("Tokens")
+    ui.tokens = _tokens(n)
+    ui.canvas = RecordingCanvas(target)
+    ui._init_scene()
+    return ui, loop
+
+
+def make_details_screen(token: Dict[str, Any], target=None):
+    screen = token_details_screen.TokenDetailsScreen.__new__(token_details_screen.TokenDetailsScreen)
+    screen.master = None
+    screen.token_data = token
+    screen.WIDTH, screen.HEIGHT = 360, 500
+    screen.canvas = RecordingCanvas(target)
+    screen.hit_areas = {'send': [], 'receive': [], 'swap': []}
+    screen.hit_index = HitIndex()
+    screen.hover_action = None
+    return screen
+
+
+class _Var:
+    def __init__(self, value):
+        self._value = value
+
+    def get(self):
+        return self._value
+
+    def set(self, value) -> None:
+        self._value = value
+
+
+# ---- Scenarios ----
+def scenario_first_paint(n, target):
+    # As at startup: flat background first, gradients swapped in right after
+    ui, loop = make_wallet_ui(n, target)
+    frames: List[Dict[str, float]] = []
+    ui.draw_ui()
+    ui.after_idle(ui._load_gradients)
+    loop.run(ui.canvas, frames)
+    return frames, ui.canvas.item_count()
+
+
+def scenario_repaint(n, target):
+    ui, loop = make_wallet_ui(n, target, gradients=True)
+    ui.draw_ui()
+    loop.run(ui.canvas, [])
+    frames: List[Dict[str, float]] = []
+    for _ in range(5):
+        ui.draw_ui()
+        loop.run(ui.canvas, frames)
+    return frames, ui.canvas.item_count()
+
+
+def scenario_hover_sweep(n, target):
+    # Pointer sweeps down the token list and back up across the tabs and bottom nav
+    ui, loop = make_wallet_ui(n, target, gradients=True)
+    ui.draw_ui()
+    loop.run(ui.canvas, [])
+    frames: List[Dict[str, float]] = []
+    path = [(180, y) for y in range(ui.LIST_TOP, ui.HEIGHT - 80, 3)]
+    path += [(x, ui.HEIGHT - 30) for x in range(10, ui.WIDTH - 10, 6)]
+    path += [(x, 290) for x in range(10, ui.WIDTH - 10, 6)]
+    for x, y in path:
+        ui._on_motion(_Event(x, y))
+        loop.run(ui.canvas, frames)
+    ui._clear_hover()
+    loop.run(ui.canvas, frames)
+    return frames, ui.canvas.item_count()
+
+
+def scenario_scroll(n, target):
+    # Ten wheel notches down, then ten up, each settling its smooth-scroll animation
+    ui, loop = make_wallet_ui(n, target, gradients=True)
+    ui.draw_ui()
+    loop.run(ui.canvas, [])
+    frames: List[Dict[str, float]] = []
+    for handler in [ui._on_scroll_down] * 10 + [ui._on_scroll_up] * 10:
+        handler(None)
+        loop.run(ui.canvas, frames)
+    return frames, ui.canvas.item_count()
+
+
+def scenario_details(n, target):
+    screen = make_details_screen(_tokens(max(n, 1))[-1], target)
+    frames: List[Dict[str, float]] = []
+    for _ in range(3):
+        screen.canvas.reset_counters()
+        t0 = time.perf_counter()
+        screen.draw_ui()
+        ms = (time.perf_counter() - t0) * 1000
+        frames.append({'created': screen.canvas.created, 'calls': screen.canvas.calls, 'ms': ms})
+    return frames, screen.canvas.item_count()
+
+
+SCENARIOS = {
+    'first_paint': scenario_first_paint,
+    'repaint': scenario_repaint,
+    'hover_sweep': scenario_hover_sweep,
+    'scroll': scenario_scroll,
+    'details': scenario_details,
+}
+
+
+def summarize(frames: List[Dict[str, float]], items: int) -> Dict[str, float]:
+    count = len(frames) or 1
+    return {
+        'frames': len(frames),
+        'created_per_frame': sum(f['created'] for f in frames) / count,
+        'calls_per_frame': sum(f['calls'] for f in frames) / count,
+        'ms_per_frame': sum(f['ms'] for f in frames) / count,
+        'max_ms': max((f['ms'] for f in frames), default=0.0),
+        'items': items,
+    }
+
+
+def run(counts, scenarios, target_factory=None) -> Dict[str, Dict[str, Dict[str, float]]]:
+    results: Dict[str, Dict[str, Dict[str, float]]] = {}
+    for name in scenarios:
+        results[name] = {}
+        for n in counts:
+            target = target_factory() if target_factory is not None else None
+            frames, items = SCENARIOS[name](n, target)
+            results[name][str(n)] = summarize(frames, items)
+    return results
+
+
+def print_table(results) -> None:
+    header = f"{'scenario':<12} {'tokens':>6} {'frames':>6} {'created/f':>10} {'calls/f':>9} {'ms/f':>8} {'max ms':>8} {'items':>6}"
+    print(header)
+    print('-' * len(header))
+    for name, per_count in results.items():
+        for n, r in per_count.items():
+            print(f"{name:<12} {n:>6} {r['frames']:>6} {r['created_per_frame']:>10.1f} {r['calls_per_frame']:>9.1f} "
+                  f"{r['ms_per_frame']:>8.2f} {r['max_ms']:>8.2f} {r['items']:>6}")
+
+
+def compare(results, baseline, tolerance: float) -> List[str]:
+    """Regressions in per-frame item creation or call counts versus a baseline."""
+    problems: List[str] = []
+    for name, per_count in results.items():
+        for n, r in per_count.items():
+            base = baseline.get(name, {}).get(n)
+            if not base:
+                continue
+            for key in ('created_per_frame', 'calls_per_frame', 'items'):
+                limit = base[key] * (1 + tolerance) + 0.5
+                if r[key] > limit:
+                    problems.append(f"{name} @ {n} tokens: {key} {r[key]:.1f} > {base[key]:.1f} (+{tolerance:.0%})")
+            if base['ms_per_frame'] > 0:
+                ratio = r['ms_per_frame'] / base['ms_per_frame']
+                if ratio > 1 + tolerance:
+                    print(f"note: {name} @ {n} tokens is {ratio:.2f}x slower per frame (not gated)")
+    return problems
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--tokens', type=int, nargs='+', default=list(TOKEN_COUNTS), help='token counts to run')
+    parser.add_argument('--scenario', choices=sorted(SCENARIOS), action='append', help='run only these scenarios')
+    parser.add_argument('--tk', action='store_true', help='forward to a real Tk canvas (needs a display, e.g. xvfb-run)')
+    parser.add_argument('--json', metavar='PATH', help='write results as JSON')
+    parser.add_argument('--compare', metavar='PATH', help='fail on regressions against a saved JSON run')
+    parser.add_argument('--tolerance', type=float, default=0.10, help='allowed growth for --compare (default 0.10)')
+    args = parser.parse_args()
+
+    target_factory = None
+    if args.tk:
+        import tkinter as tk
+        root = tk.Tk()
+        root.withdraw()
+        target_factory = lambda: tk.Canvas(root, width=360, height=640, highlightthickness=0)  # noqa: E731
+        # The benchmarked UI objects are not Tk widgets: create the gradient images on the root
+        gradient = wallet_ui.get_gradient_image
+        wallet_ui.get_gradient_image = token_details_screen.get_gradient_image = \
+            lambda _master, *args, **kw: gradient(root, *args, **kw)
+    else:
+        wallet_ui.get_gradient_image = _placeholder_image
+        token_details_screen.get_gradient_image = _placeholder_image
+
+    results = run(args.tokens, args.scenario or list(SCENARIOS), target_factory)
+    print_table(results)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        problems = compare(results, baseline, args.tolerance)
+        for p in problems:
+            print(f"REGRESSION: {p}")
+        if problems:
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,339 @@
+"""Local stand-in for a Xian node's CometBFT RPC.
+
+Serves /status and /abci_query balance lookups (also as JSON-RPC, single or
+batched) from memory with optional artificial latency, plus /websocket Tx
+event subscriptions. Counts requests and TCP connections so client
+behaviour (keep-alive, batching, reconnects) can be checked without a
+network.
+
+    python scripts/fake_node.py --port 26657 --latency-ms 150
+    python scripts/fake_node.py --no-batch     # reject JSON-RPC batches like some proxies
+    python scripts/fake_node.py --check        # exercise src.core.node_client
+
+Point the wallet at http://127.0.0.1:<port> to use it.
+"""
+
+import argparse
+import base64
+import json
+import os
+import sys
+import threading
+import time
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+
+from src.core.node_events import OP_CLOSE, OP_PING, OP_PONG, OP_TEXT, accept_key, encode_frame, parse_frame  # noqa: E402
+
+
+class FakeNode:
+    """Chain state plus the HTTP server exposing it."""
+
+    def __init__(self, port: int = 0, latency_ms: float = 0.0, batch: bool = True):
+        self.latency_ms = latency_ms
+        self.batch = batch
+        self.height = 1
+        # "contract.variable:key" -> value
+        self.state: Dict[str, Any] = {}
+        self.requests = 0
+        self.connections = 0
+        # Open /websocket connections: (socket, send lock, subscribed queries)
+        self.subscribers: List[Tuple[Any, threading.Lock, List[str]]] = []
+        self._lock = threading.Lock()
+        node = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'  # keep-alive
+
+            def setup(self):
+                super().setup()
+                with node._lock:
+                    node.connections += 1
+
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                if self.path == '/websocket' and self.headers.get('Upgrade', '').lower() == 'websocket':
+                    self._websocket()
+                    return
+                with node._lock:
+                    node.requests += 1
+                if node.latency_ms:
+                    time.sleep(node.latency_ms / 1000)
+                url = urllib.parse.urlsplit(self.path)
+                params = urllib.parse.parse_qs(url.query)
+                if url.path == '/status':
+                    self._reply({'result': {'sync_info': {'latest_block_height': str(node.height)}}})
+                elif url.path == '/abci_query':
+                    path = params.get('path', [''])[0].strip('"')
+                    self._reply(node.abci_query(path))
+                else:
+                    self._reply({'error': 'not found'}, status=404)
+
+            def do_POST(self):
+                with node._lock:
+                    node.requests += 1
+                if node.latency_ms:
+                    time.sleep(node.latency_ms / 1000)
+                body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+                try:
+                    calls = json.loads(body)
+                except ValueError:
+                    self._reply({'error': 'parse error'}, status=400)
+                    return
+                if isinstance(calls, list):
+                    if not node.batch:
+                        self._reply({'error': 'batch requests are not supported'}, status=400)
+                        return
+                    self._reply([node.rpc(c) for c in calls])
+                else:
+                    self._reply(node.rpc(calls))
+
+            def _websocket(self):
+                self.send_response(101)
+                self.send_header('Upgrade', 'websocket')
+                self.send_header('Connection', 'Upgrade')
+                self.send_header('Sec-WebSocket-Accept', accept_key(self.headers['Sec-WebSocket-Key']))
+                self.end_headers()
+                self.wfile.flush()
+                sock, lock, queries = self.connection, threading.Lock(), []
+                entry = (sock, lock, queries)
+                with node._lock:
+                    node.subscribers.append(entry)
+                buf = bytearray()
+                try:
+                    while True:
+                        frame = parse_frame(buf)
+                        if frame is None:
+                            data = sock.recv(65536)
+                            if not data:
+                                break
+                            buf += data
+                            continue
+                        _, opcode, payload, size = frame
+                        del buf[:size]
+                        if opcode == OP_CLOSE:
+                            break
+                        if opcode == OP_PING:
+                            with lock:
+                                sock.sendall(encode_frame(OP_PONG, payload, mask=False))
+                        elif opcode == OP_TEXT:
+                            call = json.loads(payload)
+                            if call.get('method') == 'subscribe':
+                                queries.append(call['params']['query'])
+                            reply = {'jsonrpc': '2.0', 'id': call.get('id'), 'result': {}}
+                            with lock:
+                                sock.sendall(encode_frame(OP_TEXT, json.dumps(reply).encode(), mask=False))
+                except OSError:
+                    pass
+                finally:
+                    with node._lock:
+                        if entry in node.subscribers:
+                            node.subscribers.remove(entry)
+                    self.close_connection = True
+
+            def _reply(self, payload: Any, status: int = 200):
+                body = json.dumps(payload).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        class Server(ThreadingHTTPServer):
+            def handle_error(self, request, client_address):
+                # Clients aborting requests (cancelled refreshes) are expected
+                if not isinstance(sys.exc_info()[1], ConnectionError):
+                    super().handle_error(request, client_address)
+
+        self.server = Server(('127.0.0.1', port), Handler)
+        self.server.daemon_threads = True
+        self.url = f'http://127.0.0.1:{self.server.server_address[1]}'
+
+    def set_balance(self, contract: str, address: str, value: Any) -> None:
+        self.state[f'{contract}.balances:{address}'] = value
+
+    def abci_query(self, path: str) -> Dict[str, Any]:
+        value: Optional[str] = None
+        if path.startswith('/get/'):
+            raw = self.state.get(path[len('/get/'):])
+            if raw is not None:
+                text = json.dumps({'__fixed__': str(raw)} if isinstance(raw, float) else raw)
+                value = base64.b64encode(text.encode('utf-8')).decode('ascii')
+        return {'result': {'response': {'code': 0, 'value': value, 'height': str(self.height)}}}
+
+    def rpc(self, call: Dict[str, Any]) -> Dict[str, Any]:
+        reply: Dict[str, Any] = {'jsonrpc': '2.0', 'id': call.get('id')}
+        params = call.get('params') or {}
+        if call.get('method') == 'abci_query' and isinstance(params.get('path'), str):
+            reply['result'] = self.abci_query(params['path'])['result']
+        elif call.get('method') == 'status':
+            reply['result'] = {'sync_info': {'latest_block_height': str(self.height)}}
+        else:
+            reply['error'] = {'code': -32601, 'message': 'Method not found'}
+        return reply
+
+    def commit_tx(self, changes: Dict[str, Any]) -> None:
+        """
+        Apply state changes ("contract.variable:key" -> value) in a new block
+        and push a Tx event to every subscriber.
+        """
+        self.height += 1
+        self.state.update(changes)
+        result = {'state': [{'key': k, 'value': v} for k, v in changes.items()]}
+        event = {'jsonrpc': '2.0', 'id': 1, 'result': {
+            'query': "tm.event='Tx'",
+            'data': {'type': 'tendermint/event/Tx', 'value': {'TxResult': {
+                'height': str(self.height),
+                'result': {'data': base64.b64encode(json.dumps(result).encode()).decode('ascii')},
+            }}},
+            'events': {'tm.event': ['Tx'], 'tx.height': [str(self.height)]},
+        }}
+        frame = encode_frame(OP_TEXT, json.dumps(event).encode(), mask=False)
+        with self._lock:
+            subscribers = list(self.subscribers)
+        for sock, lock, queries in subscribers:
+            if queries:
+                try:
+                    with lock:
+                        sock.sendall(frame)
+                except OSError:
+                    pass
+
+    def drop_websockets(self) -> None:
+        """Cut every /websocket connection (clients should reconnect)."""
+        with self._lock:
+            subscribers = list(self.subscribers)
+        for sock, _, _ in subscribers:
+            try:
+                sock.shutdown(2)
+            except OSError:
+                pass
+
+    def start(self) -> 'FakeNode':
+        threading.Thread(target=self.server.serve_forever, daemon=True, name='fake-node').start()
+        return self
+
+    def stop(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def check(latency_ms: float) -> int:
+    from src.core import node_client
+
+    node = FakeNode(latency_ms=latency_ms).start()
+    address = 'ab' * 32
+    contracts = [f'con_token{i}' for i in range(20)]
+    for i, contract in enumerate(contracts):
+        node.set_balance(contract, address, float(i) + 0.5)
+    node.set_balance('currency', address, 42)
+
+    client = node_client.get_client(node.url, timeout=5.0, max_connections=4)
+    failures = []
+    if client.get_balance(address, 'currency') != 42:
+        failures.append('currency balance')
+    if client.get_balance(address, 'con_missing') != 0:
+        failures.append('missing balance is not 0')
+    for i, contract in enumerate(contracts):
+        if client.get_balance(address, contract) != float(i) + 0.5:
+            failures.append(f'{contract} balance')
+    if client.status()['height'] != node.height:
+        failures.append('status height')
+
+    print(f'{node.requests} requests over {node.connections} connection(s)')
+    if node.connections != 1:
+        failures.append('sequential requests did not reuse the connection')
+
+    # Batched lookups: one request for all contracts; per-key fallback without batching
+    from src.core.balance_fetch import fetch_balances_batched
+
+    expected = {c: float(i) + 0.5 for i, c in enumerate(contracts)}
+    expected.update({'currency': 42, 'con_missing': 0})
+    for batch in (True, False):
+        node.batch = batch
+        before = node.requests
+        client = node_client.NodeClient(node.url, timeout=5.0)
+        streamed: Dict[str, Any] = {}
+        balances, failed = fetch_balances_batched(client, address, list(expected), on_result=streamed.__setitem__)
+        client.close()
+        used = node.requests - before
+        print(f"batch={'on' if batch else 'off'}: {len(balances)} balances in {used} request(s)")
+        if balances != expected or failed:
+            failures.append(f'batch={batch}: wrong balances')
+        if streamed != balances:
+            failures.append(f'batch={batch}: streamed balances differ from the result')
+        if batch and used != 1:
+            failures.append('batched lookup took more than one request')
+
+    failures += check_subscription(node, address)
+    node_client.close_all()
+    node.stop()
+    for f in failures:
+        print(f'FAIL: {f}')
+    return 1 if failures else 0
+
+
+def check_subscription(node: FakeNode, address: str) -> List[str]:
+    """Push updates: a Tx touching the address reports its contract, also after a reconnect."""
+    import queue
+
+    from src.core.node_events import BalanceSubscription
+
+    changes: 'queue.Queue' = queue.Queue()
+    states: 'queue.Queue' = queue.Queue()
+    sub = BalanceSubscription(node.url, address, changes.put, states.put)
+    sub.BACKOFF_MIN = 0.1
+    sub.start()
+    failures = []
+    try:
+        if states.get(timeout=5) != 'live':
+            failures.append('subscription did not come up')
+        node.commit_tx({f'con_token3.balances:{address}': 7, 'currency.balances:' + 'cd' * 32: 1})
+        node.commit_tx({'currency.balances:' + 'cd' * 32: 2})  # other address: ignored
+        got = changes.get(timeout=5)
+        print(f'pushed change for {sorted(got)}')
+        if got != {'con_token3'}:
+            failures.append(f'unexpected contracts {got}')
+        node.drop_websockets()
+        if states.get(timeout=5) != 'polling' or states.get(timeout=5) != 'live':
+            failures.append('subscription did not reconnect')
+        node.commit_tx({f'currency.balances:{address}': 1})
+        if changes.get(timeout=5) != {'currency'}:
+            failures.append('no change after reconnect')
+        if not changes.empty():
+            failures.append('change reported for another address')
+    except queue.Empty:
+        failures.append('timed out waiting for the subscription')
+    finally:
+        sub.stop()
+    return failures
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--port', type=int, default=26657)
+    parser.add_argument('--latency-ms', type=float, default=0.0, help='delay added to every request')
+    parser.add_argument('--no-batch', action='store_true', help='reject JSON-RPC batch requests')
+    parser.add_argument('--check', action='store_true', help='run the node client checks and exit')
+    args = parser.parse_args()
+    if args.check:
+        return check(args.latency_ms)
+
+    node = FakeNode(args.port, args.latency_ms, batch=not args.no_batch)
+    node.set_balance('currency', 'ab' * 32, 100.0)
+    print(f'fake node on {node.url} (Ctrl+C to stop)')
+    try:
+        node.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,87 @@
+"""Import-time report for the wallet's startup path.
+
+Imports what xian_portal.py needs before the first paint in a fresh
+interpreter under `-X importtime` and lists the most expensive modules.
+
+    python scripts/import_report.py                   # report
+    python scripts/import_report.py --check           # fail if deferred modules load early
+    python scripts/import_report.py --check --budget-ms 400
+
+--check is meant as a startup check: xian-py, pystray, qrcode, Pillow, ttk and
+the details/send screens must only be imported on first use.
+scripts/startup_check.py checks the same list in a running window.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from typing import List, Tuple
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+# Modules the startup path must not import (checked by top-level package too)
+DEFERRED = (
+    'xian_py',
+    'pystray',
+    'qrcode',
+    'PIL',
+    'tkinter.ttk',
+    'src.core.wallet_manager',
+    'src.ui.system_tray',
+    'src.ui.token_details_screen',
+    'src.ui.send_modal',
+)
+
+
+def measure(module: str) -> List[Tuple[int, int, str]]:
+    """(self_us, cumulative_us, name) for every module imported by `import module`."""
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=ROOT, capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        sys.stderr.write(proc.stderr)
+        raise SystemExit(f"importing {module} failed")
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        # Nesting is shown by indentation of the name (after one separating space)
+        rows.append((int(self_us), int(cumulative_us), name[1:].rstrip()))
+    return rows
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--module', default='src.ui.wallet_ui', help='module imported by the startup path')
+    parser.add_argument('--top', type=int, default=15, help='number of modules to list')
+    parser.add_argument('--check', action='store_true', help='fail if a deferred module is imported')
+    parser.add_argument('--budget-ms', type=float, help='fail if the total import time exceeds this')
+    args = parser.parse_args()
+
+    rows = measure(args.module)
+    names = [name.strip() for _, _, name in rows]
+    # Top-level entries (no indentation) add up to the whole import
+    total_us = sum(cum for _, cum, name in rows if not name.startswith(' '))
+
+    print(f"{args.module}: {len(rows)} modules, {total_us / 1000:.1f} ms")
+    print(f"{'self ms':>9} {'cumul ms':>9}  module")
+    for self_us, cum_us, name in sorted(rows, key=lambda r: r[1], reverse=True)[:args.top]:
+        print(f"{self_us / 1000:>9.1f} {cum_us / 1000:>9.1f}  {name.strip()}")
+
+    failures = []
+    if args.check:
+        early = [d for d in DEFERRED if any(n == d or n.startswith(d + '.') for n in names)]
+        if early:
+            failures.append("imported before first paint: " + ", ".join(early))
+    if args.budget_ms is not None and total_us / 1000 > args.budget_ms:
+        failures.append(f"import time {total_us / 1000:.1f} ms exceeds budget {args.budget_ms:.0f} ms")
+    for f in failures:
+        print(f"FAIL: {f}")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
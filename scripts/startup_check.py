@@ -0,0 +1,79 @@
+"""Startup check: what exists when the wallet window first paints.
+
+Opens the real WalletUI (needs a display), waits for the first paint and
+checks that only the main canvas has been built and that none of the
+modules deferred to first use have been imported yet.
+
+    python scripts/startup_check.py
+    python scripts/startup_check.py --max-widgets 1 --max-modules 400
+
+App data is redirected to a temporary directory, so no stored wallet is
+unlocked and the check does not depend on the local profile.
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+
+def count_widgets(widget) -> int:
+    children = widget.winfo_children()
+    return len(children) + sum(count_widgets(c) for c in children)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--max-widgets', type=int, default=1, help='widgets allowed under the root window')
+    parser.add_argument('--max-modules', type=int, help='fail if more modules are loaded')
+    parser.add_argument('--timeout', type=float, default=10.0, help='seconds to wait for the first paint')
+    args = parser.parse_args()
+
+    home = tempfile.mkdtemp(prefix='xian-startup-')
+    os.environ['HOME'] = os.environ['APPDATA'] = home
+    sys.path.insert(0, ROOT)
+    from import_report import DEFERRED
+    from src.ui.wallet_ui import WalletUI
+
+    class ProbedWalletUI(WalletUI):
+        # Gradients are the first thing queued behind the first paint, so
+        # this is the state the user sees the window in
+        at_first_paint = None
+
+        def _load_gradients(self):
+            self.at_first_paint = ([w.winfo_class() for w in self.winfo_children()],
+                                   count_widgets(self), sorted(sys.modules))
+            super()._load_gradients()
+
+    ui = ProbedWalletUI()
+    deadline = time.perf_counter() + args.timeout
+    while ui.at_first_paint is None and time.perf_counter() < deadline:
+        ui.update()
+    painted = ui.at_first_paint is not None
+    widgets, widget_count, loaded = ui.at_first_paint or ([], 0, [])
+    early = [d for d in DEFERRED if any(n == d or n.startswith(d + '.') for n in loaded)]
+    ui.destroy()
+
+    print(ui.startup_trace.report())
+    print(f"widgets at first paint: {widget_count} ({', '.join(widgets)})")
+    print(f"modules at first paint: {len(loaded)}")
+
+    failures = []
+    if not painted:
+        failures.append(f"no first paint within {args.timeout:.0f} s")
+    if widget_count > args.max_widgets:
+        failures.append(f"{widget_count} widgets exceed the limit of {args.max_widgets}")
+    if args.max_modules is not None and len(loaded) > args.max_modules:
+        failures.append(f"{len(loaded)} modules exceed the limit of {args.max_modules}")
+    if early:
+        failures.append("imported before first paint: " + ", ".join(early))
+    for f in failures:
+        print(f"FAIL: {f}")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,200 @@
+"""Stress test for switching node and wallet while balances are refreshing.
+
+Runs the wallet UI headless (as in bench_render.py) against two local fake
+nodes whose balances encode (node, address, contract), then switches node
+and wallet at random short intervals. After every event-loop step each
+shown balance must belong to the current node and wallet; refreshes of a
+superseded wallet/node must be cancelled promptly and their results
+dropped. Config and caches go to a temporary HOME/APPDATA.
+
+    python scripts/stress_switch.py
+    python scripts/stress_switch.py --switches 200 --latency-ms 300 --no-batch
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_render import make_wallet_ui  # noqa: E402
+from fake_node import FakeNode  # noqa: E402
+
+ADDRESSES = ['ab' * 32, 'cd' * 32, 'ef' * 32]
+
+
+class Wallet:
+    def __init__(self, public_key: str):
+        self.public_key = public_key
+
+
+class Loop:
+    """Runs the after()/after_idle() callbacks of a headless WalletUI on this thread."""
+
+    def __init__(self):
+        self.queue: List[Tuple[float, int, Callable[[], Any]]] = []
+        self._seq = 0
+
+    def after(self, ms: int, fn: Callable[[], Any] = None, *args):
+        # Long timers (auto refresh) never fire during a run
+        if fn is not None and ms < 1000:
+            self._seq += 1
+            self.queue.append((time.perf_counter() + ms / 1000, self._seq, lambda: fn(*args)))
+        return f'after#{self._seq}'
+
+    def step(self) -> bool:
+        now = time.perf_counter()
+        ready = sorted(x for x in self.queue if x[0] <= now)
+        for item in ready:
+            self.queue.remove(item)
+            item[2]()
+        return bool(ready)
+
+
+def expected_balance(node_index: int, address: str, contract_index: int) -> int:
+    return node_index * 1000 + ADDRESSES.index(address) * 100 + contract_index
+
+
+def run(switches: int, tokens: int, latency_ms: float, batch: bool, seed: int) -> int:
+    from src.core.startup import StartupTrace
+
+    random.seed(seed)
+    nodes = [FakeNode(latency_ms=latency_ms, batch=batch).start() for _ in range(2)]
+    ui, _ = make_wallet_ui(tokens)
+    contracts = [t['contract'] for t in ui.tokens]
+    for n, node in enumerate(nodes):
+        for address in ADDRESSES:
+            for c, contract in enumerate(contracts):
+                node.set_balance(contract, address, expected_balance(n, address, c))
+
+    loop = Loop()
+    ui.after = loop.after
+    ui.after_idle = lambda fn, *args: loop.after(0, fn, *args)
+    ui.after_cancel = lambda job: None
+    ui._load_tokens_from_config = lambda *args: None
+    ui._system_tray = None
+    ui.startup_trace = StartupTrace()
+    for t in ui.tokens:
+        t['balance'] = None
+
+    # When each generation was superseded, and how long its jobs ran on after that
+    superseded_at: Dict[int, float] = {}
+    late_ms: List[float] = []
+    check_generation = ui._check_generation
+
+    def tracked_check_generation():
+        generation = ui._generation
+        check_generation()
+        if ui._generation != generation:
+            superseded_at[generation] = time.perf_counter()
+
+    ui._check_generation = tracked_check_generation
+    apply_balances = ui._apply_balances
+
+    def tracked_apply(*args, **kw):
+        job = args[7] if len(args) > 7 else kw.get('job')
+        if job is not None and job['generation'] in superseded_at:
+            late_ms.append((time.perf_counter() - superseded_at[job['generation']]) * 1000)
+        apply_balances(*args, **kw)
+
+    ui._apply_balances = tracked_apply
+
+    violations: List[str] = []
+
+    def check_shown():
+        node_index = [n.url for n in nodes].index(ui.node_url)
+        address = ui.current_wallet.public_key
+        for c, t in enumerate(ui.tokens):
+            if t['balance'] is not None and t['balance'] != expected_balance(node_index, address, c):
+                violations.append(f"{t['contract']}: {t['balance']} shown for node {node_index}, "
+                                  f"wallet {ADDRESSES.index(address)}")
+
+    def pump(seconds: float):
+        end = time.perf_counter() + seconds
+        while time.perf_counter() < end:
+            loop.step()
+            check_shown()
+            time.sleep(0.001)
+
+    ui.current_wallet = Wallet(ADDRESSES[0])
+    ui._apply_node_list([nodes[0].url])
+    ui._refresh_balances()
+    # A -> B -> A within one Tk turn: the refresh for A again must not wait
+    # behind (and be dropped with) the superseded first one
+    ui.current_wallet = Wallet(ADDRESSES[1])
+    ui._refresh_balances()
+    ui.current_wallet = Wallet(ADDRESSES[0])
+    ui._refresh_balances()
+    deadline = time.perf_counter() + 10
+    while ui.loading_balances and time.perf_counter() < deadline:
+        pump(0.01)
+    missing = [t['contract'] for t in ui.tokens if t['balance'] is None]
+    if missing:
+        violations.append(f'no balance after switching back to wallet 0 for {missing}')
+    t0 = time.perf_counter()
+    for _ in range(switches):
+        if random.random() < 0.5:
+            ui._apply_node_list([random.choice(nodes).url])
+        else:
+            ui.current_wallet = Wallet(random.choice(ADDRESSES))
+        if random.random() < 0.3:
+            # Like the import/create dialogs: the switch is followed by modal
+            # prompts before the refresh, while older jobs keep delivering
+            pump(random.uniform(0, latency_ms) / 1000)
+        ui._refresh_balances()
+        pump(random.uniform(0, latency_ms * 1.5) / 1000)
+    switching_s = time.perf_counter() - t0
+
+    # Let the last generation finish
+    deadline = time.perf_counter() + 10
+    while (ui.loading_balances or loop.queue) and time.perf_counter() < deadline:
+        pump(0.01)
+    missing = [t['contract'] for t in ui.tokens if t['balance'] is None]
+
+    ui.node_pool.stop()
+    if ui._subscription is not None:
+        ui._subscription.stop()
+    connections = sum(n.connections for n in nodes)
+    for node in nodes:
+        node.stop()
+
+    print(f'{switches} switches in {switching_s:.1f} s ({tokens} tokens, {latency_ms:.0f} ms latency, '
+          f"batch {'on' if batch else 'off'})")
+    print(f'{ui._generation} generations, {len(late_ms)} superseded results dropped')
+    if late_ms:
+        late_ms.sort()
+        print(f'superseded jobs ended {late_ms[len(late_ms) // 2]:.0f} ms (median), '
+              f'{late_ms[-1]:.0f} ms (max) after the switch')
+    print(f'{connections} connections accepted by the nodes (HTTP and WebSocket)')
+    failures = violations[:5]
+    if missing:
+        failures.append(f'no balance after the last switch for {missing}')
+    if late_ms and late_ms[-1] > latency_ms:
+        failures.append(f'a superseded job ran {late_ms[-1]:.0f} ms past its cancellation')
+    for f in failures:
+        print(f'FAIL: {f}')
+    return 1 if failures else 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--switches', type=int, default=100)
+    parser.add_argument('--tokens', type=int, default=20)
+    parser.add_argument('--latency-ms', type=float, default=200.0, help='delay added to every node request')
+    parser.add_argument('--no-batch', action='store_true', help='nodes reject JSON-RPC batches (per-token queries)')
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+    # The wallet saves the node list and balance cache: keep them out of the real app data
+    home = tempfile.mkdtemp(prefix='xian-stress-')
+    os.environ['HOME'] = os.environ['APPDATA'] = home
+    return run(args.switches, args.tokens, args.latency_ms, not args.no_batch, args.seed)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
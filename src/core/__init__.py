@@ -1,6 +1,11 @@
 
 
 
-from .wallet_manager import WalletManager
+def __getattr__(name):
+    # Keep `import src.core.<module>` light; the wallet stack loads on first use
+    if name == 'WalletManager':
+        from .wallet_manager import WalletManager
+        return WalletManager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 __all__ = ['WalletManager']
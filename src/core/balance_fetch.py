@@ -0,0 +1,190 @@
+# Concurrent balance queries through a bounded pool of worker threads
+
+from __future__ import annotations
+
+import contextvars
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+# Called with (contract, balance) as soon as each balance is known
+OnResult = Optional[Callable[[str, Any], None]]
+
+
+def fetch_balances(
+    get_balance: Callable[[str], Any],
+    contracts: Iterable[str],
+    max_workers: int = 4,
+    timeout: float = 10.0,
+    on_result: OnResult = None,
+) -> Tuple[Dict[str, Any], Set[str]]:
+    """
+    Call get_balance(contract) for every contract on at most `max_workers`
+    threads at a time. Returns ({contract: balance}, failed_contracts);
+    on_result gets each balance as it completes, on the calling thread.
+
+    A query counts as failed once it has run for `timeout` seconds. The call
+    itself cannot be interrupted, so its (daemon) thread is abandoned and the
+    late result ignored; the whole fetch gives up after the time the queries
+    would take in waves of `max_workers`.
+    """
+    contracts = list(dict.fromkeys(contracts))
+    results: Dict[str, Any] = {}
+    failed: Set[str] = set()
+    if not contracts:
+        return results, failed
+
+    todo: "queue.Queue[str]" = queue.Queue()
+    for contract in contracts:
+        todo.put(contract)
+    done: "queue.Queue[Tuple[str, bool, Any]]" = queue.Queue()
+    started: Dict[str, float] = {}
+    lock = threading.Lock()
+
+    def worker():
+        while True:
+            try:
+                contract = todo.get_nowait()
+            except queue.Empty:
+                return
+            with lock:
+                started[contract] = time.perf_counter()
+            try:
+                done.put((contract, True, get_balance(contract)))
+            except Exception:
+                done.put((contract, False, None))
+
+    workers = max(1, min(max_workers, len(contracts)))
+    for _ in range(workers):
+        # Workers run in a copy of the caller's context (e.g. its node_client.cancel_scope)
+        context = contextvars.copy_context()
+        threading.Thread(target=context.run, args=(worker,), daemon=True, name="balance-fetch").start()
+
+    deadline = time.perf_counter() + timeout * -(-len(contracts) // workers)
+    remaining = set(contracts)
+    while remaining:
+        with lock:
+            expiries = [started[c] + timeout for c in remaining if c in started]
+        wait_s = min(expiries + [deadline]) - time.perf_counter()
+        try:
+            contract, ok, value = done.get(timeout=max(0.0, wait_s))
+            if contract in remaining:
+                remaining.discard(contract)
+                if ok:
+                    results[contract] = value
+                    if on_result is not None:
+                        on_result(contract, value)
+                else:
+                    failed.add(contract)
+        except queue.Empty:
+            pass
+        now = time.perf_counter()
+        with lock:
+            expired = {c for c in remaining if now >= deadline or (c in started and now - started[c] >= timeout)}
+        remaining -= expired
+        failed |= expired
+
+    # Whatever is still queued (after a deadline) is not started anymore
+    while True:
+        try:
+            todo.get_nowait()
+        except queue.Empty:
+            break
+    return results, failed
+
+
+def fetch_balances_batched(
+    client: Any,
+    address: str,
+    contracts: Iterable[str],
+    max_workers: int = 4,
+    timeout: float = 10.0,
+    on_result: OnResult = None,
+) -> Tuple[Dict[str, Any], Set[str]]:
+    """
+    Balances of `address` through a NodeClient: one batch request per
+    BATCH_SIZE contracts, then per-key queries (as in fetch_balances) for
+    contracts the batch did not answer or when the node rejects batches.
+    on_result gets the balances of each batch, then each per-key result.
+    """
+    from src.core.node_client import BATCH_SIZE, BatchNotSupported, Cancelled, cancelled
+
+    contracts = list(dict.fromkeys(contracts))
+    results: Dict[str, Any] = {}
+    for start in range(0, len(contracts), BATCH_SIZE):
+        try:
+            batch = client.get_balances(address, contracts[start:start + BATCH_SIZE])
+        except BatchNotSupported:
+            break
+        except Cancelled:
+            raise
+        except Exception:
+            if results:
+                break  # keep what arrived; the rest goes key by key
+            # The node is unreachable; querying key by key would only wait longer
+            return {}, set(contracts)
+        results.update(batch)
+        if on_result is not None:
+            for contract, value in batch.items():
+                on_result(contract, value)
+    missing = [c for c in contracts if c not in results]
+    failed: Set[str] = set()
+    if missing and cancelled():
+        raise Cancelled()
+    if missing:
+        more, failed = fetch_balances(lambda c: client.get_balance(address, c), missing,
+                                      max_workers, timeout, on_result)
+        results.update(more)
+    return results, failed
+
+
+def fetch_balances_since(
+    client: Any,
+    address: str,
+    contracts: Iterable[str],
+    cached: Dict[str, Any],
+    max_workers: int = 4,
+    timeout: float = 10.0,
+    on_result: OnResult = None,
+) -> Tuple[Dict[str, Any], Set[str], Optional[int], List[str]]:
+    """
+    fetch_balances_batched, skipping contracts whose cached value is already
+    at the chain's latest height (one /status call). `cached` is a
+    balance_cache snapshot; skipped contracts return their cached value.
+    Returns (balances, failed, latest_height, queried_contracts); on_result
+    streams the fetched balances only. Raises Cancelled when the enclosing
+    node_client.cancel_scope is cancelled.
+    """
+    from src.core.node_client import Cancelled, cancelled
+
+    try:
+        height = client.status(timeout=min(timeout, 5.0))["height"]
+    except Cancelled:
+        raise
+    except Exception:
+        height = None
+    contracts = list(dict.fromkeys(contracts))
+    balances = cached.get("balances", {})
+    heights = cached.get("heights", {})
+    current = set()
+    if height is not None:
+        current = {c for c in contracts
+                   if balances.get(c) is not None and isinstance(heights.get(c), int) and heights[c] >= height}
+    queried = [c for c in contracts if c not in current]
+    results: Dict[str, Any] = {}
+    failed: Set[str] = set()
+    if queried:
+        results, failed = fetch_balances_batched(client, address, queried, max_workers, timeout, on_result)
+    if failed and cancelled():
+        raise Cancelled()
+    for contract in current:
+        results[contract] = balances[contract]
+    return results, failed, height, queried
+
+
+__all__ = [
+    "fetch_balances",
+    "fetch_balances_batched",
+    "fetch_balances_since",
+]
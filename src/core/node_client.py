@@ -0,0 +1,345 @@
+# Node RPC access over pooled keep-alive connections, one client per node URL
+
+from __future__ import annotations
+
+import base64
+import contextlib
+import contextvars
+import http.client
+import json
+import queue
+import socket
+import threading
+import time
+import urllib.parse
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+
+from src.core.single_flight import Cancelled, CancelToken
+
+_LOCK = threading.RLock()
+_CLIENTS: Dict[str, "NodeClient"] = {}
+
+# Keys per JSON-RPC batch request
+BATCH_SIZE = 100
+
+# Statuses meaning the node (or a proxy in front of it) does not take JSON-RPC batches
+_NO_BATCH_STATUSES = (400, 404, 405, 415, 501)
+
+# Token of the job the current requests belong to (see cancel_scope)
+_CANCEL: "contextvars.ContextVar[Optional[CancelToken]]" = contextvars.ContextVar("node_cancel", default=None)
+
+# Errors after which a reused keep-alive connection is retried once on a fresh one
+_STALE_ERRORS = (http.client.RemoteDisconnected, http.client.CannotSendRequest,
+                 http.client.BadStatusLine, ConnectionResetError, ConnectionAbortedError,
+                 BrokenPipeError)
+
+
+class NodeHTTPError(ConnectionError):
+    """The node answered with a non-200 HTTP status."""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class BatchNotSupported(Exception):
+    """The node rejected JSON-RPC batch requests."""
+
+
+class NodeClient:
+    """
+    CometBFT RPC client for one node. Idle HTTP(S) connections are kept in a
+    pool and reused, so requests after the first skip the TCP (and TLS)
+    handshake. Thread-safe; each request holds its own connection.
+    """
+
+    def __init__(self, node_url: str, timeout: float = 10.0, max_connections: int = 4):
+        self.node_url = node_url.rstrip("/")
+        parts = urllib.parse.urlsplit(self.node_url)
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            raise ValueError(f"Invalid node URL: {node_url}")
+        self._https = parts.scheme == "https"
+        self._host = parts.hostname
+        self._port = parts.port
+        self._base = parts.path.rstrip("/")
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self._idle: "queue.LifoQueue[http.client.HTTPConnection]" = queue.LifoQueue()
+        self._closed = False
+        # Learned on the first batch request: None (unknown), True or False
+        self.supports_batch: Optional[bool] = None
+        self.stats = {"requests": 0, "connections": 0}
+
+    # ---- Connections ----
+    def _connect(self) -> http.client.HTTPConnection:
+        self.stats["connections"] += 1
+        if self._https:
+            return http.client.HTTPSConnection(self._host, self._port, timeout=self.timeout)
+        return http.client.HTTPConnection(self._host, self._port, timeout=self.timeout)
+
+    def _acquire(self):
+        try:
+            return self._idle.get_nowait(), True
+        except queue.Empty:
+            return self._connect(), False
+
+    def _release(self, conn: http.client.HTTPConnection) -> None:
+        if self._closed or self._idle.qsize() >= self.max_connections:
+            conn.close()
+        else:
+            self._idle.put(conn)
+
+    def close(self) -> None:
+        """Close all idle connections; requests in flight close theirs when done."""
+        self._closed = True
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+
+    # ---- Requests ----
+    def get(self, endpoint: str, params: Optional[Dict[str, str]] = None, timeout: Optional[float] = None) -> Any:
+        """GET an RPC endpoint (e.g. "/status") and return the decoded JSON."""
+        url = self._base + endpoint
+        if params:
+            url += "?" + urllib.parse.urlencode(params, safe='/:"')
+        return self._request("GET", url, None, timeout)
+
+    def post(self, payload: Any, timeout: Optional[float] = None) -> Any:
+        """POST a JSON-RPC request (or batch) and return the decoded JSON."""
+        body = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        return self._request("POST", self._base + "/", body, timeout)
+
+    def _request(self, method: str, url: str, body: Optional[bytes], timeout: Optional[float]) -> Any:
+        timeout = self.timeout if timeout is None else timeout
+        headers = {"Connection": "keep-alive", "Accept": "application/json"}
+        if body is not None:
+            headers["Content-Type"] = "application/json"
+        token = _CANCEL.get()
+        if token is not None:
+            token.check()
+        self.stats["requests"] += 1
+        conn, reused = self._acquire()
+        while True:
+            # Cancelling the job shuts the connection down, failing the request at once
+            handle = token.add_callback(lambda conn=conn: _abort(conn)) if token is not None else 0
+            try:
+                conn.timeout = timeout
+                if conn.sock is None:
+                    # Connect first: a cancel that came before the socket existed aborted nothing
+                    conn.connect()
+                    if token is not None:
+                        token.check()
+                conn.sock.settimeout(timeout)
+                conn.request(method, url, body=body, headers=headers)
+                resp = conn.getresponse()
+                body = resp.read()
+                break
+            except Exception as e:
+                conn.close()
+                if token is not None and token.cancelled:
+                    raise Cancelled() from e
+                if not reused or not isinstance(e, _STALE_ERRORS):
+                    raise
+                # The node dropped an idle connection; retry once on a new one
+                conn, reused = self._connect(), False
+            finally:
+                if token is not None:
+                    token.remove_callback(handle)
+        if token is not None and token.cancelled:
+            # Raced with cancel(): the connection may be shut down
+            conn.close()
+            raise Cancelled()
+        if resp.will_close:
+            conn.close()
+        else:
+            self._release(conn)
+        if resp.status != 200:
+            raise NodeHTTPError(resp.status, f"{method} {self.node_url}{url}: HTTP {resp.status}")
+        return json.loads(body.decode("utf-8"))
+
+    def status(self, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """{'height': int | None, 'latency_ms': float} from /status."""
+        t0 = time.perf_counter()
+        data = self.get("/status", timeout=timeout)
+        info = data.get("result", data).get("sync_info", {})
+        height = info.get("latest_block_height")
+        return {
+            "height": int(height) if height is not None else None,
+            "latency_ms": (time.perf_counter() - t0) * 1000,
+        }
+
+    def abci_query(self, path: str) -> Optional[str]:
+        """Raw base64 value of an ABCI query, or None when the key is unset."""
+        data = self.get("/abci_query", {"path": f'"{path}"'})
+        value = data["result"]["response"].get("value")
+        return None if not value or value == "AA==" else value
+
+    def abci_query_batch(self, paths: List[str]) -> List[Any]:
+        """
+        Several ABCI queries in one JSON-RPC batch request. Returns one entry
+        per path: the raw base64 value, None when unset, or an Exception for
+        a query the node answered with an error. Raises BatchNotSupported if
+        the node does not accept batches.
+        """
+        if self.supports_batch is False:
+            raise BatchNotSupported(self.node_url)
+        payload = [{"jsonrpc": "2.0", "id": i, "method": "abci_query", "params": {"path": p}}
+                   for i, p in enumerate(paths)]
+        try:
+            data = self.post(payload)
+        except (NodeHTTPError, ValueError) as e:
+            # A status rejecting the request itself or a non-JSON answer:
+            # batching is not available. Network failures and other statuses
+            # (e.g. 429 rate limiting, 408, 5xx) propagate unchanged.
+            if isinstance(e, NodeHTTPError) and e.status not in _NO_BATCH_STATUSES:
+                raise
+            self.supports_batch = False
+            raise BatchNotSupported(self.node_url) from e
+        if not isinstance(data, list):
+            self.supports_batch = False
+            raise BatchNotSupported(self.node_url)
+        self.supports_batch = True
+        by_id = {item.get("id"): item for item in data if isinstance(item, dict)}
+        out: List[Any] = []
+        for i, path in enumerate(paths):
+            item = by_id.get(i)
+            try:
+                value = item["result"]["response"].get("value")
+                out.append(None if not value or value == "AA==" else value)
+            except Exception:
+                error = (item or {}).get("error", "missing from batch response")
+                out.append(LookupError(f"{path}: {error}"))
+        return out
+
+    def get_state(self, contract: str, variable: str, *keys: str) -> Any:
+        """Decoded value of contract.variable[:keys], or None when unset."""
+        return decode_value(self.abci_query(state_path(contract, variable, *keys)))
+
+    def get_balance(self, address: str, contract: str = "currency") -> Any:
+        """Token balance of an address (0 when it never held the token)."""
+        value = self.get_state(contract, "balances", address)
+        return 0 if value is None else value
+
+    def get_balances(self, address: str, contracts: List[str]) -> Dict[str, Any]:
+        """
+        Balances of an address for many contracts, BATCH_SIZE keys per
+        request. Contracts whose query failed are missing from the result;
+        raises BatchNotSupported if the node does not accept batches.
+        """
+        balances: Dict[str, Any] = {}
+        for start in range(0, len(contracts), BATCH_SIZE):
+            chunk = contracts[start:start + BATCH_SIZE]
+            raws = self.abci_query_batch([state_path(c, "balances", address) for c in chunk])
+            for contract, raw in zip(chunk, raws):
+                if isinstance(raw, Exception):
+                    continue
+                try:
+                    value = decode_value(raw)
+                except Exception:
+                    continue
+                balances[contract] = 0 if value is None else value
+        return balances
+
+
+def _abort(conn: http.client.HTTPConnection) -> None:
+    sock = conn.sock
+    if sock is not None:
+        try:
+            sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+
+
+@contextlib.contextmanager
+def cancel_scope(token: Optional[CancelToken]) -> Iterator[None]:
+    """
+    Requests made inside the block (also from threads started with a copy
+    of its context) belong to `token`: once it is cancelled they raise
+    Cancelled, and requests in flight are aborted by shutting their
+    connection down. Aborted connections are not returned to the pool.
+    """
+    reset = _CANCEL.set(token)
+    try:
+        yield
+    finally:
+        _CANCEL.reset(reset)
+
+
+def cancelled() -> bool:
+    """Whether the enclosing cancel_scope has been cancelled."""
+    token = _CANCEL.get()
+    return token is not None and token.cancelled
+
+
+def state_path(contract: str, variable: str, *keys: str) -> str:
+    """ABCI query path of a contract variable, e.g. /get/currency.balances:<address>."""
+    path = f"/get/{contract}.{variable}"
+    if keys:
+        path += ":" + ":".join(keys)
+    return path
+
+
+def decode_value(raw: Optional[str]) -> Any:
+    """Decode a base64 state value as returned by abci_query."""
+    if raw is None:
+        return None
+    text = base64.b64decode(raw).decode("utf-8")
+    try:
+        value = json.loads(text)
+    except ValueError:
+        return text
+    if isinstance(value, dict) and "__fixed__" in value:
+        # Contract decimals are stored as {"__fixed__": "1.5"}
+        return float(value["__fixed__"])
+    return value
+
+
+def get_client(node_url: str, timeout: Optional[float] = None, max_connections: Optional[int] = None) -> NodeClient:
+    """
+    The shared client for a node, created on first use. Passing limits
+    updates them on an existing client.
+    """
+    key = node_url.rstrip("/")
+    with _LOCK:
+        client = _CLIENTS.get(key)
+        if client is None:
+            client = _CLIENTS[key] = NodeClient(key)
+        if timeout is not None:
+            client.timeout = timeout
+        if max_connections is not None:
+            client.max_connections = max_connections
+        return client
+
+
+def switch_node(node_url: Union[str, Iterable[str], None]) -> None:
+    """
+    Drop the clients of every node except `node_url` (a URL or the list of
+    nodes still in use), e.g. after the user changed the node.
+    """
+    urls = [node_url] if isinstance(node_url, str) else list(node_url or ())
+    keep = {u.rstrip("/") for u in urls if u}
+    with _LOCK:
+        for key in [k for k in _CLIENTS if k not in keep]:
+            _CLIENTS.pop(key).close()
+
+
+def close_all() -> None:
+    switch_node(None)
+
+
+__all__ = [
+    "BATCH_SIZE",
+    "BatchNotSupported",
+    "Cancelled",
+    "cancel_scope",
+    "cancelled",
+    "NodeHTTPError",
+    "NodeClient",
+    "state_path",
+    "decode_value",
+    "get_client",
+    "switch_node",
+    "close_all",
+]
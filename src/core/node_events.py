@@ -0,0 +1,314 @@
+# Push updates from a node: CometBFT /websocket event subscriptions over a
+# minimal stdlib WebSocket client (RFC 6455, text frames only)
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+import os
+import random
+import re
+import socket
+import struct
+import threading
+import time
+import urllib.parse
+from typing import Any, Callable, Optional, Set, Tuple
+
+WS_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+OP_CONT, OP_TEXT, OP_BINARY, OP_CLOSE, OP_PING, OP_PONG = 0x0, 0x1, 0x2, 0x8, 0x9, 0xA
+# Events for every committed transaction; the address is filtered client-side.
+# Not narrowed to e.g. Transfer.to/from queries: balances also change without
+# a Transfer event (stamp fees, mints, contracts writing balances directly),
+# and affected_contracts() sees those in the tx's state changes.
+TX_QUERY = "tm.event='Tx'"
+
+
+def encode_frame(opcode: int, payload: bytes, mask: bool = True) -> bytes:
+    """One final frame. Clients must mask, servers must not."""
+    head = bytes([0x80 | opcode])
+    n = len(payload)
+    mask_bit = 0x80 if mask else 0
+    if n < 126:
+        head += bytes([mask_bit | n])
+    elif n < 1 << 16:
+        head += bytes([mask_bit | 126]) + struct.pack("!H", n)
+    else:
+        head += bytes([mask_bit | 127]) + struct.pack("!Q", n)
+    if not mask:
+        return head + payload
+    key = os.urandom(4)
+    return head + key + bytes(b ^ key[i % 4] for i, b in enumerate(payload))
+
+
+def parse_frame(buf: bytearray) -> Optional[Tuple[bool, int, bytes, int]]:
+    """(fin, opcode, payload, frame_size) of the first complete frame in buf, else None."""
+    if len(buf) < 2:
+        return None
+    fin, opcode = bool(buf[0] & 0x80), buf[0] & 0x0F
+    masked, n = bool(buf[1] & 0x80), buf[1] & 0x7F
+    pos = 2
+    if n == 126:
+        if len(buf) < 4:
+            return None
+        n, pos = struct.unpack("!H", bytes(buf[2:4]))[0], 4
+    elif n == 127:
+        if len(buf) < 10:
+            return None
+        n, pos = struct.unpack("!Q", bytes(buf[2:10]))[0], 10
+    key = b""
+    if masked:
+        if len(buf) < pos + 4:
+            return None
+        key, pos = bytes(buf[pos:pos + 4]), pos + 4
+    if len(buf) < pos + n:
+        return None
+    payload = bytes(buf[pos:pos + n])
+    if masked:
+        payload = bytes(b ^ key[i % 4] for i, b in enumerate(payload))
+    return fin, opcode, payload, pos + n
+
+
+def accept_key(key: str) -> str:
+    return base64.b64encode(hashlib.sha1((key + WS_GUID).encode("ascii")).digest()).decode("ascii")
+
+
+def websocket_url(node_url: str) -> str:
+    """ws(s)://host:port/websocket for an http(s) RPC URL."""
+    parts = urllib.parse.urlsplit(node_url.rstrip("/"))
+    scheme = "wss" if parts.scheme == "https" else "ws"
+    return urllib.parse.urlunsplit((scheme, parts.netloc, parts.path + "/websocket", "", ""))
+
+
+class WebSocket:
+    """Blocking WebSocket client connection exchanging JSON text messages."""
+
+    def __init__(self, url: str, timeout: float = 10.0):
+        parts = urllib.parse.urlsplit(url)
+        secure = parts.scheme == "wss"
+        port = parts.port or (443 if secure else 80)
+        sock = socket.create_connection((parts.hostname, port), timeout=timeout)
+        if secure:
+            import ssl
+
+            sock = ssl.create_default_context().wrap_socket(sock, server_hostname=parts.hostname)
+        self.sock = sock
+        self._buf = bytearray()
+        self._fragments: list = []
+        # When anything (data or control frame) was last received
+        self.last_rx = time.monotonic()
+        key = base64.b64encode(os.urandom(16)).decode("ascii")
+        host = parts.netloc.rsplit("@", 1)[-1]
+        request = (
+            f"GET {parts.path or '/'} HTTP/1.1\r\nHost: {host}\r\nUpgrade: websocket\r\n"
+            f"Connection: Upgrade\r\nSec-WebSocket-Key: {key}\r\nSec-WebSocket-Version: 13\r\n\r\n"
+        )
+        try:
+            sock.sendall(request.encode("ascii"))
+            while b"\r\n\r\n" not in self._buf:
+                data = sock.recv(4096)
+                if not data:
+                    raise ConnectionError("connection closed during handshake")
+                self._buf += data
+            head, _, rest = bytes(self._buf).partition(b"\r\n\r\n")
+            self._buf = bytearray(rest)
+            lines = head.decode("latin-1").split("\r\n")
+            if " 101 " not in lines[0] + " ":
+                raise ConnectionError(f"handshake refused: {lines[0]}")
+            headers = {k.strip().lower(): v.strip() for k, _, v in (line.partition(":") for line in lines[1:])}
+            if headers.get("sec-websocket-accept") != accept_key(key):
+                raise ConnectionError("handshake failed: bad Sec-WebSocket-Accept")
+        except Exception:
+            sock.close()
+            raise
+
+    def send_json(self, message: Any) -> None:
+        self.sock.sendall(encode_frame(OP_TEXT, json.dumps(message).encode("utf-8")))
+
+    def ping(self) -> None:
+        self.sock.sendall(encode_frame(OP_PING, b""))
+
+    def recv_json(self, timeout: Optional[float]) -> Optional[Any]:
+        """
+        The next JSON message, or None when no data arrived within `timeout`.
+        Control frames are handled here. Raises ConnectionError once closed.
+        """
+        self.sock.settimeout(timeout)
+        while True:
+            frame = parse_frame(self._buf)
+            if frame is None:
+                try:
+                    data = self.sock.recv(65536)
+                except socket.timeout:
+                    return None
+                if not data:
+                    raise ConnectionError("connection closed")
+                self._buf += data
+                self.last_rx = time.monotonic()
+                continue
+            fin, opcode, payload, size = frame
+            del self._buf[:size]
+            if opcode == OP_PING:
+                self.sock.sendall(encode_frame(OP_PONG, payload))
+                continue
+            if opcode == OP_PONG:
+                continue
+            if opcode == OP_CLOSE:
+                raise ConnectionError("closed by server")
+            self._fragments.append(payload)
+            if not fin:
+                continue
+            message, self._fragments = b"".join(self._fragments), []
+            return json.loads(message.decode("utf-8"))
+
+    def close(self) -> None:
+        try:
+            self.sock.sendall(encode_frame(OP_CLOSE, b""))
+        except Exception:
+            pass
+        try:
+            self.sock.close()
+        except Exception:
+            pass
+
+
+def _decoded_strings(value: Any):
+    # Every string in an event, plus base64 payloads decoded (tx results are
+    # nested JSON inside base64 inside JSON)
+    if isinstance(value, dict):
+        for v in value.values():
+            yield from _decoded_strings(v)
+    elif isinstance(value, list):
+        for v in value:
+            yield from _decoded_strings(v)
+    elif isinstance(value, str):
+        yield value
+        if len(value) >= 8 and len(value) % 4 == 0:
+            try:
+                text = base64.b64decode(value, validate=True).decode("utf-8")
+            except Exception:
+                return
+            yield text
+            try:
+                yield from _decoded_strings(json.loads(text))
+            except ValueError:
+                pass
+
+
+def affected_contracts(event: Any, address: str) -> Optional[Set[str]]:
+    """
+    Contracts whose balance for `address` a Tx event touches. An empty set
+    means the event does not involve the address; None means it does but
+    the contracts could not be told (refresh them all).
+    """
+    pattern = re.compile(r"([A-Za-z0-9_]+)\.balances:" + re.escape(address))
+    contracts: Set[str] = set()
+    mentioned = False
+    for text in _decoded_strings(event):
+        if address in text:
+            mentioned = True
+            contracts.update(pattern.findall(text))
+    if not mentioned:
+        return set()
+    return contracts or None
+
+
+class BalanceSubscription:
+    """
+    Keeps a subscription to a node's Tx events on a daemon thread and calls
+    on_change(contracts) for every transaction involving `address` (contracts
+    as in affected_contracts). on_state("live" | "polling") reports whether
+    the subscription is up; while it is down the caller should poll.
+    Reconnects with exponential backoff. Callbacks run on the worker thread.
+    """
+
+    PING_INTERVAL = 20.0
+    BACKOFF_MIN = 1.0
+    BACKOFF_MAX = 60.0
+
+    def __init__(self, node_url: str, address: str,
+                 on_change: Callable[[Optional[Set[str]]], None],
+                 on_state: Callable[[str], None] = lambda state: None,
+                 query: str = TX_QUERY):
+        self.url = websocket_url(node_url)
+        self.address = address
+        self.on_change = on_change
+        self.on_state = on_state
+        self.query = query
+        self.state = "polling"
+        self._confirmed = False
+        self._stop = threading.Event()
+        self._ws: Optional[WebSocket] = None
+        self._thread = threading.Thread(target=self._run, daemon=True, name="node-events")
+
+    def start(self) -> "BalanceSubscription":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        ws = self._ws
+        if ws is not None:
+            ws.close()
+
+    def _set_state(self, state: str) -> None:
+        if state != self.state:
+            self.state = state
+            self.on_state(state)
+
+    def _run(self) -> None:
+        backoff = self.BACKOFF_MIN
+        while not self._stop.is_set():
+            self._confirmed = False
+            try:
+                self._ws = WebSocket(self.url)
+                self._ws.send_json({"jsonrpc": "2.0", "id": 1, "method": "subscribe",
+                                    "params": {"query": self.query}})
+                self._listen(self._ws)
+            except Exception:
+                pass
+            finally:
+                if self._ws is not None:
+                    self._ws.close()
+                    self._ws = None
+            if self._stop.is_set():
+                break
+            self._set_state("polling")
+            if self._confirmed:
+                backoff = self.BACKOFF_MIN  # was up; start over
+            # Jittered exponential backoff before reconnecting
+            self._stop.wait(backoff * random.uniform(0.8, 1.2))
+            backoff = min(backoff * 2, self.BACKOFF_MAX)
+
+    def _listen(self, ws: WebSocket) -> None:
+        while not self._stop.is_set():
+            message = ws.recv_json(timeout=self.PING_INTERVAL)
+            if message is None:
+                if time.monotonic() - ws.last_rx > 3 * self.PING_INTERVAL:
+                    raise ConnectionError("node stopped responding")
+                ws.ping()
+                continue
+            if message.get("error"):
+                raise ConnectionError(f"subscribe failed: {message['error']}")
+            result = message.get("result") or {}
+            if message.get("id") == 1 and not result.get("data"):
+                # Subscription confirmed
+                self._confirmed = True
+                self._set_state("live")
+                continue
+            contracts = affected_contracts(result, self.address)
+            if contracts is None or contracts:
+                self.on_change(contracts)
+
+
+__all__ = [
+    "TX_QUERY",
+    "WebSocket",
+    "encode_frame",
+    "parse_frame",
+    "accept_key",
+    "websocket_url",
+    "affected_contracts",
+    "BalanceSubscription",
+]
@@ -0,0 +1,274 @@
+# Failover across an ordered list of equivalent nodes: health and latency
+# probes, a circuit breaker per node and routing of reads to the best one
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+
+class CircuitBreaker:
+    """
+    Stops traffic to a node after FAILURE_THRESHOLD consecutive failures
+    ("open"). Once the cooldown has passed one trial request is let through
+    ("half_open"): success closes the breaker, failure opens it again with
+    twice the cooldown (up to MAX_COOLDOWN_S).
+    """
+
+    FAILURE_THRESHOLD = 3
+    COOLDOWN_S = 15.0
+    MAX_COOLDOWN_S = 300.0
+
+    def __init__(self):
+        self.state = "closed"
+        self.failures = 0
+        self.cooldown_s = self.COOLDOWN_S
+        self.opened_at = 0.0
+        self._trial = False
+
+    def allow(self) -> bool:
+        """Whether a request may go to the node now (may start the half-open trial)."""
+        if self.state == "closed":
+            return True
+        if self.state == "open" and time.monotonic() - self.opened_at >= self.cooldown_s:
+            self.state = "half_open"
+            self._trial = False
+        if self.state == "half_open" and not self._trial:
+            self._trial = True
+            return True
+        return False
+
+    def available(self) -> bool:
+        """Like allow(), without claiming the half-open trial."""
+        if self.state == "open":
+            return time.monotonic() - self.opened_at >= self.cooldown_s
+        return self.state == "closed" or not self._trial
+
+    def record_success(self) -> None:
+        self.state = "closed"
+        self.failures = 0
+        self.cooldown_s = self.COOLDOWN_S
+        self._trial = False
+
+    def release(self) -> None:
+        """End a request without an outcome (e.g. cancelled): the half-open trial is free again."""
+        if self.state == "half_open":
+            self._trial = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self.state == "half_open":
+            self.cooldown_s = min(self.cooldown_s * 2, self.MAX_COOLDOWN_S)
+            self._open()
+        elif self.state == "closed" and self.failures >= self.FAILURE_THRESHOLD:
+            self._open()
+
+    def _open(self) -> None:
+        self.state = "open"
+        self.opened_at = time.monotonic()
+        self._trial = False
+
+
+class NodeHealth:
+    """What is known about one node: breaker, smoothed RTT and block height."""
+
+    # Weight of a new RTT sample in the moving average
+    LATENCY_ALPHA = 0.3
+
+    def __init__(self, url: str):
+        self.url = url
+        self.breaker = CircuitBreaker()
+        self.latency_ms: Optional[float] = None
+        self.height: Optional[int] = None
+        self.last_probe: Optional[float] = None
+        self.last_error: Optional[str] = None
+
+    def observe(self, latency_ms: Optional[float] = None, height: Optional[int] = None) -> None:
+        if latency_ms is not None:
+            if self.latency_ms is None:
+                self.latency_ms = latency_ms
+            else:
+                self.latency_ms += self.LATENCY_ALPHA * (latency_ms - self.latency_ms)
+        if height is not None:
+            self.height = height
+
+
+class NodePool:
+    """
+    Ordered list of node URLs serving the same chain (the first one is the
+    user's primary). Nodes are probed every PROBE_INTERVAL_S on a daemon
+    thread (RTT and block height via /status); reads go to the fastest node
+    whose breaker is closed and that is at most MAX_LAG blocks behind the
+    highest known height. Nodes within LATENCY_SLACK of the fastest count as
+    equally fast and keep their list order, so routing does not flap.
+    Thread-safe.
+    """
+
+    PROBE_INTERVAL_S = 30.0
+    PROBE_TIMEOUT_S = 3.0
+    MAX_LAG = 2
+    LATENCY_SLACK = 0.25
+
+    def __init__(self, urls: Iterable[str] = ()):
+        self._lock = threading.RLock()
+        self._nodes: Dict[str, NodeHealth] = {}
+        self._order: List[str] = []
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.set_urls(urls)
+
+    # ---- Nodes ----
+    @property
+    def urls(self) -> List[str]:
+        with self._lock:
+            return list(self._order)
+
+    def set_urls(self, urls: Iterable[str]) -> None:
+        """Replace the node list; nodes kept from the old list keep their health."""
+        order = list(dict.fromkeys(u.strip().rstrip("/") for u in urls if u and u.strip()))
+        with self._lock:
+            changed = order != self._order
+            self._nodes = {u: self._nodes.get(u) or NodeHealth(u) for u in order}
+            self._order = order
+        if changed:
+            self._wake.set()  # probe the new list right away
+
+    def health(self, url: str) -> Optional[NodeHealth]:
+        with self._lock:
+            return self._nodes.get(url.rstrip("/"))
+
+    # ---- Routing ----
+    def ranked(self) -> List[str]:
+        """Nodes to try for a read, best first. Nodes with an open breaker are left out."""
+        with self._lock:
+            nodes = [self._nodes[u] for u in self._order if self._nodes[u].breaker.available()]
+            heights = [h.height for h in self._nodes.values() if h.height is not None]
+        top = max(heights) if heights else None
+
+        def lagging(h: NodeHealth) -> bool:
+            return top is not None and h.height is not None and top - h.height > self.MAX_LAG
+
+        current = [h for h in nodes if not lagging(h)]
+        measured = [h.latency_ms for h in current if h.latency_ms is not None]
+        fastest = min(measured) if measured else None
+
+        def key(h: NodeHealth):
+            if fastest is None or h.latency_ms is None:
+                return 0.0  # not probed yet: list order
+            if h.latency_ms <= fastest * (1 + self.LATENCY_SLACK):
+                return 0.0
+            return h.latency_ms
+
+        # sorted() is stable, so ties keep the user's order
+        return [h.url for h in sorted(current, key=key)] + [h.url for h in nodes if lagging(h)]
+
+    def pick(self) -> Optional[str]:
+        ranked = self.ranked()
+        return ranked[0] if ranked else None
+
+    def acquire(self, url: str) -> bool:
+        """Claim a request slot on a node (False while its breaker is open)."""
+        health = self.health(url)
+        with self._lock:
+            return health is not None and health.breaker.allow()
+
+    def release(self, url: str) -> None:
+        """Give back a slot claimed with acquire() when the request had no outcome (e.g. cancelled)."""
+        health = self.health(url)
+        if health is not None:
+            with self._lock:
+                health.breaker.release()
+
+    def record_success(self, url: str, latency_ms: Optional[float] = None, height: Optional[int] = None) -> None:
+        health = self.health(url)
+        if health is not None:
+            with self._lock:
+                health.breaker.record_success()
+                health.observe(latency_ms, height)
+                health.last_error = None
+
+    def record_failure(self, url: str, error: Any = None) -> None:
+        health = self.health(url)
+        if health is not None:
+            with self._lock:
+                health.breaker.record_failure()
+                health.last_error = str(error) if error is not None else "request failed"
+
+    # ---- Probes ----
+    def probe(self, url: str) -> Dict[str, Any]:
+        """Probe one node now and record the result ({'ok', 'latency_ms', 'height'})."""
+        from src.core.startup import probe_node
+
+        result = probe_node(url, timeout=self.PROBE_TIMEOUT_S)
+        self.record_probe(url, result)
+        return result
+
+    def record_probe(self, url: str, result: Dict[str, Any]) -> None:
+        health = self.health(url)
+        if health is None:
+            return
+        health.last_probe = time.time()
+        if result.get("ok"):
+            self.record_success(url, result.get("latency_ms"), result.get("height"))
+        else:
+            self.record_failure(url, "not responding")
+
+    def probe_all(self) -> None:
+        """Probe every node in parallel; returns once all answered or timed out."""
+        threads = [threading.Thread(target=self.probe, args=(u,), daemon=True, name="node-probe")
+                   for u in self.urls]
+        for t in threads:
+            t.start()
+        deadline = time.monotonic() + self.PROBE_TIMEOUT_S + 1.0
+        for t in threads:
+            t.join(max(0.0, deadline - time.monotonic()))
+
+    def start(self) -> "NodePool":
+        """Probe periodically on a daemon thread until stop()."""
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, daemon=True, name="node-pool")
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._wake.set()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self._wake.clear()
+            if self.urls:
+                self.probe_all()
+            self._wake.wait(self.PROBE_INTERVAL_S)
+
+    def describe(self) -> List[str]:
+        """One line per node for the settings panel."""
+        top = self.pick()
+        lines = []
+        with self._lock:
+            nodes = [self._nodes[u] for u in self._order]
+        for h in nodes:
+            parts = []
+            if h.latency_ms is not None:
+                parts.append(f"{h.latency_ms:.0f} ms")
+            if h.height is not None:
+                parts.append(f"block {h.height}")
+            if h.breaker.state == "open":
+                parts.append(f"down ({h.breaker.failures} failures)")
+            elif h.last_error:
+                parts.append(h.last_error)
+            elif h.latency_ms is None:
+                parts.append("not probed yet")
+            mark = "▶ " if h.url == top else "   "
+            lines.append(f"{mark}{h.url}: {', '.join(parts)}")
+        return lines
+
+
+__all__ = [
+    "CircuitBreaker",
+    "NodeHealth",
+    "NodePool",
+]
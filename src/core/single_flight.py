@@ -0,0 +1,103 @@
+# Coalescing of overlapping refresh requests: at most one query per key in
+# flight, plus at most one queued follow-up for it; cancellation of
+# superseded ones
+
+from __future__ import annotations
+
+import threading
+from typing import Callable, Dict, Hashable, Iterable, List, Set
+
+
+class Cancelled(Exception):
+    """The job was cancelled (e.g. the wallet or node changed)."""
+
+
+class CancelToken:
+    """
+    Cancellation flag shared by everything one job does. cancel() sets it
+    and runs the registered callbacks (e.g. closing the job's connections so
+    blocked requests fail at once). Thread-safe.
+    """
+
+    def __init__(self):
+        self.cancelled = False
+        self._lock = threading.Lock()
+        self._callbacks: Dict[int, Callable[[], None]] = {}
+        self._next = 0
+
+    def check(self) -> None:
+        if self.cancelled:
+            raise Cancelled()
+
+    def add_callback(self, fn: Callable[[], None]) -> int:
+        """Run fn on cancel (right away if already cancelled). Returns a handle for remove_callback."""
+        with self._lock:
+            if not self.cancelled:
+                self._next += 1
+                self._callbacks[self._next] = fn
+                return self._next
+        fn()
+        return 0
+
+    def remove_callback(self, handle: int) -> None:
+        with self._lock:
+            self._callbacks.pop(handle, None)
+
+    def cancel(self) -> None:
+        with self._lock:
+            if self.cancelled:
+                return
+            self.cancelled = True
+            callbacks, self._callbacks = list(self._callbacks.values()), {}
+        for fn in callbacks:
+            try:
+                fn()
+            except Exception:
+                pass
+
+
+class SingleFlight:
+    """
+    Tracks which keys (e.g. (generation, node, address, contract)) have a
+    query in flight. Requesting a key that is already in flight does not
+    start a duplicate query; the key is queued and handed back once, when
+    the query holding it ends, so a newer request is never lost. However
+    often a key is requested meanwhile, it gets exactly one follow-up.
+    Not thread-safe: use it from one thread (the Tk thread).
+    """
+
+    def __init__(self):
+        self._inflight: Set[Hashable] = set()
+        self._queued: Set[Hashable] = set()
+
+    @property
+    def busy(self) -> bool:
+        return bool(self._inflight)
+
+    def begin(self, keys: Iterable[Hashable]) -> List[Hashable]:
+        """Claim keys for a query. Returns the ones to query now; the rest are queued."""
+        start = []
+        for key in dict.fromkeys(keys):
+            if key in self._inflight:
+                self._queued.add(key)
+            else:
+                self._inflight.add(key)
+                start.append(key)
+        return start
+
+    def end(self, keys: Iterable[Hashable]) -> List[Hashable]:
+        """Release the keys of a finished query. Returns the queued ones to query next."""
+        followup = []
+        for key in dict.fromkeys(keys):
+            self._inflight.discard(key)
+            if key in self._queued:
+                self._queued.discard(key)
+                followup.append(key)
+        return followup
+
+
+__all__ = [
+    "Cancelled",
+    "CancelToken",
+    "SingleFlight",
+]
@@ -0,0 +1,151 @@
+# Startup orchestration: independent startup phases run concurrently on
+# worker threads while the window is already painted
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+
+class StartupTrace:
+    """
+    Wall-clock spans of the startup phases, in ms since the trace was created.
+    Safe to use from worker threads.
+    """
+
+    def __init__(self):
+        self.t0 = time.perf_counter()
+        self._spans: Dict[str, List[Any]] = {}  # name -> [start_ms, end_ms, thread]
+        self._lock = threading.Lock()
+
+    def _now(self) -> float:
+        return (time.perf_counter() - self.t0) * 1000
+
+    def begin(self, name: str) -> None:
+        with self._lock:
+            self._spans.setdefault(name, [self._now(), None, threading.current_thread().name])
+
+    def end(self, name: str) -> None:
+        with self._lock:
+            span = self._spans.get(name)
+            if span is not None and span[1] is None:
+                span[1] = self._now()
+
+    def mark(self, name: str) -> None:
+        """A zero-length phase, e.g. "first_paint"."""
+        self.begin(name)
+        self.end(name)
+
+    def done(self, name: str) -> bool:
+        with self._lock:
+            span = self._spans.get(name)
+            return span is not None and span[1] is not None
+
+    def spans(self) -> List[Tuple[str, float, Optional[float], str]]:
+        with self._lock:
+            return sorted(((n, s[0], s[1], s[2]) for n, s in self._spans.items()), key=lambda r: r[1])
+
+    def report(self) -> str:
+        lines = [f"{'phase':<14} {'start ms':>9} {'end ms':>9} {'took ms':>9}  thread"]
+        for name, start, end, thread in self.spans():
+            took = "" if end is None else f"{end - start:.1f}"
+            end_s = "..." if end is None else f"{end:.1f}"
+            lines.append(f"{name:<14} {start:>9.1f} {end_s:>9} {took:>9}  {thread}")
+        return "\n".join(lines)
+
+
+class StartupPipeline:
+    """
+    Runs named startup tasks on daemon threads. Each task's on_done(result,
+    error) and every when_all() callback are handed to `post`, which must
+    schedule them on the Tk thread (e.g. lambda fn: root.after(0, fn)).
+    A task name runs at most once.
+    """
+
+    def __init__(self, post: Callable[[Callable[[], None]], Any], trace: Optional[StartupTrace] = None):
+        self.post = post
+        self.trace = trace or StartupTrace()
+        self._started: Set[str] = set()
+        self._finished: Set[str] = set()
+        self._waiters: List[Tuple[Set[str], Callable[[], None]]] = []
+
+    def started(self, name: str) -> bool:
+        return name in self._started
+
+    def run(self, name: str, func: Callable[[], Any], on_done: Callable[[Any, Optional[BaseException]], None]) -> bool:
+        """Start `func` on a worker unless a task of that name already ran."""
+        if name in self._started:
+            return False
+        self._started.add(name)
+
+        def worker():
+            self.trace.begin(name)
+            result, error = None, None
+            try:
+                result = func()
+            except Exception as e:
+                error = e
+            finally:
+                self.trace.end(name)
+
+            def deliver():
+                try:
+                    on_done(result, error)
+                finally:
+                    self._finish(name)
+            self.post(deliver)
+
+        threading.Thread(target=worker, daemon=True, name=f"startup-{name}").start()
+        return True
+
+    def skip(self, name: str) -> None:
+        """Mark a task as finished without running it (e.g. nothing to decrypt)."""
+        if name in self._started:
+            return
+        self._started.add(name)
+        self._finish(name)
+
+    def when_all(self, names: Iterable[str], callback: Callable[[], None]) -> None:
+        """Call `callback` (on the Tk thread) once every named task has finished."""
+        waiting = set(names) - self._finished
+        if not waiting:
+            callback()
+        else:
+            self._waiters.append((waiting, callback))
+
+    def _finish(self, name: str) -> None:
+        self._finished.add(name)
+        ready = []
+        for waiting, callback in list(self._waiters):
+            waiting.discard(name)
+            if not waiting:
+                self._waiters.remove((waiting, callback))
+                ready.append(callback)
+        for callback in ready:
+            callback()
+
+
+def probe_node(node_url: str, timeout: float = 3.0) -> Dict[str, Any]:
+    """
+    Warm up the connection to a node and check its health via the RPC
+    /status endpoint. The connection stays in the node's shared client pool
+    for the first balance refresh. Returns {'ok', 'latency_ms', 'height'};
+    never raises.
+    """
+    # Pulls in http/ssl; only needed once a worker probes
+    from src.core import node_client
+
+    t0 = time.perf_counter()
+    try:
+        status = node_client.get_client(node_url).status(timeout=timeout)
+        return {"ok": True, "latency_ms": status["latency_ms"], "height": status["height"]}
+    except Exception:
+        return {"ok": False, "latency_ms": (time.perf_counter() - t0) * 1000, "height": None}
+
+
+__all__ = [
+    "StartupTrace",
+    "StartupPipeline",
+    "probe_node",
+]
@@ -5,11 +5,16 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import List, Optional
 
-try:
-    # Installed via: pip install git+https://github.com/xian-network/xian-py.git
-    from xian_py import wallet as xw
-except Exception as e:  # pragma: no cover
-    raise ImportError("xian-py is required. Install with pip.") from e
+
+def _xw():
+    # xian-py (and its crypto stack) is imported on first use so that loading
+    # WalletInfo, e.g. from secure_store at startup, stays cheap
+    try:
+        # Installed via: pip install git+https://github.com/xian-network/xian-py.git
+        from xian_py import wallet as xw
+    except Exception as e:  # pragma: no cover
+        raise ImportError("xian-py is required. Install with pip.") from e
+    return xw
 
 
 # Default BIP44-like path hardened internally by xian-py HDWallet.get_wallet
@@ -30,7 +35,7 @@ class WalletManager:
 
     # --- HD Wallets ---
     def create_hd_wallet(self) -> WalletInfo:
-        hd = xw.HDWallet()  # generates a 24-word mnemonic
+        hd = _xw().HDWallet()  # generates a 24-word mnemonic
         w = hd.get_wallet(self.derivation_path)
         return WalletInfo(
             private_key=w.private_key,
@@ -39,7 +44,7 @@ class WalletManager:
         )
 
     def import_hd_wallet(self, mnemonic: str) -> WalletInfo:
-        hd = xw.HDWallet(mnemonic)
+        hd = _xw().HDWallet(mnemonic)
         w = hd.get_wallet(self.derivation_path)
         return WalletInfo(
             private_key=w.private_key,
@@ -49,14 +54,14 @@ class WalletManager:
 
     # --- Raw key wallets ---
     def import_private_key(self, private_key_hex: str) -> WalletInfo:
-        if not xw.Wallet.is_valid_key(private_key_hex):
+        if not _xw().Wallet.is_valid_key(private_key_hex):
             raise ValueError("Invalid private key: must be 64-char hex")
-        w = xw.Wallet(private_key_hex)
+        w = _xw().Wallet(private_key_hex)
         return WalletInfo(private_key=w.private_key, public_key=w.public_key)
 
     # --- Utilities ---
     def sign_message(self, private_key_hex: str, message: str) -> str:
-        w = xw.Wallet(private_key_hex)
+        w = _xw().Wallet(private_key_hex)
         return w.sign_msg(message)
 
     def verify_message(self, public_or_private_key_hex: str, message: str, signature_hex: str) -> bool:
@@ -64,7 +69,7 @@ class WalletManager:
         # public key, verification will fail; users should pass the same
         # private used to sign or wrap verification separately with VerifyKey
         try:
-            w = xw.Wallet(public_or_private_key_hex)
+            w = _xw().Wallet(public_or_private_key_hex)
         except Exception:
             # When a public key is passed, construct VerifyKey path using wallet module
             try:
@@ -3,8 +3,12 @@
 
 from . import secure_store
 from . import config_store
+from . import image_cache
+from . import balance_cache
 
 __all__ = [
     'secure_store',
     'config_store',
+    'image_cache',
+    'balance_cache',
 ]
@@ -0,0 +1,124 @@
+# Last known balances per (node_url, address, contract), persisted so a
+# restart can show them immediately while fresh values are fetched
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, Mapping, Optional
+
+from src.storage.config_store import get_app_data_dir
+
+CACHE_FILE = "balance_cache.json"
+MAX_ENTRIES = 2000
+_LOCK = threading.RLock()
+
+
+def get_cache_path() -> str:
+    return os.path.join(get_app_data_dir(), CACHE_FILE)
+
+
+def _key(*parts: str) -> str:
+    return "|".join(parts)
+
+
+def _read() -> Dict[str, Any]:
+    try:
+        with open(get_cache_path(), "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if isinstance(data, dict) and isinstance(data.get("entries"), dict) and isinstance(data.get("totals"), dict):
+            return data
+    except Exception:
+        pass
+    return {"version": 1, "entries": {}, "totals": {}}
+
+
+def _write(data: Dict[str, Any]) -> None:
+    path = get_cache_path()
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f, separators=(",", ":"))
+    os.replace(tmp, path)
+
+
+def _to_number(value: Any) -> Optional[float]:
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return value
+    try:
+        return float(value)
+    except Exception:
+        return None
+
+
+def load_snapshot(node_url: str, address: str) -> Dict[str, Any]:
+    """
+    Cached state for a wallet on a node:
+    {'balances': {contract: value}, 'heights': {contract: height},
+     'total': float | None, 'height': int | None, 'updated_at': float | None}
+    """
+    prefix = _key(node_url, address, "")
+    with _LOCK:
+        data = _read()
+    balances: Dict[str, Any] = {}
+    heights: Dict[str, Optional[int]] = {}
+    for key, entry in data["entries"].items():
+        if key.startswith(prefix) and isinstance(entry, dict):
+            contract = key[len(prefix):]
+            balances[contract] = _to_number(entry.get("balance"))
+            heights[contract] = entry.get("height")
+    total = data["totals"].get(_key(node_url, address)) or {}
+    return {
+        "balances": balances,
+        "heights": heights,
+        "total": _to_number(total.get("total")),
+        "height": total.get("height"),
+        "updated_at": total.get("updated_at"),
+    }
+
+
+def save_snapshot(node_url: str, address: str, balances: Mapping[str, Any],
+                  total: Optional[float] = None, height: Optional[int] = None) -> None:
+    """
+    Store freshly fetched balances (contract -> value). Contracts not in
+    `balances`, and the total if `total` is None, keep their previous entry.
+    Oldest entries are dropped beyond MAX_ENTRIES.
+    """
+    now = time.time()
+    with _LOCK:
+        data = _read()
+        entries = data["entries"]
+        for contract, value in balances.items():
+            key = _key(node_url, address, contract)
+            entries.pop(key, None)  # re-insert so dict order tracks recency
+            entries[key] = {"balance": _to_number(value), "height": height, "updated_at": now}
+        for key in list(entries)[:max(0, len(entries) - MAX_ENTRIES)]:
+            del entries[key]
+        if total is not None:
+            # Refreshes that did not read the total keep the last known one
+            data["totals"][_key(node_url, address)] = {"total": _to_number(total), "height": height,
+                                                       "updated_at": now}
+        try:
+            _write(data)
+        except Exception:
+            pass  # cache only
+
+
+def clear() -> None:
+    """Forget all cached balances (e.g. when the wallet is removed)."""
+    with _LOCK:
+        try:
+            os.remove(get_cache_path())
+        except OSError:
+            pass
+
+
+__all__ = [
+    "get_cache_path",
+    "load_snapshot",
+    "save_snapshot",
+    "clear",
+]
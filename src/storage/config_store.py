@@ -10,6 +10,12 @@ from typing import Any, Dict, List, Optional, TypedDict, NotRequired
 APP_DIR_NAME = "XianWallet"
 CONFIG_FILE = "config.json"
 _LOCK = threading.RLock()
+# Request limits used for nodes without their own entry in "node_limits"
+DEFAULT_MAX_CONCURRENCY = 4
+DEFAULT_REQUEST_TIMEOUT = 10.0
+DEFAULT_REFRESH_INTERVAL = 30
+# Longest node failover list kept in "nodes"
+MAX_NODES = 8
 
 
 class TokenConfig(TypedDict):
@@ -20,9 +26,20 @@ class TokenConfig(TypedDict):
     pinned: NotRequired[bool]
 
 
-def _app_data_dir() -> str:
+class NodeLimits(TypedDict):
+    max_concurrency: int  # parallel requests to the node
+    timeout: float  # seconds per request
+
+
+class RefreshSettings(TypedDict):
+    enabled: bool  # automatic background refresh
+    interval: int  # seconds between refreshes
+    pause_in_tray: bool  # pause (instead of slowing down) while in the tray
+
+
+def get_app_data_dir() -> str:
     """
-    Cross-platform application data directory for storing the config file.
+    Cross-platform application data directory for the config file and caches.
     Windows: %APPDATA%/XianWallet (fallback to ~ if APPDATA missing)
     Linux/macOS: ~/.local/share/XianWallet
     """
@@ -37,7 +54,7 @@ def _app_data_dir() -> str:
 
 def get_config_path() -> str:
     """Absolute path to the JSON configuration file."""
-    return os.path.join(_app_data_dir(), CONFIG_FILE)
+    return os.path.join(get_app_data_dir(), CONFIG_FILE)
 
 
 def _default_tokens() -> List[TokenConfig]:
@@ -66,6 +83,7 @@ def _default_config() -> Dict[str, Any]:
         "version": 1,
         "tokens": _default_tokens(),
         "ui": {},  # reserved for future UI settings (theme, layout, etc.)
+        "refresh": _normalize_refresh(None),
     }
 
 
@@ -128,6 +146,47 @@ def _normalize_token(t: Any) -> Optional[TokenConfig]:
         return None
 
 
+def _normalize_limits(raw: Any) -> Optional[NodeLimits]:
+    """Validate a node_limits entry; values are clamped to sane ranges."""
+    try:
+        concurrency = int(raw.get("max_concurrency", DEFAULT_MAX_CONCURRENCY))
+        timeout = float(raw.get("timeout", DEFAULT_REQUEST_TIMEOUT))
+    except Exception:
+        return None
+    return {"max_concurrency": min(max(concurrency, 1), 16), "timeout": min(max(timeout, 0.5), 120.0)}
+
+
+def _normalize_node_limits(raw: Any) -> Dict[str, NodeLimits]:
+    if not isinstance(raw, dict):
+        return {}
+    out: Dict[str, NodeLimits] = {}
+    for url, entry in raw.items():
+        limits = _normalize_limits(entry) if isinstance(entry, dict) else None
+        if isinstance(url, str) and url.strip() and limits:
+            out[url.strip().rstrip("/")] = limits
+    return out
+
+
+def _normalize_nodes(raw: Any) -> List[str]:
+    if not isinstance(raw, list):
+        return []
+    urls = [u.strip().rstrip("/") for u in raw if isinstance(u, str) and u.strip()]
+    return list(dict.fromkeys(urls))[:MAX_NODES]
+
+
+def _normalize_refresh(raw: Any) -> RefreshSettings:
+    raw = raw if isinstance(raw, dict) else {}
+    try:
+        interval = int(raw.get("interval", DEFAULT_REFRESH_INTERVAL))
+    except Exception:
+        interval = DEFAULT_REFRESH_INTERVAL
+    return {
+        "enabled": bool(raw.get("enabled", True)),
+        "interval": min(max(interval, 5), 3600),
+        "pause_in_tray": bool(raw.get("pause_in_tray", False)),
+    }
+
+
 def _ensure_unique_contracts(tokens: List[TokenConfig]) -> List[TokenConfig]:
     """
     Keep first occurrence for each unique contract.
@@ -188,6 +247,11 @@ def load_config() -> Dict[str, Any]:
             data["tokens"] = []
         if "ui" not in data or not isinstance(data.get("ui"), dict):
             data["ui"] = {}
+        if not isinstance(data.get("node_url", ""), str):
+            data.pop("node_url", None)
+        data["nodes"] = _normalize_nodes(data.get("nodes"))
+        data["node_limits"] = _normalize_node_limits(data.get("node_limits"))
+        data["refresh"] = _normalize_refresh(data.get("refresh"))
 
         # Clean invalid tokens and merge defaults
         data["tokens"] = [t for t in map(_normalize_token, data["tokens"]) if t]
@@ -205,6 +269,17 @@ def save_config(cfg: Dict[str, Any]) -> None:
             "version": int(cfg.get("version", 1)),
             "ui": cfg.get("ui", {}) if isinstance(cfg.get("ui"), dict) else {},
         }
+        node_url = cfg.get("node_url")
+        if isinstance(node_url, str) and node_url.strip():
+            norm["node_url"] = node_url.strip()
+        nodes = _normalize_nodes(cfg.get("nodes"))
+        if nodes:
+            norm["nodes"] = nodes
+        node_limits = _normalize_node_limits(cfg.get("node_limits"))
+        if node_limits:
+            norm["node_limits"] = node_limits
+        if "refresh" in cfg:
+            norm["refresh"] = _normalize_refresh(cfg.get("refresh"))
         tokens_raw = cfg.get("tokens", [])
         if not isinstance(tokens_raw, list):
             tokens_raw = []
@@ -322,6 +397,65 @@ def remove_token(contract: str) -> bool:
     save_config(cfg)
     return True
 
+def get_node_url() -> Optional[str]:
+    """
+    Last used node URL. Only a plaintext hint (the wallet store keeps the
+    authoritative value) so the node can be contacted before decryption.
+    """
+    url = load_config().get("node_url")
+    return url or None
+
+
+def set_node_url(url: Optional[str]) -> None:
+    """Remember the node URL hint; None clears it. No-op when unchanged."""
+    with _LOCK:
+        cfg = load_config()
+        url = (url or "").strip() or None
+        if cfg.get("node_url") == url:
+            return
+        if url is None:
+            cfg.pop("node_url", None)
+        else:
+            cfg["node_url"] = url
+        save_config(cfg)
+
+
+def set_node_urls(urls: List[str]) -> List[str]:
+    """
+    Store the node failover list (deduplicated, at most MAX_NODES) and make
+    its first entry the node URL hint. Returns the stored list.
+    """
+    nodes = _normalize_nodes(list(urls))
+    with _LOCK:
+        cfg = load_config()
+        cfg["nodes"] = nodes
+        if nodes:
+            cfg["node_url"] = nodes[0]
+        else:
+            cfg.pop("node_url", None)
+        save_config(cfg)
+    return nodes
+
+
+def get_node_limits(url: Optional[str]) -> NodeLimits:
+    """Concurrency limit and per-request timeout for a node (defaults if unset)."""
+    limits = load_config().get("node_limits", {}).get((url or "").strip().rstrip("/"))
+    return dict(limits) if limits else {"max_concurrency": DEFAULT_MAX_CONCURRENCY, "timeout": DEFAULT_REQUEST_TIMEOUT}
+
+
+def set_refresh_settings(
+    enabled: Optional[bool] = None, interval: Optional[int] = None, pause_in_tray: Optional[bool] = None
+) -> RefreshSettings:
+    """Update the background refresh settings; omitted values are kept. Returns the stored settings."""
+    with _LOCK:
+        cfg = load_config()
+        settings = dict(_normalize_refresh(cfg.get("refresh")))
+        for key, value in (("enabled", enabled), ("interval", interval), ("pause_in_tray", pause_in_tray)):
+            if value is not None:
+                settings[key] = value
+        cfg["refresh"] = _normalize_refresh(settings)
+        save_config(cfg)
+        return cfg["refresh"]
 
 
 def is_default_contract(contract: str) -> bool:
@@ -332,6 +466,9 @@ def is_default_contract(contract: str) -> bool:
 
 __all__ = [
     "TokenConfig",
+    "NodeLimits",
+    "RefreshSettings",
+    "get_app_data_dir",
     "get_config_path",
     "load_config",
     "save_config",
@@ -340,5 +477,10 @@ __all__ = [
     "add_token",
     "upsert_token",
     "remove_token",
+    "get_node_url",
+    "set_node_url",
+    "set_node_urls",
+    "get_node_limits",
+    "set_refresh_settings",
     "is_default_contract",
 ]
@@ -0,0 +1,127 @@
+# Two-level (memory + disk) LRU cache for generated PIL images
+
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional, Tuple
+
+from src.storage.config_store import get_app_data_dir
+
+CACHE_DIR = "cache"
+
+
+class ImageCache:
+    """
+    Images keyed by a tuple of their generation parameters.
+    Recent images stay in memory; every image is also written to
+    <app data>/cache/<name>/ as PNG so later sessions skip regeneration.
+    Both levels evict the least recently used entries. Thread-safe, so
+    workers can fill it while the UI thread reads from it.
+    """
+
+    def __init__(self, name: str, memory_size: int = 16, disk_size: int = 64):
+        self.name = name
+        self.memory_size = memory_size
+        self.disk_size = disk_size
+        self._memory: "OrderedDict[Tuple[Hashable, ...], Any]" = OrderedDict()
+        self._lock = threading.RLock()
+
+    def _dir(self) -> str:
+        path = os.path.join(get_app_data_dir(), CACHE_DIR, self.name)
+        os.makedirs(path, exist_ok=True)
+        return path
+
+    def _path(self, key: Tuple[Hashable, ...]) -> str:
+        digest = hashlib.sha256(repr(key).encode("utf-8")).hexdigest()[:32]
+        return os.path.join(self._dir(), digest + ".png")
+
+    def peek(self, key: Tuple[Hashable, ...]) -> Optional[Any]:
+        """Memory-only lookup; never touches the disk (safe on the UI thread)."""
+        with self._lock:
+            img = self._memory.get(key)
+            if img is not None:
+                self._memory.move_to_end(key)
+            return img
+
+    def get(self, key: Tuple[Hashable, ...]) -> Optional[Any]:
+        img = self.peek(key)
+        if img is not None:
+            return img
+        path = self._path(key)
+        try:
+            from PIL import Image
+
+            with Image.open(path) as f:
+                img = f.copy()
+            os.utime(path)  # mark as recently used
+        except Exception:
+            return None
+        self._remember(key, img)
+        return img
+
+    def put(self, key: Tuple[Hashable, ...], img: Any) -> None:
+        self._remember(key, img)
+        path = self._path(key)
+        tmp = path + ".tmp"
+        try:
+            img.save(tmp, format="PNG")
+            os.replace(tmp, path)
+            self._trim_disk()
+        except Exception:
+            # The disk level is best effort; the memory level still holds the image
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+
+    def get_or_create(self, key: Tuple[Hashable, ...], factory: Callable[[], Any]) -> Any:
+        img = self.get(key)
+        if img is None:
+            img = factory()
+            self.put(key, img)
+        return img
+
+    def clear(self) -> None:
+        """Forget every image, in memory and on disk (e.g. when the wallet is removed)."""
+        with self._lock:
+            self._memory.clear()
+            folder = self._dir()
+            for fname in os.listdir(folder):
+                if fname.endswith((".png", ".tmp")):
+                    try:
+                        os.remove(os.path.join(folder, fname))
+                    except OSError:
+                        pass
+
+    def _remember(self, key: Tuple[Hashable, ...], img: Any) -> None:
+        with self._lock:
+            self._memory[key] = img
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_size:
+                self._memory.popitem(last=False)
+
+    def _trim_disk(self) -> None:
+        folder = self._dir()
+        with self._lock:
+            entries = []
+            for fname in os.listdir(folder):
+                if fname.endswith(".png"):
+                    full = os.path.join(folder, fname)
+                    try:
+                        entries.append((os.path.getmtime(full), full))
+                    except OSError:
+                        pass
+            entries.sort()
+            for _, full in entries[:max(0, len(entries) - self.disk_size)]:
+                try:
+                    os.remove(full)
+                except OSError:
+                    pass
+
+
+__all__ = [
+    "ImageCache",
+]
@@ -0,0 +1,70 @@
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
+
+class _Rows:
+    __slots__ = ("x1", "x2", "top", "row_h", "pitch", "count", "clip_top", "clip_bottom", "offset")
+
+    def __init__(self, x1, x2, top, row_h, pitch, count, clip_top, clip_bottom):
+        self.x1, self.x2 = x1, x2
+        self.top, self.row_h, self.pitch, self.count = top, row_h, pitch, count
+        self.clip_top, self.clip_bottom = clip_top, clip_bottom
+        self.offset = 0.0
+
+
+class HitIndex:
+    """Canvas hit testing by category.
+
+    Plain rectangles are bucketed into horizontal bands when the layout changes,
+    so a lookup only checks the few rectangles sharing the pointer's band.
+    Vertically stacked rows are resolved arithmetically and follow the scroll
+    offset without being re-indexed.
+    """
+
+    def __init__(self, band: int = 32):
+        self.band = band
+        self._areas: Dict[str, List[Mapping[str, float]]] = {}
+        self._bands: Dict[str, Dict[int, List[Tuple[float, float, float, float, int]]]] = {}
+        self._rows: Dict[str, _Rows] = {}
+
+    def set_areas(self, category: str, rects: Sequence[Mapping[str, float]]) -> None:
+        # Rebuild the category only when its layout actually changed
+        rects = list(rects)
+        if self._areas.get(category) == rects:
+            return
+        self._areas[category] = rects
+        bands: Dict[int, List[Tuple[float, float, float, float, int]]] = {}
+        for idx, r in enumerate(rects):
+            entry = (r['x1'], r['y1'], r['x2'], r['y2'], idx)
+            for b in range(int(r['y1'] // self.band), int(r['y2'] // self.band) + 1):
+                bands.setdefault(b, []).append(entry)
+        self._bands[category] = bands
+
+    def set_rows(self, category: str, x1: float, x2: float, top: float, row_h: float, pitch: float,
+                 count: int, clip_top: float, clip_bottom: float) -> None:
+        rows = self._rows.get(category)
+        offset = rows.offset if rows is not None else 0.0
+        rows = self._rows[category] = _Rows(x1, x2, top, row_h, pitch, count, clip_top, clip_bottom)
+        rows.offset = offset
+
+    def set_row_offset(self, category: str, offset: float) -> None:
+        rows = self._rows.get(category)
+        if rows is not None:
+            rows.offset = offset
+
+    def hit(self, category: str, x: float, y: float) -> Optional[int]:
+        """Index of the area (or row) of `category` under (x, y), or None."""
+        rows = self._rows.get(category)
+        if rows is not None:
+            if not (rows.x1 <= x <= rows.x2 and rows.clip_top <= y <= rows.clip_bottom):
+                return None
+            cy = y + rows.offset - rows.top
+            if cy < 0:
+                return None
+            i = int(cy // rows.pitch)
+            if i >= rows.count or cy - i * rows.pitch > rows.row_h:
+                return None
+            return i
+        for x1, y1, x2, y2, idx in self._bands.get(category, {}).get(int(y // self.band), ()):
+            if x1 <= x <= x2 and y1 <= y <= y2:
+                return idx
+        return None
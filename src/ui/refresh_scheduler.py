@@ -0,0 +1,150 @@
+# Adaptive timing for background balance refreshes
+
+from __future__ import annotations
+
+import random
+import time
+from typing import Callable, Optional
+
+
+class RefreshScheduler:
+    """
+    Calls `refresh` periodically through widget.after. The base interval
+    stretches after consecutive errors (exponential backoff), shrinks for a
+    while after a send, relaxes while push updates are live and slows down
+    or pauses while the window is hidden in the tray. Every delay is
+    jittered so many wallets don't hit a node in lockstep.
+    Call report() when a refresh finishes.
+    """
+
+    MAX_BACKOFF_S = 600.0
+    JITTER = 0.1
+    BOOST_INTERVAL_S = 5.0
+    BOOST_DURATION_S = 60.0
+    # Safety net only while the node pushes updates
+    LIVE_FACTOR = 4.0
+    HIDDEN_FACTOR = 10.0
+
+    def __init__(self, widget, refresh: Callable[[], None], interval_s: float = 30.0, pause_hidden: bool = False):
+        self.widget = widget
+        self.refresh = refresh
+        self.interval_s = interval_s
+        self.pause_hidden = pause_hidden
+        self.running = False
+        self.hidden = False
+        self.live = False
+        self.errors = 0
+        self.boost_until = 0.0
+        self.last_run: Optional[float] = None
+        self.next_run: Optional[float] = None
+        self._job: Optional[str] = None
+
+    # ---- Control ----
+    def start(self) -> None:
+        self.running = True
+        self.errors = 0
+        self._schedule()
+
+    def stop(self) -> None:
+        self.running = False
+        self._cancel()
+
+    def configure(self, interval_s: Optional[float] = None, pause_hidden: Optional[bool] = None) -> None:
+        if interval_s is not None:
+            self.interval_s = interval_s
+        if pause_hidden is not None:
+            self.pause_hidden = pause_hidden
+        self._schedule()
+
+    def set_hidden(self, hidden: bool) -> None:
+        if hidden == self.hidden:
+            return
+        self.hidden = hidden
+        overdue = self.last_run is None or time.monotonic() - self.last_run >= self.interval_s
+        if not hidden and self.running and overdue:
+            # Back from the tray with balances older than one interval: refresh right away
+            self._cancel()
+            self._run()
+        else:
+            self._schedule()
+
+    def set_live(self, live: bool) -> None:
+        if live != self.live:
+            self.live = live
+            self._schedule()
+
+    def boost(self) -> None:
+        """Refresh more often for a while (e.g. after sending a transaction)."""
+        self.boost_until = time.monotonic() + self.BOOST_DURATION_S
+        self._schedule()
+
+    def report(self, ok: bool) -> None:
+        """Outcome of a refresh (scheduled or not); the next one is timed from now."""
+        self.errors = 0 if ok else self.errors + 1
+        self._schedule()
+
+    # ---- Timing ----
+    def delay_s(self) -> Optional[float]:
+        """Seconds until the next refresh, before jitter; None while paused."""
+        if self.hidden and self.pause_hidden:
+            return None
+        if time.monotonic() < self.boost_until:
+            delay = self.BOOST_INTERVAL_S
+        else:
+            delay = self.interval_s * (self.LIVE_FACTOR if self.live else 1.0)
+        if self.errors:
+            delay = max(delay, min(self.interval_s * 2 ** self.errors, self.MAX_BACKOFF_S))
+        if self.hidden:
+            delay *= self.HIDDEN_FACTOR
+        return delay
+
+    def describe(self) -> str:
+        """One line on the current timing, for the settings panel."""
+        if not self.running:
+            return "Auto refresh is off"
+        if self.next_run is None:
+            return "Paused while in the tray"
+        parts = [f"next in {max(0, int(self.next_run - time.monotonic()))} s"]
+        if self.last_run is not None:
+            parts.append(f"last {int(time.monotonic() - self.last_run)} s ago")
+        if time.monotonic() < self.boost_until:
+            parts.append("faster after send")
+        elif self.live:
+            parts.append("relaxed (live updates)")
+        if self.errors:
+            parts.append(f"backing off after {self.errors} error{'s' if self.errors > 1 else ''}")
+        if self.hidden:
+            parts.append("slowed in tray")
+        text = ", ".join(parts)
+        return text[0].upper() + text[1:]
+
+    def _schedule(self) -> None:
+        self._cancel()
+        if not self.running:
+            return
+        delay = self.delay_s()
+        if delay is None:
+            return
+        delay *= random.uniform(1 - self.JITTER, 1 + self.JITTER)
+        self.next_run = time.monotonic() + delay
+        self._job = self.widget.after(int(delay * 1000), self._run)
+
+    def _cancel(self) -> None:
+        if self._job is not None:
+            self.widget.after_cancel(self._job)
+            self._job = None
+        self.next_run = None
+
+    def _run(self) -> None:
+        self._job = None
+        self.last_run = time.monotonic()
+        self.refresh()
+        # Rescheduled by report(); this keeps the timer alive if a refresh
+        # was skipped and never reports
+        if self._job is None:
+            self._schedule()
+
+
+__all__ = [
+    "RefreshScheduler",
+]
@@ -0,0 +1,214 @@
+import time
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from src.ui.ui_utils import round_rect_points
+
+
+class _Item:
+    __slots__ = ("iid", "kind", "coords", "opts", "visible")
+
+    def __init__(self, iid: int, kind: str, coords: Tuple[float, ...], opts: Dict[str, Any]):
+        self.iid = iid
+        self.kind = kind
+        self.coords = coords
+        self.opts = opts
+        self.visible = True
+
+
+class Scene:
+    """Retained canvas items grouped into stacked regions.
+
+    Draw code calls the same helpers on every pass. Items are created on first
+    use and afterwards only touched with coords/itemconfigure when something
+    changed; items a region stops drawing are hidden instead of deleted.
+    """
+
+    def __init__(self, canvas, regions: List[str]):
+        self.canvas = canvas
+        # Bottom-to-top stacking order
+        self.regions = list(regions)
+        self._items: Dict[str, Dict[str, _Item]] = {r: {} for r in self.regions}
+        self._dirty: Set[str] = set(self.regions)
+        self._region: Optional[str] = None
+        self._touched: List[str] = []
+        self._placed: Set[str] = set()
+        self._partial = False
+
+    @staticmethod
+    def tag(region: str) -> str:
+        return f"region:{region}"
+
+    # ---- Invalidation ----
+    def invalidate(self, *regions: str) -> None:
+        self._dirty.update(regions or self.regions)
+
+    def is_dirty(self, region: str) -> bool:
+        return region in self._dirty
+
+    def dirty_regions(self) -> List[str]:
+        return [r for r in self.regions if r in self._dirty]
+
+    def clear(self, region: Optional[str] = None) -> None:
+        for r in ([region] if region else self.regions):
+            for it in self._items[r].values():
+                self.canvas.delete(it.iid)
+            self._items[r] = {}
+            self._dirty.add(r)
+
+    def move(self, region: str, dx: float, dy: float) -> None:
+        # Translate a whole region with one canvas call, keeping cached coords in sync
+        if not self._items[region]:
+            return
+        self.canvas.move(self.tag(region), dx, dy)
+        for it in self._items[region].values():
+            it.coords = tuple(v + (dx if k % 2 == 0 else dy) for k, v in enumerate(it.coords))
+
+    # ---- Region passes ----
+    def begin(self, region: str, partial: bool = False) -> None:
+        # A partial pass only updates the items it draws and leaves the rest
+        # of the region (and its dirty flag) alone.
+        self._region = region
+        self._touched = []
+        self._placed = set()
+        self._partial = partial
+
+    def end(self) -> None:
+        region = self._region
+        if region is None:
+            return
+        if not self._partial:
+            touched = set(self._touched)
+            for key, it in self._items[region].items():
+                if it.visible and key not in touched:
+                    self.canvas.itemconfigure(it.iid, state="hidden")
+                    it.visible = False
+        if self._placed:
+            self._restack(region)
+        if not self._partial:
+            self._dirty.discard(region)
+        self._region = None
+
+    def _restack(self, region: str) -> None:
+        # New or re-shown items go right above the item drawn before them, so
+        # the region keeps its draw order without raising everything.
+        c = self.canvas
+        items = self._items[region]
+        prev: Optional[int] = None
+        for key in self._touched:
+            iid = items[key].iid
+            if key in self._placed:
+                if prev is not None:
+                    c.tag_raise(iid, prev)
+                else:
+                    anchor = self._anchor_above(region)
+                    if anchor is None:
+                        c.tag_raise(iid)
+                    else:
+                        c.tag_lower(iid, anchor)
+            prev = iid
+
+    def _anchor_above(self, region: str) -> Optional[int]:
+        # Lowest item that has to stay above the start of this region
+        items = self._items[region]
+        for key in self._touched:
+            if key not in self._placed:
+                return items[key].iid
+        for r in self.regions[self.regions.index(region) + 1:]:
+            found = self.canvas.find_withtag(self.tag(r))
+            if found:
+                return found[0]
+        return None
+
+    # ---- Item helpers ----
+    def _put(self, key: str, kind: str, coords: Tuple[float, ...], opts: Dict[str, Any]) -> int:
+        region = self._region
+        assert region is not None, "draw outside of a region pass"
+        c = self.canvas
+        items = self._items[region]
+        it = items.get(key)
+        if it is not None and it.kind != kind:
+            c.delete(it.iid)
+            it = None
+        if it is None:
+            it = items[key] = _Item(self._create(kind, coords, opts, region), kind, coords, dict(opts))
+            self._placed.add(key)
+        else:
+            self._update(it, coords, opts)
+            if not it.visible:
+                c.itemconfigure(it.iid, state="normal")
+                it.visible = True
+                self._placed.add(key)
+        self._touched.append(key)
+        return it.iid
+
+    def _create(self, kind: str, coords: Tuple[float, ...], opts: Dict[str, Any], region: str) -> int:
+        return getattr(self.canvas, "create_" + kind)(*coords, tags=(self.tag(region),), **opts)
+
+    def _update(self, it: _Item, coords: Tuple[float, ...], opts: Dict[str, Any]) -> None:
+        c = self.canvas
+        if coords != it.coords:
+            c.coords(it.iid, *coords)
+            it.coords = coords
+        changed = {k: v for k, v in opts.items() if it.opts.get(k) != v}
+        if changed:
+            c.itemconfigure(it.iid, **changed)
+            it.opts.update(changed)
+
+    def text(self, key: str, x: float, y: float, **opts: Any) -> int:
+        return self._put(key, "text", (x, y), opts)
+
+    def line(self, key: str, *coords: float, **opts: Any) -> int:
+        return self._put(key, "line", tuple(coords), opts)
+
+    def round_rect(self, key: str, x1: float, y1: float, x2: float, y2: float, r: float = 12,
+                   fill: str = "#1b2228", outline: str = "#1b2228", width: int = 1) -> int:
+        points = tuple(round_rect_points(x1, y1, x2, y2, r))
+        return self._put(key, "polygon", points, {"fill": fill, "outline": outline, "width": width, "smooth": True})
+
+    def image(self, key: str, x: float, y: float, **opts: Any) -> int:
+        return self._put(key, "image", (x, y), opts)
+
+
+class FrameScheduler:
+    """Coalesces redraw requests into one paint per frame.
+
+    request() marks scene regions dirty and schedules a single callback; every
+    request made before it fires is served by that one paint. Paints are also
+    capped to one per min_interval_ms so event floods cannot outrun the screen.
+    """
+
+    def __init__(self, widget, scene: Scene, paint: Callable[[], None], min_interval_ms: int = 16):
+        self.widget = widget
+        self.scene = scene
+        self.paint = paint
+        self.min_interval_ms = min_interval_ms
+        self.requested = 0
+        self.painted = 0
+        self._pending: Optional[str] = None
+        self._last_paint = 0.0
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        return {'requested': self.requested, 'painted': self.painted}
+
+    def request(self, *regions: str) -> None:
+        self.scene.invalidate(*regions)
+        self.schedule()
+
+    def schedule(self) -> None:
+        # A paint without invalidating regions, for callers that queue finer
+        # grained work (e.g. single rows) for the paint callback
+        self.requested += 1
+        if self._pending is not None:
+            return
+        wait_ms = int(self.min_interval_ms - (time.perf_counter() - self._last_paint) * 1000)
+        if wait_ms > 0:
+            self._pending = self.widget.after(wait_ms, self._run)
+        else:
+            self._pending = self.widget.after_idle(self._run)
+
+    def _run(self) -> None:
+        self._pending = None
+        self._last_paint = time.perf_counter()
+        self.painted += 1
+        self.paint()
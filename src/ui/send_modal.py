@@ -48,6 +48,7 @@ class SendScreen:
         self.main_frame.pack(fill=tk.BOTH, expand=True, padx=12, pady=8)
 
         # Build UI sections
+        self._total = "0.000"
         self._create_header()
         self._create_balance_section()
         self._create_recipient_section()
@@ -56,12 +57,29 @@ class SendScreen:
         self._create_transaction_summary()
         self._create_action_buttons()
 
-        # Focus on recipient field
-        self.recipient_entry.focus_set()
-
         # Bind mousewheel for scrolling
         self.canvas.bind_all("<MouseWheel>", self._on_mousewheel)
 
+        self.bind_token(token_data)
+
+    def bind_token(self, token_data: 'TokenRow'):
+        """Show this (pooled) screen for another token, starting from an empty form."""
+        self.token_data = token_data
+        self.icon_canvas.itemconfig(self.icon_text, text=token_data.get("icon", "T"))
+        self.title_label.config(text=f"Send {token_data['symbol']}")
+        self.subtitle_label.config(text=token_data['name'])
+        for entry in (self.recipient_entry, self.amount_entry, self.memo_entry):
+            entry.delete(0, tk.END)
+        self.recipient_hint.config(text="Enter wallet address", fg="#6a7a7e")
+        self.amount_hint.config(text="Enter amount", fg="#6a7a7e")
+        self._total = "0.000"
+        self._draw_balance_card()
+        self._draw_summary_card()
+        self.canvas.yview_moveto(0)
+
+        # Focus on recipient field
+        self.recipient_entry.focus_set()
+
     def _create_header(self):
         header_frame = tk.Frame(self.main_frame, bg="#0b1417")
         header_frame.pack(fill=tk.X, pady=(0, 8))
@@ -75,21 +93,22 @@ class SendScreen:
         create_round_rect(icon_frame, 2, 2, 38, 38, r=19, fill="#0a1215", outline="#0a1215")
         create_round_rect(icon_frame, 0, 0, 36, 36, r=18, fill="#0f1b1f", outline="#1a2a2f")
 
-        # Icon text
-        icon_frame.create_text(19, 19, text=self.token_data.get("icon", "T"),
+        # Icon text (set in bind_token)
+        self.icon_canvas = icon_frame
+        self.icon_text = icon_frame.create_text(19, 19, text="",
                               fill="#7ee1a6", font=("Segoe UI", 13, "bold"))
 
         # Header text
         text_frame = tk.Frame(header_frame, bg="#0b1417")
         text_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 
-        title = tk.Label(text_frame, text=f"Send {self.token_data['symbol']}",
+        self.title_label = tk.Label(text_frame, text="",
                         font=("Segoe UI", 13, "bold"), fg="#e8f6f7", bg="#0b1417")
-        title.pack(anchor="w")
+        self.title_label.pack(anchor="w")
 
-        subtitle = tk.Label(text_frame, text=self.token_data['name'],
+        self.subtitle_label = tk.Label(text_frame, text="",
                            font=("Segoe UI", 9), fg="#8aa4aa", bg="#0b1417")
-        subtitle.pack(anchor="w")
+        self.subtitle_label.pack(anchor="w")
 
         # Back button (←)
         back_btn = tk.Label(header_frame, text="←", font=("Segoe UI", 14),
@@ -104,15 +123,18 @@ class SendScreen:
         container = tk.Frame(self.main_frame, bg="#0b1417")
         container.pack(fill=tk.X, pady=(0, 8))
 
-        balance_frame = tk.Canvas(container, height=50, bg="#0b1417",
+        self.balance_canvas = tk.Canvas(container, height=50, bg="#0b1417",
                                  highlightthickness=0)
-        balance_frame.pack(fill=tk.X)
+        self.balance_canvas.pack(fill=tk.X)
+        # Drawn once the widget has its real width instead of forcing a layout pass
+        self.balance_canvas.bind("<Configure>", lambda e: self._draw_balance_card())
 
-        # Schedule drawing after widget is sized
-        balance_frame.update_idletasks()
+    def _draw_balance_card(self):
+        balance_frame = self.balance_canvas
         width = balance_frame.winfo_width()
-        if width < 10:
-            width = 350
+        if width < 10:  # Not sized yet, <Configure> will draw it
+            return
+        balance_frame.delete("all")
 
         # Card with gradient
         create_round_rect(balance_frame, 1, 1, width-1, 49, r=8, fill="#0a1215", outline="#0a1215")
@@ -235,15 +257,19 @@ class SendScreen:
         container = tk.Frame(self.main_frame, bg="#0b1417")
         container.pack(fill=tk.X, pady=(0, 8))
 
-        summary_frame = tk.Canvas(container, height=60, bg="#0b1417",
+        self.summary_canvas = tk.Canvas(container, height=60, bg="#0b1417",
                                  highlightthickness=0)
-        summary_frame.pack(fill=tk.X)
+        self.summary_canvas.pack(fill=tk.X)
+        self.total_text = None
+        # Drawn once the widget has its real width instead of forcing a layout pass
+        self.summary_canvas.bind("<Configure>", lambda e: self._draw_summary_card())
 
-        # Schedule drawing after widget is sized
-        summary_frame.update_idletasks()
+    def _draw_summary_card(self):
+        summary_frame = self.summary_canvas
         width = summary_frame.winfo_width()
-        if width < 10:  # Not sized yet, use default
-            width = 350
+        if width < 10:  # Not sized yet, <Configure> will draw it
+            return
+        summary_frame.delete("all")
 
         # Card background
         create_round_rect(summary_frame, 1, 1, width-1, 59, r=8, fill="#0a1215", outline="#0a1215")
@@ -263,7 +289,7 @@ class SendScreen:
         summary_frame.create_line(10, 38, width-10, 38, fill="#1a2a2f", width=1)
         summary_frame.create_text(10, 48, text="Total:",
                                  anchor="w", fill="#7ee1a6", font=("Segoe UI", 9, "bold"))
-        self.total_text = summary_frame.create_text(width-10, 48, text="0.000",
+        self.total_text = summary_frame.create_text(width-10, 48, text=self._total_label(),
                                                     anchor="e", fill="#7ee1a6",
                                                     font=("Segoe UI", 9, "bold"))
 
@@ -339,14 +365,13 @@ class SendScreen:
             self.amount_hint.config(text="⚠️ Invalid number", fg="#e85555")
             self._update_total("0.000")
 
+    def _total_label(self) -> str:
+        return f"{self._total} {self.token_data['symbol']}"
+
     def _update_total(self, total: str):
-        # Find the canvas and update the text
-        for widget in self.main_frame.winfo_children():
-            if isinstance(widget, tk.Canvas):
-                try:
-                    widget.itemconfig(self.total_text, text=f"{total} {self.token_data['symbol']}")
-                except:
-                    pass
+        self._total = total
+        if self.total_text is not None:
+            self.summary_canvas.itemconfig(self.total_text, text=self._total_label())
 
     def _validate_recipient(self):
         address = self.recipient_entry.get().strip()
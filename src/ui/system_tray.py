@@ -1,10 +1,85 @@
 import tkinter as tk
 import threading
+from collections import OrderedDict
+from functools import lru_cache
 from typing import Optional, Callable, Any
 
 from PIL import Image, ImageDraw, ImageFont
 import pystray
 
+from src.storage.image_cache import ImageCache
+
+# Common tray/taskbar sizes across Windows, macOS and Linux panels
+ICON_SIZES = (16, 20, 24, 32, 48, 64, 128, 256)
+# Icon parameters; bump ICON_VERSION when the drawing itself changes
+ICON_VERSION = 1
+ICON_FILL = (35, 150, 200, 255)
+ICON_RING = (255, 255, 255, 255)
+ICON_TEXT = "X"
+BADGE_FILL = (232, 85, 85, 255)
+
+_ICON_CACHE = ImageCache("tray", memory_size=len(ICON_SIZES) + 4, disk_size=32)
+# Badge overlays by (text, diameter); small and cheap, so memory only
+_BADGE_CACHE: "OrderedDict[tuple, Image.Image]" = OrderedDict()
+_BADGE_CACHE_SIZE = 16
+
+
+@lru_cache(maxsize=None)
+def _load_font(font_size: int):
+    try:
+        return ImageFont.truetype("arial.ttf", font_size)
+    except Exception:
+        try:
+            return ImageFont.truetype("Arial.ttf", font_size)
+        except Exception:
+            try:
+                return ImageFont.load_default(size=font_size)  # scalable since Pillow 10.1
+            except TypeError:
+                return ImageFont.load_default()
+
+
+def _draw_centered_text(draw, box, text, font, fill):
+    x1, y1, x2, y2 = box
+    bbox = draw.textbbox((0, 0), text, font=font)
+    text_x = x1 + ((x2 - x1) - (bbox[2] - bbox[0])) // 2 - bbox[0]
+    text_y = y1 + ((y2 - y1) - (bbox[3] - bbox[1])) // 2 - bbox[1]
+    draw.text((text_x, text_y), text, fill=fill, font=font)
+
+
+def _render_icon(size):
+    image = Image.new("RGBA", size, color=ICON_FILL)
+    draw = ImageDraw.Draw(image)
+
+    # Circle
+    draw.ellipse(
+        [2, 2, size[0] - 2, size[1] - 2],
+        fill=ICON_FILL,
+        outline=ICON_RING,
+        width=2,
+    )
+
+    # Letter X
+    _draw_centered_text(draw, (0, 0, size[0], size[1]), ICON_TEXT, _load_font(int(min(size) * 0.5)), ICON_RING)
+    return image
+
+
+def _badge_layer(text: str, diameter: int):
+    key = (text, diameter)
+    layer = _BADGE_CACHE.get(key)
+    if layer is not None:
+        _BADGE_CACHE.move_to_end(key)
+        return layer
+    d = max(6, diameter)
+    layer = Image.new("RGBA", (d, d), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(layer)
+    draw.ellipse([0, 0, d - 1, d - 1], fill=BADGE_FILL, outline=ICON_RING, width=max(1, d // 32))
+    if text and d >= 12:
+        _draw_centered_text(draw, (0, 0, d, d), text, _load_font(int(d * (0.6 if len(text) == 1 else 0.4))), ICON_RING)
+    _BADGE_CACHE[key] = layer
+    while len(_BADGE_CACHE) > _BADGE_CACHE_SIZE:
+        _BADGE_CACHE.popitem(last=False)
+    return layer
+
 
 class SystemTray:
 
@@ -14,68 +89,49 @@ class SystemTray:
         window: tk.Tk,
         on_show: Optional[Callable[[], None]] = None,
         on_quit: Optional[Callable[[], None]] = None,
+        on_hide: Optional[Callable[[], None]] = None,
     ):
 
         self.window = window
         self.on_show = on_show
         self.on_quit = on_quit
+        self.on_hide = on_hide
         self.icon = None  # Deliberately untyped to avoid strict external types
         self.is_visible = True
         self._icon_running = False
+        self._badge: Optional[str] = None
+        # Fill the icon cache off the UI thread so minimizing never waits on Pillow
+        threading.Thread(target=self.icon_set, daemon=True, name="TrayIconWarmup").start()
 
     def create_icon_image(self, size=(64, 64)):
+        key = ("base", ICON_VERSION, tuple(size), ICON_FILL, ICON_RING, ICON_TEXT)
+        return _ICON_CACHE.get_or_create(key, lambda: _render_icon(tuple(size)))
+
+    def icon_set(self):
+        # The base icon at every common tray size, read from the cache when possible
+        return {px: self.create_icon_image((px, px)) for px in ICON_SIZES}
+
+    def badged_icon_image(self, badge: Optional[str], size=(64, 64)):
+        # The cached base icon with a badge pasted on top; the base is never redrawn.
+        # badge=None gives the plain icon, "" a dot, anything else a short label.
+        base = self.create_icon_image(size)
+        if badge is None:
+            return base
+        layer = _badge_layer(badge[:3], int(min(size) * 0.5))
+        image = base.copy()
+        image.alpha_composite(layer, (image.width - layer.width, 0))
+        return image
 
-        image = Image.new("RGBA", size, color=(35, 150, 200, 255))
-        draw = ImageDraw.Draw(image)
-
-        # Circle
-        draw.ellipse(
-            [2, 2, size[0] - 2, size[1] - 2],
-            fill=(35, 150, 200, 255),
-            outline=(255, 255, 255, 255),
-            width=2,
-        )
-
-        # Letter X
-        text = "X"
-        font_size = int(min(size) * 0.5)
-        try:
-            font = ImageFont.truetype("arial.ttf", font_size)
-        except Exception:
-            try:
-                font = ImageFont.truetype("Arial.ttf", font_size)
-            except Exception:
-                font = ImageFont.load_default()
-
-        # Compute text bounds with robust fallbacks for Pillow versions
-        try:
-            # Preferred (Pillow >= 8.0)
-            bbox = draw.textbbox((0, 0), text, font=font)
-            text_width = bbox[2] - bbox[0]
-            text_height = bbox[3] - bbox[1]
-            offset_x, offset_y = bbox[0], bbox[1]
-        except Exception:
-            # Fallback 1: font.getbbox (may exist on many versions)
+    def set_badge(self, badge: Optional[str]) -> None:
+        """Show (or clear with None) a notification badge on the running tray icon."""
+        if badge == self._badge:
+            return
+        self._badge = badge
+        if self.icon is not None:
             try:
-                bbox2 = font.getbbox(text)  # type: ignore[attr-defined]
-                text_width = bbox2[2] - bbox2[0]
-                text_height = bbox2[3] - bbox2[1]
-                offset_x, offset_y = bbox2[0], bbox2[1]
+                self.icon.icon = self.badged_icon_image(badge)
             except Exception:
-                # Fallback 2: font.getmask provides raster size
-                try:
-                    mask = font.getmask(text)
-                    text_width, text_height = mask.size
-                    offset_x = offset_y = 0
-                except Exception:
-                    # Last resort: approximate with font size
-                    text_width = text_height = font_size
-                    offset_x = offset_y = 0
-
-        text_x = (size[0] - text_width) // 2 - offset_x
-        text_y = (size[1] - text_height) // 2 - offset_y
-        draw.text((text_x, text_y), text, fill=(255, 255, 255, 255), font=font)
-        return image
+                pass
 
     def show_window(self, icon=None, item=None):
         self.window.after(0, self._show_window_impl)
@@ -112,12 +168,17 @@ class SystemTray:
     def _hide_window(self):
         self.window.withdraw()
         self.is_visible = False
+        if self.on_hide:
+            try:
+                self.on_hide()
+            except Exception as e:
+                print(f"Error in on_hide callback: {e}")
 
     def _start_tray_icon(self):
         if self._icon_running:
             return
         try:
-            icon_image = self.create_icon_image()
+            icon_image = self.badged_icon_image(self._badge)
             menu = pystray.Menu(
                 pystray.MenuItem("Show Wallet", self.show_window, default=True),
                 pystray.MenuItem("Quit", self.quit_application),
@@ -1,14 +1,14 @@
 import tkinter as tk
 from tkinter import messagebox, simpledialog
 from typing import TYPE_CHECKING, Any
-import qrcode
 from qrcode.constants import ERROR_CORRECT_H
 from PIL import Image, ImageTk
 
 if TYPE_CHECKING:
     from .wallet_ui import WalletUI, TokenRow
 
-from src.ui.ui_utils import create_round_rect, lerp_color
+from src.ui.hit_index import HitIndex
+from src.ui.ui_utils import create_round_rect, get_gradient_image, load_qr_image_async
 from src.ui.send_modal import SendScreen
 
 
@@ -34,6 +34,11 @@ class TokenDetailsScreen:
 
         # Hit areas for buttons
         self.hit_areas = {'send': [], 'receive': [], 'swap': []}
+        self.hit_index = HitIndex()
+        self.hover_action = None
+        # Send screen and its notebook tab, built on first use and then reused
+        self._send_screen = None
+        self._send_tab = None
 
         # Draw the UI
         self.draw_ui()
@@ -43,6 +48,12 @@ class TokenDetailsScreen:
         self.canvas.bind("<Leave>", lambda e: self._clear_hover())
         self.canvas.bind("<Button-1>", self._on_click)
 
+    def bind_token(self, token_data: 'TokenRow'):
+        """Show this (pooled) screen for another token."""
+        self.token_data = token_data
+        self._clear_hover()
+        self.draw_ui()
+
     def draw_ui(self):
         c = self.canvas
         c.delete("all")
@@ -63,14 +74,20 @@ class TokenDetailsScreen:
         # Action buttons
         self._draw_action_buttons(c)
 
+        for key, rects in self.hit_areas.items():
+            self.hit_index.set_areas(key, rects)
+
+    def _action_at(self, x, y):
+        for action in ['back', 'send', 'receive', 'swap', 'copy_contract']:
+            if self.hit_index.hit(action, x, y) is not None:
+                return action
+        return None
+
     def _draw_vignette(self, c):
-        # Simple vertical gradient
+        # Vertical gradient, shared with the main window's cache
         top = "#0a1617"
         bottom = "#0a1012"
-        for i in range(self.HEIGHT):
-            t = i / self.HEIGHT
-            color = lerp_color(top, bottom, t)
-            c.create_line(0, i, self.WIDTH, i, fill=color)
+        c.create_image(0, 0, image=get_gradient_image(self.canvas, self.WIDTH, self.HEIGHT, top, bottom), anchor="nw")
 
     def _draw_header(self, c):
         pad = 16
@@ -166,34 +183,23 @@ class TokenDetailsScreen:
             self.hit_areas[key] = [{'x1': x1, 'y1': y1, 'x2': x2, 'y2': y2}]
 
     def _on_motion(self, e):
-        x, y = e.x, e.y
-        # Check button hover (simplified - just redraw on any motion for now)
-        self.draw_ui()
+        # Nothing is drawn differently on hover; only update the cursor when the target changes
+        action = self._action_at(e.x, e.y)
+        if action != self.hover_action:
+            self.hover_action = action
+            self.canvas.configure(cursor="hand2" if action else "")
 
     def _clear_hover(self):
-        self.draw_ui()
+        if self.hover_action is not None:
+            self.hover_action = None
+            self.canvas.configure(cursor="")
 
     def _on_click(self, e):
-        x, y = e.x, e.y
-
-        # Check back button
-        for rect in self.hit_areas.get('back', []):
-            if rect['x1'] <= x <= rect['x2'] and rect['y1'] <= y <= rect['y2']:
-                self._handle_action('back')
-                return
-
-        # Check action buttons
-        for action in ['send', 'receive', 'swap']:
-            for rect in self.hit_areas.get(action, []):
-                if rect['x1'] <= x <= rect['x2'] and rect['y1'] <= y <= rect['y2']:
-                    self._handle_action(action)
-                    return
-
-        # Check copy contract
-        for rect in self.hit_areas.get('copy_contract', []):
-            if rect['x1'] <= x <= rect['x2'] and rect['y1'] <= y <= rect['y2']:
-                self._copy_contract()
-                return
+        action = self._action_at(e.x, e.y)
+        if action == 'copy_contract':
+            self._copy_contract()
+        elif action is not None:
+            self._handle_action(action)
 
     def _handle_action(self, action: str):
         if action == 'back':
@@ -220,29 +226,31 @@ class TokenDetailsScreen:
                 f"Memo: {transaction_data['memo'] or 'N/A'}\n\n"
                 f"Transaction has been submitted to the network!"
             )
-            # Refresh token balance after sending
-            if hasattr(self.master, '_refresh_balances'):
-                self.master._refresh_balances()
+            # Refresh token balance after sending (and more often until it lands)
+            if hasattr(self.master, '_on_transaction_sent'):
+                self.master._on_transaction_sent()
         
         def handle_back():
             """Navigate back from send screen"""
-            # Find the current send tab and close it
-            for tab_id in self.master.details_notebook.tabs():
-                if "Send" in self.master.details_notebook.tab(tab_id, "text"):
-                    self.master.details_notebook.forget(tab_id)
-                    # Select the token details tab
-                    self.master.details_notebook.select(self.frame)
-                    break
-        
-        # Create new tab for send screen
-        send_tab_frame = tk.Frame(self.master.details_notebook, bg="#0b1417")
-        self.master.details_notebook.add(send_tab_frame, text=f"Send {self.token_data['symbol']}")
-        
-        # Create send screen in the tab
-        SendScreen(self.master, send_tab_frame, self.token_data, on_send=handle_send, on_back=handle_back)
-        
+            # Hide the send tab (kept for reuse) and select the token details tab
+            notebook = self.master.details_notebook
+            notebook.hide(self._send_tab)
+            notebook.select(self.parent)
+
+        notebook = self.master.details_notebook
+        if self._send_screen is None:
+            # Create the send tab and screen once
+            self._send_tab = tk.Frame(notebook, bg="#0b1417")
+            notebook.add(self._send_tab, text=f"Send {self.token_data['symbol']}")
+            self._send_screen = SendScreen(self.master, self._send_tab, self.token_data,
+                                           on_send=handle_send, on_back=handle_back)
+        else:
+            # Re-adding a hidden tab restores it in place
+            notebook.add(self._send_tab, text=f"Send {self.token_data['symbol']}")
+            self._send_screen.bind_token(self.token_data)
+
         # Select the send tab
-        self.master.details_notebook.select(send_tab_frame)
+        notebook.select(self._send_tab)
 
     def _receive_token(self):
         # Show receiving address with QR code
@@ -288,36 +296,33 @@ class TokenDetailsScreen:
             qr_frame = tk.Frame(popup, bg="#ffffff", relief="solid", bd=2)  # White background for contrast
             qr_frame.pack(pady=(8, 16), padx=12)
 
-            # Generate QR code with high contrast (black/white)
-            # Smaller box_size and a standard quiet zone (border=4) keep it compact and scannable
-            qr = qrcode.QRCode(
-                version=1,
-                box_size=6,   # Reduced size per module
-                border=4,     # Standard quiet zone
-                error_correction=ERROR_CORRECT_H
-            )
-            qr.add_data(address)
-            qr.make(fit=True)
-
-            # Create QR image with maximum contrast
-            qr_image = qr.make_image(fill_color="black", back_color="white")
-            # Ensure we have a PIL Image for Tk
-            pil_img = qr_image.convert("RGB") if hasattr(qr_image, "convert") else qr_image  # type: ignore[assignment]
-
-            # Convert to PhotoImage
-            qr_photo: ImageTk.PhotoImage = ImageTk.PhotoImage(pil_img)  # type: ignore
-
-            # Display QR code (keep reference on the instance to avoid GC)
-            qr_label = tk.Label(qr_frame, image=qr_photo, bg="white")  # type: ignore
-            self._qr_photo_ref = qr_photo
+            # Placeholder until the QR bitmap is ready; it is generated (or loaded
+            # from the cache) off the UI thread so the popup opens right away
+            qr_label = tk.Label(qr_frame, text="Generating QR code...", bg="white", fg="#4a5a5e",
+                                font=("Segoe UI", 9), width=28, height=12)
             qr_label.pack(padx=8, pady=8)
 
-            # After rendering QR, adjust popup size to fit content exactly
-            popup.update_idletasks()
-            # Compute desired width/height based on frame plus padding (more compact)
-            total_width = max(320, qr_frame.winfo_reqwidth() + 40)
-            total_height = qr_frame.winfo_reqheight() + 220  # header + address + buttons
-            popup.geometry(f"{total_width}x{total_height}")
+            def show_qr(pil_img):
+                if not popup.winfo_exists():
+                    return
+                if pil_img is None:
+                    qr_label.config(text="QR code unavailable")
+                    return
+                # Display QR code (keep reference on the instance to avoid GC)
+                qr_photo: ImageTk.PhotoImage = ImageTk.PhotoImage(pil_img, master=popup)  # type: ignore
+                self._qr_photo_ref = qr_photo
+                qr_label.config(image=qr_photo, text="", width=0, height=0)  # type: ignore
+
+                # Adjust popup size to fit the QR code exactly
+                popup.update_idletasks()
+                # Compute desired width/height based on frame plus padding (more compact)
+                total_width = max(320, qr_frame.winfo_reqwidth() + 40)
+                total_height = qr_frame.winfo_reqheight() + 220  # header + address + buttons
+                popup.geometry(f"{total_width}x{total_height}")
+
+            # High contrast (black/white); box_size=6 with the standard quiet zone
+            # (border=4) keeps it compact and scannable
+            load_qr_image_async(popup, address, show_qr, box_size=6, border=4, ecc=ERROR_CORRECT_H)
 
             # Address section - show full address clearly
             addr_frame = tk.Frame(popup, bg="#0b1417")
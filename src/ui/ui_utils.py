@@ -1,30 +1,27 @@
-import tkinter as tk
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Optional, Tuple
 
+from src.storage.image_cache import ImageCache
 
-# Simple rounded rectangle helper using arcs + rectangles
+
+def round_rect_points(x1, y1, x2, y2, r=12):
+    # Control points for a smoothed polygon; doubled points keep the edges straight
+    r = max(0, min(r, (x2 - x1) / 2, (y2 - y1) / 2))
+    return [
+        x1 + r, y1, x1 + r, y1, x2 - r, y1, x2 - r, y1,
+        x2, y1, x2, y1 + r, x2, y1 + r, x2, y2 - r, x2, y2 - r,
+        x2, y2, x2 - r, y2, x2 - r, y2, x1 + r, y2, x1 + r, y2,
+        x1, y2, x1, y2 - r, x1, y2 - r, x1, y1 + r, x1, y1 + r,
+        x1, y1,
+    ]
+
+
+# Rounded rectangle as a single smoothed polygon item
 def create_round_rect(canvas, x1, y1, x2, y2, r=12, fill="#1b2228", outline="#1b2228", width=1):
     if r <= 0:
         return canvas.create_rectangle(x1, y1, x2, y2, fill=fill, outline=outline, width=width)
-    items = []
-    # Four arcs
-    items.append(canvas.create_arc(x1, y1, x1 + 2 * r, y1 + 2 * r, start=90, extent=90, style=tk.PIESLICE, outline=outline, width=width, fill=fill))
-    items.append(canvas.create_arc(x2 - 2 * r, y1, x2, y1 + 2 * r, start=0, extent=90, style=tk.PIESLICE, outline=outline, width=width, fill=fill))
-    items.append(canvas.create_arc(x1, y2 - 2 * r, x1 + 2 * r, y2, start=180, extent=90, style=tk.PIESLICE, outline=outline, width=width, fill=fill))
-    items.append(canvas.create_arc(x2 - 2 * r, y2 - 2 * r, x2, y2, start=270, extent=90, style=tk.PIESLICE, outline=outline, width=width, fill=fill))
-    # Center rectangles to stitch corners
-    items.append(canvas.create_rectangle(x1 + r, y1, x2 - r, y2, fill=fill, outline=fill))
-    items.append(canvas.create_rectangle(x1, y1 + r, x2, y2 - r, fill=fill, outline=fill))
-    # Outline path (approximate) for nicer border
-    if outline and width:
-        canvas.create_line(x1 + r, y1, x2 - r, y1, fill=outline, width=width)
-        canvas.create_line(x2, y1 + r, x2, y2 - r, fill=outline, width=width)
-        canvas.create_line(x1 + r, y2, x2 - r, y2, fill=outline, width=width)
-        canvas.create_line(x1, y1 + r, x1, y2 - r, fill=outline, width=width)
-        canvas.create_arc(x1, y1, x1 + 2 * r, y1 + 2 * r, start=90, extent=90, style=tk.ARC, outline=outline, width=width)
-        canvas.create_arc(x2 - 2 * r, y1, x2, y1 + 2 * r, start=0, extent=90, style=tk.ARC, outline=outline, width=width)
-        canvas.create_arc(x1, y2 - 2 * r, x1 + 2 * r, y2, start=180, extent=90, style=tk.ARC, outline=outline, width=width)
-        canvas.create_arc(x2 - 2 * r, y2 - 2 * r, x2, y2, start=270, extent=90, style=tk.ARC, outline=outline, width=width)
-    return items
+    return canvas.create_polygon(round_rect_points(x1, y1, x2, y2, r), smooth=True, fill=fill, outline=outline, width=width)
 
 
 def lerp_color(c1: str, c2: str, t: float) -> str:
@@ -36,4 +33,93 @@ def lerp_color(c1: str, c2: str, t: float) -> str:
     r = int(r1 + (r2 - r1) * t)
     g = int(g1 + (g2 - g1) * t)
     b = int(b1 + (b2 - b1) * t)
-    return f"#{r:02x}{g:02x}{b:02x}"
\ No newline at end of file
+    return f"#{r:02x}{g:02x}{b:02x}"
+
+
+# Pre-rendered vertical gradients, keyed by (width, height, top, bottom, band).
+# A new size or palette simply yields a new key; old entries age out.
+_GRADIENT_CACHE: "OrderedDict[Tuple[Any, ...], Any]" = OrderedDict()
+_GRADIENT_CACHE_SIZE = 8
+
+
+def get_gradient_image(master, width: int, height: int, top: str, bottom: str, band: Optional[Tuple[int, int]] = None):
+    # band=(y1, y2) returns just that horizontal strip of the full gradient
+    key = (int(width), int(height), top, bottom, band)
+    photo = _GRADIENT_CACHE.get(key)
+    if photo is not None:
+        _GRADIENT_CACHE.move_to_end(key)
+        return photo
+    from PIL import Image, ImageTk
+
+    # Render a one pixel wide column and stretch it horizontally
+    h = max(1, key[1])
+    r1, g1, b1 = (int(top[k:k + 2], 16) for k in (1, 3, 5))
+    r2, g2, b2 = (int(bottom[k:k + 2], 16) for k in (1, 3, 5))
+    column = Image.new("RGB", (1, h))
+    column.putdata([
+        (int(r1 + (r2 - r1) * t), int(g1 + (g2 - g1) * t), int(b1 + (b2 - b1) * t))
+        for t in (i / h for i in range(h))
+    ])
+    if band is not None:
+        column = column.crop((0, band[0], 1, band[1]))
+    img = column.resize((max(1, key[0]), column.height), Image.NEAREST)
+    photo = ImageTk.PhotoImage(img, master=master)
+    _GRADIENT_CACHE[key] = photo
+    while len(_GRADIENT_CACHE) > _GRADIENT_CACHE_SIZE:
+        _GRADIENT_CACHE.popitem(last=False)
+    return photo
+
+
+# QR bitmaps, keyed by (payload, box_size, border, ecc); kept in memory and on disk
+_QR_CACHE = ImageCache("qr", memory_size=8, disk_size=32)
+
+
+def _qr_key(payload: str, box_size: int, border: int, ecc: Optional[int]) -> Tuple[Any, ...]:
+    if ecc is None:
+        from qrcode.constants import ERROR_CORRECT_H
+        ecc = ERROR_CORRECT_H
+    return (payload, int(box_size), int(border), int(ecc))
+
+
+def get_qr_image(payload: str, box_size: int = 6, border: int = 4, ecc: Optional[int] = None):
+    # Black on white RGB PIL image (default ecc: ERROR_CORRECT_H). Blocking, so
+    # call it from a worker; UI code uses load_qr_image_async.
+    key = _qr_key(payload, box_size, border, ecc)
+
+    def make():
+        import qrcode
+
+        qr = qrcode.QRCode(version=1, box_size=key[1], border=key[2], error_correction=key[3])
+        qr.add_data(payload)
+        qr.make(fit=True)
+        img = qr.make_image(fill_color="black", back_color="white")
+        return img.convert("RGB") if hasattr(img, "convert") else img
+
+    return _QR_CACHE.get_or_create(key, make)
+
+
+def clear_qr_cache() -> None:
+    # QR codes encode the wallet address: drop them with the wallet
+    _QR_CACHE.clear()
+
+
+def load_qr_image_async(widget, payload: str, on_ready: Callable[[Any], None],
+                        box_size: int = 6, border: int = 4, ecc: Optional[int] = None) -> None:
+    # on_ready(image or None) runs on the Tk thread: right away when the image is
+    # in memory, otherwise once a worker has loaded or generated it.
+    cached = _QR_CACHE.peek(_qr_key(payload, box_size, border, ecc))
+    if cached is not None:
+        on_ready(cached)
+        return
+
+    def worker():
+        try:
+            img = get_qr_image(payload, box_size, border, ecc)
+        except Exception:
+            img = None
+        try:
+            widget.after(0, lambda: on_ready(img))
+        except Exception:
+            pass  # widget destroyed meanwhile
+
+    threading.Thread(target=worker, daemon=True).start()
@@ -1,15 +1,28 @@
 import tkinter as tk
 from tkinter import messagebox, simpledialog, filedialog
-from tkinter import ttk
+import os
 import threading
-from typing import Optional, List, Dict, TypedDict, Union
-
-from src.storage import config_store, secure_store
-from src.core.wallet_manager import WalletManager
-from src.ui.system_tray import SystemTray
-from src.ui.token_details_screen import TokenDetailsScreen
-from src.ui.ui_utils import create_round_rect, lerp_color
-from xian_py import Xian
+import time
+from typing import TYPE_CHECKING, Any, Optional, Iterable, List, Dict, Set, TypedDict, Union
+
+from src.core.node_pool import NodePool
+from src.core.single_flight import CancelToken, SingleFlight
+from src.core.startup import StartupPipeline, StartupTrace, probe_node
+from src.storage import balance_cache, config_store, secure_store
+from src.ui.hit_index import HitIndex
+from src.ui.refresh_scheduler import RefreshScheduler
+from src.ui.scene import FrameScheduler, Scene
+from src.ui.ui_utils import clear_qr_cache, get_gradient_image, lerp_color
+
+# Only Tk and the storage layer load before the first paint; xian-py, the
+# tray (pystray), the details notebook and screens (qrcode) and Pillow load on
+# first use.
+if TYPE_CHECKING:
+    from tkinter import ttk
+
+    from src.core.wallet_manager import WalletManager
+    from src.ui.system_tray import SystemTray
+    from src.ui.token_details_screen import TokenDetailsScreen
 
 class TokenRow(TypedDict):
     name: str
@@ -48,8 +61,17 @@ class PressedState(TypedDict):
 class WalletUI(tk.Tk):
     WIDTH = 360
     HEIGHT = 640
+    # Token list layout
+    LIST_TOP = 318
+    ROW_H = 66
+    ROW_SPACING = 12
+    # Rows are materialized this far outside the viewport
+    ROW_MARGIN = 40
 
     def __init__(self):
+        # Timed trace of the startup phases (printed when XIAN_PORTAL_TRACE is set)
+        self.startup_trace = StartupTrace()
+        self.startup_trace.begin("window")
         super().__init__()
         self.title("Xian Portal Wallet")
         self.resizable(False, False)
@@ -57,11 +79,61 @@ class WalletUI(tk.Tk):
         self.configure(bg="#0b1417")
 
         self.active_tab = tk.StringVar(value="Tokens")
-        self.address = "d53f0b...a21dcf"
-        self.wallet_manager = WalletManager()
-        self.current_wallet = None  # WalletInfo
-        self.node_url: Optional[str] = None
+        self._wallet_manager: Optional['WalletManager'] = None
+        self._system_tray: Optional['SystemTray'] = None
         self._store_password: Optional[str] = None  # session-only, not persisted
+        self._init_view_state()
+
+
+        # System tray is created on first minimize (see system_tray)
+        self.bind("<Unmap>", self._on_unmap); self.protocol("WM_DELETE_WINDOW", self._on_tray_quit)
+        self.canvas = tk.Canvas(self, width=self.WIDTH, height=self.HEIGHT, bg="#0b1417", highlightthickness=0); self.canvas.pack(fill=tk.BOTH, expand=True)
+        self._init_scene()
+        # Created when a token is first opened (see details_notebook)
+        self._details_notebook: Optional['ttk.Notebook'] = None
+        # Pooled token details screen (see show_token_details)
+        self._details_screen: Optional['TokenDetailsScreen'] = None
+        self._details_tab: Optional[tk.Frame] = None
+        self.bind_all("<Control-n>", self._create_wallet); self.bind_all("<Control-i>", self._import_wallet)
+        self.bind_all("<Control-u>", self._set_node_url)
+        self.bind_all("<F5>", self._refresh_balances)
+
+        # Paint a skeleton right away; wallet, tokens and node arrive from the
+        # startup pipeline (see _start_startup)
+        self.startup_trace.end("window")
+        self.draw_ui()
+        self.after_idle(lambda: self.startup_trace.mark("first_paint"))
+        # Queued behind the first paint, so Pillow loads after the window shows
+        self.after_idle(self._load_gradients)
+        self._start_startup()
+
+        # Redraw on resize
+        self.canvas.bind("<Configure>", lambda e: self.draw_ui())
+        # Hover and click handling
+        self.canvas.bind("<Motion>", self._on_motion)
+        self.canvas.bind("<Leave>", lambda e: self._clear_hover())
+        self.canvas.bind("<Button-1>", self._on_click)
+        # Scroll wheel support
+        self.canvas.bind("<MouseWheel>", self._on_mousewheel)   # Windows/macOS
+        self.canvas.bind("<Button-4>", self._on_scroll_up)      # Linux up
+        self.canvas.bind("<Button-5>", self._on_scroll_down)    # Linux down
+
+
+
+    def _init_view_state(self) -> None:
+        # Plain drawing/interaction state; needs no Tk widgets (see scripts/bench_render.py)
+        self.address = "d53f0b...a21dcf"
+        # Wallet and primary node; set through the current_wallet / node_url properties
+        self._current_wallet = None  # WalletInfo
+        # Background gradients are swapped in once Pillow is loaded (_load_gradients)
+        self._gradients_ready = False
+        self._node_url: Optional[str] = None
+        # Failover list from the config (primary first); see _node_list
+        self.node_urls: List[str] = []
+        # Health, latency and circuit breaker per node; reads go to its best node
+        self.node_pool = NodePool()
+        # Node that served the last refresh
+        self.read_node: Optional[str] = None
         # Pressed feedback state
         self.pressed_state: PressedState = {
             'tab': None,     # index or None
@@ -70,7 +142,46 @@ class WalletUI(tk.Tk):
         }
 
         self.loading_balances = False
-        self.scroll_offset: int = 0
+        # (node, address, contract) keys being fetched; overlapping requests
+        # queue one follow-up instead of being dropped (see _refresh_balances)
+        self._flights = SingleFlight()
+        # Refresh jobs belong to the generation of the (node, address) they
+        # started for; a change cancels them and discards their late results
+        self._generation = 0
+        self._generation_target: Optional[tuple] = None
+        self._refresh_cancel = CancelToken()
+        # Last balances persisted for this wallet/node, shown until fresh values arrive
+        self._snapshot: Optional[Dict[str, Any]] = None
+        # When the shown balances were fetched; stale while they come from the cache
+        self.balances_as_of: Optional[float] = None
+        self.balances_stale = False
+        # Duration of the last balance refresh, shown on the balance card
+        self.last_refresh_ms: Optional[float] = None
+        # Time to the first and to the last balance shown by the last refresh:
+        # {'generation', 'started', 'first_ms', 'last_ms'}
+        self.last_refresh_metrics: Optional[Dict[str, Any]] = None
+        # Balances streamed from refresh workers, applied once per frame (_take_streamed)
+        self._streamed: List[tuple] = []
+        self._streamed_lock = threading.Lock()
+        self._stream_posted = False
+        # Latest block height seen by a refresh
+        self.chain_height: Optional[int] = None
+        # Push updates (node Tx events) for the current (node, address):
+        # "live" while subscribed, "polling" while falling back, "off" without a wallet
+        self.live_updates = "off"
+        self._subscription = None
+        self._subscription_target: Optional[tuple] = None
+        # Background refresh; runs while there is a wallet and a node (see _sync_subscription)
+        self.auto_refresh = True
+        self.refresh_scheduler = RefreshScheduler(self, self._refresh_balances)
+        self.scroll_offset: float = 0.0
+        # Smooth scrolling: the offset eases towards this target
+        self._scroll_target: float = 0.0
+        self._scroll_anim: Optional[str] = None
+        # pool slot -> token index currently drawn in it
+        self._row_binding: Dict[int, int] = {}
+        # Token indices to repaint on the next frame without redrawing the list
+        self._dirty_rows: Set[int] = set()
         self.total_balance_xian: float = 0.0
 
         self.tokens: List[TokenRow] = [
@@ -87,86 +198,225 @@ class WalletUI(tk.Tk):
             'edit': False,
         }
 
-        self.hit_areas: Dict[str, List[HitArea]] = dict.fromkeys(['tabs', 'tokens', 'bottom', 'addr', 'copy', 'edit'], [])
+        self.hit_areas: Dict[str, List[HitArea]] = dict.fromkeys(['tabs', 'bottom', 'addr', 'copy', 'edit'], [])
+        # Lookup structure over hit_areas plus the token rows, rebuilt on layout changes
+        self.hit_index = HitIndex()
+
+    def _init_scene(self) -> None:
+        # Retained canvas items, stacked bottom to top
+        # The token list sits under 'clip', which masks rows outside its viewport
+        self.scene = Scene(self.canvas, ['bg', 'tokens', 'clip', 'topbar', 'balance', 'tabs', 'bottom'])
+        # Redraw requests are coalesced into one paint per frame (see frames.stats)
+        self.frames = FrameScheduler(self, self.scene, self._paint)
+
+    # ---- Startup pipeline ----
+    def _start_startup(self) -> None:
+        # Decryption, config loading and the node probe run concurrently on
+        # workers; the store is decrypted at most once per session.
+        pipeline = self._startup = StartupPipeline(lambda fn: self.after(0, fn), self.startup_trace)
+        pipeline.run("config", config_store.load_config, self._on_config_loaded)
+        try:
+            store_exists = secure_store.store_exists()
+            needs_password = store_exists and secure_store.requires_password()
+        except Exception:
+            store_exists = needs_password = False
+        if not store_exists:
+            pipeline.skip("decrypt")
+        elif needs_password:
+            # The prompt needs the window, so ask once the skeleton is up
+            self.address = "Locked"
+            self.after_idle(self._prompt_unlock)
+        else:
+            self.address = "Unlocking..."
+            pipeline.run("decrypt", secure_store.load_wallet, self._on_wallet_loaded)
+        pipeline.when_all(("config", "decrypt"), self._on_startup_ready)
+
+    def _prompt_unlock(self) -> None:
+        self.startup_trace.begin("unlock_prompt")
+        pwd = simpledialog.askstring("Security", "Enter the wallet password", show='*')
+        self.startup_trace.end("unlock_prompt")
+        if not pwd:
+            self._startup.skip("decrypt")
+            return
+        self._store_password = pwd
+        self.address = "Unlocking..."
+        self.draw_ui('balance')
+        self._startup.run("decrypt", lambda: secure_store.load_wallet(password=pwd), self._on_wallet_loaded)
+
+    def _on_config_loaded(self, cfg, error) -> None:
+        if error is None:
+            self._load_tokens_from_config(cfg.get("tokens", []))
+            self._apply_refresh_settings(cfg["refresh"])
+            self.node_urls = cfg.get("nodes", [])
+            self._update_node_pool()
+            self._apply_snapshot()
+            self.draw_ui('tokens')
+            # Warm up the last used node while the store is still being decrypted
+            self._probe_node(cfg.get("node_url"))
+
+    def _on_wallet_loaded(self, result, error) -> None:
+        if error is not None:
+            self.address = "Locked"
+            self.draw_ui('balance')
+            messagebox.showwarning("Secure load", f"Could not load stored wallet: {error}")
+            return
+        info, node = result
+        if info is None:
+            return
+        self.current_wallet = info
+        self.address = f"{info.public_key[:6]}...{info.public_key[-6:]}"
+        if node:
+            self.node_url = node
+            self._update_node_pool()
+            self._probe_node(node)
+            threading.Thread(target=config_store.set_node_url, args=(node,), daemon=True).start()
+            self._startup.run("snapshot", lambda: balance_cache.load_snapshot(node, info.public_key),
+                              self._on_snapshot_loaded)
+        self.draw_ui('balance')
+
+    def _on_snapshot_loaded(self, snapshot, error) -> None:
+        # Only useful while nothing fresher has been fetched
+        if error is not None or self.balances_as_of is not None:
+            return
+        self._snapshot = snapshot
+        changed = self._apply_snapshot()
+        if snapshot.get("total") is not None:
+            self.total_balance_xian = snapshot["total"]
+        self.balances_as_of = snapshot.get("updated_at")
+        self.balances_stale = self.balances_as_of is not None
+        self.draw_rows(changed)
+        self.draw_ui('balance')
+
+    def _apply_snapshot(self) -> List[int]:
+        # Fill rows that have no balance yet from the cached snapshot
+        cached = (self._snapshot or {}).get("balances", {})
+        changed = []
+        for i, t in enumerate(self.tokens):
+            if t["balance"] is None and cached.get(t["contract"]) is not None:
+                t["balance"] = cached[t["contract"]]
+                changed.append(i)
+        return changed
+
+    def _probe_node(self, node_url: Optional[str]) -> None:
+        if node_url:
+            # Once per node: the saved wallet's node may differ from the config hint
+            node_url = node_url.rstrip('/')
+            self._startup.run(f"node_probe:{node_url}", lambda: probe_node(node_url),
+                              lambda health, error: self._on_node_probed(node_url, health, error))
+
+    def _on_node_probed(self, node_url: str, health, _error) -> None:
+        # Recorded for the probed node: the primary may have changed meanwhile
+        if health is not None:
+            self.node_pool.record_probe(node_url, health)
+
+    def _node_list(self) -> List[str]:
+        # The primary node (kept in the wallet store) first, then the configured fallbacks
+        urls = ([self.node_url] if self.node_url else []) + self.node_urls
+        return list(dict.fromkeys(u.rstrip('/') for u in urls))
+
+    def _update_node_pool(self) -> None:
+        urls = self._node_list()
+        self.node_pool.set_urls(urls)
+        if urls:
+            self.node_pool.start()
+        else:
+            self.node_pool.stop()
 
+    def _apply_node_list(self, urls: Iterable[str]) -> None:
+        # New primary and fallbacks: persist the list and drop clients of removed nodes
+        urls = list(dict.fromkeys(u.strip().rstrip('/') for u in urls if u and u.strip()))
+        if not urls:
+            return
+        self.node_url, self.node_urls = urls[0], urls
+        threading.Thread(target=config_store.set_node_urls, args=(urls,), daemon=True).start()
+        from src.core import node_client
+        node_client.switch_node(urls)
+        self._update_node_pool()
+
+    def _on_startup_ready(self) -> None:
+        self.startup_trace.mark("ready")
+        if self.address in ("Locked", "Unlocking..."):
+            self.address = "Locked"
+            self.draw_ui('balance')
+        if self.current_wallet is None:
+            self._initial_setup()
+            return
+        if self.node_url:
+            self.startup_trace.begin("balances")
+        else:
+            self._report_startup()
+        self._refresh_balances()
 
-        # Initialize system tray
+    def _report_startup(self) -> None:
+        if os.getenv("XIAN_PORTAL_TRACE"):
+            print(self.startup_trace.report())
 
-        self.system_tray = SystemTray(window=self, on_show=self._on_tray_show, on_quit=self._on_tray_quit)
-        self.bind("<Unmap>", self._on_unmap); self.protocol("WM_DELETE_WINDOW", self._on_tray_quit)
-        self.canvas = tk.Canvas(self, width=self.WIDTH, height=self.HEIGHT, bg="#0b1417", highlightthickness=0); self.canvas.pack(fill=tk.BOTH, expand=True)
-        self.details_notebook = ttk.Notebook(self)
-        self.details_notebook.pack_forget()  # Hidden initially
-        self.bind_all("<Control-n>", self._create_wallet); self.bind_all("<Control-i>", self._import_wallet)
-        self.bind_all("<Control-u>", self._set_node_url)
-        self.bind_all("<F5>", self._refresh_balances)
+    def iconify(self):
 
-        # Try to load stored wallet securely
-        loaded_info, loaded_node = (None, None)
-        try:
-            if secure_store.store_exists():
-                if secure_store.requires_password():
-                    pwd = simpledialog.askstring("Security", "Enter the wallet password", show='*')
-                    if pwd:
-                        self._store_password = pwd
-                        loaded_info, loaded_node = secure_store.load_wallet(password=pwd)
-                else:
-                    loaded_info, loaded_node = secure_store.load_wallet()
-        except Exception as e:
-            messagebox.showwarning("Secure load", f"Could not load stored wallet: {e}")
-        if loaded_info is not None:
-            self.current_wallet = loaded_info
-            self.address = f"{loaded_info.public_key[:6]}...{loaded_info.public_key[-6:]}"
-            if loaded_node:
-                self.node_url = loaded_node
-
-        # Load tokens from config before first draw
-        try:
-            self._load_tokens_from_config()
-        except Exception:
-            pass
 
-        # Draw once
-        self.draw_ui()
 
-        # Auto refresh balances if possible
         try:
-            self.after(10, self._refresh_balances)
+            tk.Tk.iconify(self)
         except Exception:
+
             pass
 
-        # Redraw on resize
-        self.canvas.bind("<Configure>", lambda e: self.draw_ui())
-        # Hover and click handling
-        self.canvas.bind("<Motion>", self._on_motion)
-        self.canvas.bind("<Leave>", lambda e: self._clear_hover())
-        self.canvas.bind("<Button-1>", self._on_click)
-        # Scroll wheel support
-        self.canvas.bind("<MouseWheel>", self._on_mousewheel)   # Windows/macOS
-        self.canvas.bind("<Button-4>", self._on_scroll_up)      # Linux up
-        self.canvas.bind("<Button-5>", self._on_scroll_down)    # Linux down
-        # Initial setup dialog on startup (skips if wallet already loaded)
-        self.after(200, self._initial_setup)
 
 
 
-    def iconify(self):
+    @property
+    def wallet_manager(self) -> 'WalletManager':
+        if self._wallet_manager is None:
+            from src.core.wallet_manager import WalletManager
+            self._wallet_manager = WalletManager()
+        return self._wallet_manager
 
+    @property
+    def system_tray(self) -> 'SystemTray':
+        # pystray and Pillow are only loaded once the tray is actually needed
+        if self._system_tray is None:
+            from src.ui.system_tray import SystemTray
+            self._system_tray = SystemTray(window=self, on_show=self._on_tray_show, on_quit=self._on_tray_quit,
+                                           on_hide=self._on_tray_hide)
+        return self._system_tray
 
+    @property
+    def current_wallet(self):
+        return self._current_wallet
 
-        try:
-            tk.Tk.iconify(self)
-        except Exception:
+    @current_wallet.setter
+    def current_wallet(self, wallet) -> None:
+        # Refreshes for the previous wallet are cancelled right away, not on the next refresh
+        self._current_wallet = wallet
+        self._check_generation()
 
-            pass
+    @property
+    def node_url(self) -> Optional[str]:
+        return self._node_url
 
+    @node_url.setter
+    def node_url(self, url: Optional[str]) -> None:
+        self._node_url = url
+        self._check_generation()
 
+    @property
+    def details_notebook(self) -> 'ttk.Notebook':
+        # Most sessions never open token details; build the notebook on first use
+        if self._details_notebook is None:
+            from tkinter import ttk
+            self._details_notebook = ttk.Notebook(self)
+        return self._details_notebook
 
+    def _on_tray_hide(self):
+        # Hidden in the tray: refresh less often (or not at all)
+        self.refresh_scheduler.set_hidden(True)
 
     def _on_tray_show(self):
 
         # Refresh UI when restored from tray
 
+        self.system_tray.set_badge(None)
+        self.refresh_scheduler.set_hidden(False)
         self.draw_ui()
 
 
@@ -175,7 +425,8 @@ class WalletUI(tk.Tk):
     def _on_tray_quit(self):
 
         # Clean up and quit
-        self.system_tray.destroy()
+        if self._system_tray is not None:
+            self._system_tray.destroy()
 
         self.quit()
 
@@ -194,64 +445,101 @@ class WalletUI(tk.Tk):
 
 
 
-    def draw_ui(self):
-        c = self.canvas
-        c.delete("all")
-        # reset hit areas for fresh hover targeting
-        for key in self.hit_areas:
-            self.hit_areas[key] = []
-
-        # Background subtle vignette
-        self._draw_vignette(c)
-
-        # Top bar
-        self._draw_topbar(c)
-
-        # Balance card
-        self._draw_balance_card(c)
-
-        # Tabs
-        self._draw_tabs(c)
-
-        # Token list
-        self._draw_token_list2(c)
-
-        # Bottom nav
-        self._draw_bottom_nav(c)
+    def draw_ui(self, *regions: str) -> None:
+        # Mark the given regions dirty (all of them when called without
+        # arguments); they are painted together on the next frame.
+        self.frames.request(*regions)
+
+    def draw_rows(self, indices) -> None:
+        # Repaint single token rows (e.g. after a balance update) on the next frame
+        self._dirty_rows.update(indices)
+        if self._dirty_rows:
+            self.frames.schedule()
+
+    def _paint(self) -> None:
+        # Items are retained by the scene, so a pass only touches what changed
+        scene = self.scene
+        self._take_streamed()
+        painters = {
+            'bg': self._draw_vignette,          # Background subtle vignette
+            'tokens': self._draw_token_list2,   # Token list
+            'clip': self._draw_clip,            # Masks around the token list viewport
+            'topbar': self._draw_topbar,        # Top bar
+            'balance': self._draw_balance_card, # Balance card
+            'tabs': self._draw_tabs,            # Tabs
+            'bottom': self._draw_bottom_nav,    # Bottom nav
+        }
+        regions = scene.dirty_regions()
+        for region in regions:
+            scene.begin(region)
+            painters[region](scene)
+            scene.end()
+        rows, self._dirty_rows = self._dirty_rows, set()
+        if rows and 'tokens' not in regions:
+            self._redraw_token_rows(rows)
+        for key, rects in self.hit_areas.items():
+            self.hit_index.set_areas(key, rects)
 
     def show_token_details(self, token_data):
         # Hide main canvas
         self.canvas.pack_forget()
         # Show notebook
         self.details_notebook.pack(fill=tk.BOTH, expand=True)
-        # Create new tab
-        tab_frame = tk.Frame(self.details_notebook, bg="#0b1417")
-        self.details_notebook.add(tab_frame, text=f"{token_data['name']} Details")
-        # Create details screen in the tab
-        TokenDetailsScreen(self, tab_frame, token_data, on_back=self.back_to_main)
+        if self._details_screen is None:
+            from src.ui.token_details_screen import TokenDetailsScreen
+            # Create the tab and details screen once
+            self._details_tab = tk.Frame(self.details_notebook, bg="#0b1417")
+            self.details_notebook.add(self._details_tab, text=f"{token_data['name']} Details")
+            self._details_screen = TokenDetailsScreen(self, self._details_tab, token_data, on_back=self.back_to_main)
+        else:
+            # Re-adding a hidden tab restores it in place
+            self.details_notebook.add(self._details_tab, text=f"{token_data['name']} Details")
+            self._details_screen.bind_token(token_data)
         # Select the tab
-        self.details_notebook.select(tab_frame)
+        self.details_notebook.select(self._details_tab)
 
     def back_to_main(self):
-        # Destroy all tabs
-        for tab_id in self.details_notebook.tabs():
-            self.details_notebook.forget(tab_id)
-        # Hide notebook
-        self.details_notebook.pack_forget()
+        notebook = self._details_notebook
+        if notebook is not None:
+            # Hide all tabs; the screens in them are reused for the next token
+            for tab_id in notebook.tabs():
+                notebook.hide(tab_id)
+            # Hide notebook
+            notebook.pack_forget()
         # Show canvas
         self.canvas.pack(fill=tk.BOTH, expand=True)
         self.draw_ui()
 
-    def _draw_vignette(self, c):
-        # Simple vertical gradient by drawing horizontal lines
+    def _load_gradients(self) -> None:
+        # Runs right after the first paint: the gradients need Pillow
+        self._gradients_ready = True
+        self.draw_ui('bg', 'clip')
+
+    def _draw_vignette(self, s):
+        # Vertical gradient, rendered once per size/palette and reused
         top = "#0a1617"
         bottom = "#0a1012"
-        for i in range(self.HEIGHT):
-            t = i / self.HEIGHT
-            color = lerp_color(top, bottom, t)
-            c.create_line(0, i, self.WIDTH, i, fill=color)
+        if not self._gradients_ready:
+            # Flat stand-in for the first paint, before Pillow is loaded
+            flat = lerp_color(top, bottom, 0.5)
+            s.round_rect("flat", 0, 0, self.WIDTH, self.HEIGHT, r=0, fill=flat, outline=flat)
+            return
+        s.image("gradient", 0, 0, image=get_gradient_image(self, self.WIDTH, self.HEIGHT, top, bottom), anchor="nw")
 
-    def _draw_topbar(self, c):
+    def _draw_clip(self, s):
+        # Background strips above and below the token list hide rows scrolled out of view
+        top = "#0a1617"
+        bottom = "#0a1012"
+        visible_top, visible_bottom, _ = self._token_list_viewport()
+        if not self._gradients_ready:
+            flat = lerp_color(top, bottom, 0.5)
+            s.round_rect("above-flat", 0, 0, self.WIDTH, visible_top, r=0, fill=flat, outline=flat)
+            s.round_rect("below-flat", 0, visible_bottom, self.WIDTH, self.HEIGHT, r=0, fill=flat, outline=flat)
+            return
+        s.image("above", 0, 0, image=get_gradient_image(self, self.WIDTH, self.HEIGHT, top, bottom, band=(0, visible_top)), anchor="nw")
+        s.image("below", 0, visible_bottom, image=get_gradient_image(self, self.WIDTH, self.HEIGHT, top, bottom, band=(visible_bottom, self.HEIGHT)), anchor="nw")
+
+    def _draw_topbar(self, s):
         # PRO pill with OFF switch and a lock icon, with depth
         pad = 14
         pill_h = 28
@@ -259,27 +547,27 @@ class WalletUI(tk.Tk):
         x1, y1 = pad, pad
         x2, y2 = x1 + pill_w, y1 + pill_h
         # Shadow
-        create_round_rect(c, x1+1, y1+2, x2+1, y2+2, r=14, fill="#0a1215", outline="#0a1215")
+        s.round_rect("shadow", x1+1, y1+2, x2+1, y2+2, r=14, fill="#0a1215", outline="#0a1215")
         # Main pill
-        create_round_rect(c, x1, y1, x2, y2, r=14, fill="#0f1b1f", outline="#1a2a2f")
+        s.round_rect("pill", x1, y1, x2, y2, r=14, fill="#0f1b1f", outline="#1a2a2f")
         # Top highlight
-        c.create_line(x1+8, y1+1, x2-8, y1+1, fill="#1f3339")
-        c.create_text(x1 + 28, y1 + pill_h / 2, text="PRO", fill="#9ac6cc", font=("Segoe UI", 9, "bold"))
+        s.line("highlight", x1+8, y1+1, x2-8, y1+1, fill="#1f3339")
+        s.text("pro", x1 + 28, y1 + pill_h / 2, text="PRO", fill="#9ac6cc", font=("Segoe UI", 9, "bold"))
 
         # Small switch UI inside pill
-        c.create_text(x1 + 60, y1 + pill_h / 2, text="OFF", fill="#718086", font=("Segoe UI", 8))
+        s.text("off", x1 + 60, y1 + pill_h / 2, text="OFF", fill="#718086", font=("Segoe UI", 8))
         # Switch track and knob
         track_x1, track_y1 = x2 - 46, y1 + 6
         track_x2, track_y2 = x2 - 16, y1 + pill_h - 6
-        create_round_rect(c, track_x1, track_y1, track_x2, track_y2, r=10, fill="#0e181b", outline="#1a2a2f")
+        s.round_rect("track", track_x1, track_y1, track_x2, track_y2, r=10, fill="#0e181b", outline="#1a2a2f")
         # knob with subtle shadow
-        create_round_rect(c, track_x1+2, track_y1+2, track_x1+18, track_y2-2, r=8, fill="#16252a", outline="#22343a")
+        s.round_rect("knob", track_x1+2, track_y1+2, track_x1+18, track_y2-2, r=8, fill="#16252a", outline="#22343a")
 
         # Lock icon on right
         lock = "\U0001F512"  # 🔒
-        c.create_text(self.WIDTH - pad, y1 + pill_h / 2, text=lock, fill="#9ac6cc", font=("Segoe UI Emoji", 12), anchor="e")
+        s.text("lock", self.WIDTH - pad, y1 + pill_h / 2, text=lock, fill="#9ac6cc", font=("Segoe UI Emoji", 12), anchor="e")
 
-    def _draw_balance_card(self, c):
+    def _draw_balance_card(self, s):
         pad = 16
         top = 60
         w = self.WIDTH - 2 * pad
@@ -287,42 +575,68 @@ class WalletUI(tk.Tk):
         x1, y1, x2, y2 = pad, top, pad + w, top + h
 
         # Shadow + outer ring
-        create_round_rect(c, x1+2, y1+3, x2+2, y2+3, r=18, fill="#0a1215", outline="#0a1215")
-        create_round_rect(c, x1 - 2, y1 - 2, x2 + 2, y2 + 2, r=18, fill="#0e181b", outline="#0e181b")
-        create_round_rect(c, x1 - 4, y1 - 4, x2 + 4, y2 + 4, r=20, fill="", outline="#1b3b3f", width=2)
+        s.round_rect("shadow", x1+2, y1+3, x2+2, y2+3, r=18, fill="#0a1215", outline="#0a1215")
+        s.round_rect("outer", x1 - 2, y1 - 2, x2 + 2, y2 + 2, r=18, fill="#0e181b", outline="#0e181b")
+        s.round_rect("ring", x1 - 4, y1 - 4, x2 + 4, y2 + 4, r=20, fill="", outline="#1b3b3f", width=2)
 
         # Main card body + subtle vertical gradient lines
-        create_round_rect(c, x1, y1, x2, y2, r=16, fill="#0f1b1f", outline="#1b2b30")
+        s.round_rect("body", x1, y1, x2, y2, r=16, fill="#0f1b1f", outline="#1b2b30")
         for i in range(8):
             t = i/8
             y = y1 + 4 + i * 2
-            c.create_line(x1+12, y, x2-12, y, fill=lerp_color("#16252a", "#0f1b1f", t))
+            s.line(f"sheen{i}", x1+12, y, x2-12, y, fill=lerp_color("#16252a", "#0f1b1f", t))
 
         # Header row: TOTAL BALANCE + eye
-        c.create_text(x1 + 18, y1 + 18, text="TOTAL BALANCE", anchor="w", fill="#8aa4aa", font=("Segoe UI", 9, "bold"))
-        c.create_text(x2 - 18, y1 + 18, text="\U0001F441", anchor="e", fill="#8aa4aa", font=("Segoe UI Emoji", 12))
+        s.text("title", x1 + 18, y1 + 18, text="TOTAL BALANCE", anchor="w", fill="#8aa4aa", font=("Segoe UI", 9, "bold"))
+        s.text("eye", x2 - 18, y1 + 18, text="\U0001F441", anchor="e", fill="#8aa4aa", font=("Segoe UI Emoji", 12))
 
         # Amount
         amount_text = f"{self.total_balance_xian:,.3f}" if self.total_balance_xian else "0.000"
-        c.create_text(x1 + 22, y1 + 70, text=amount_text, anchor="w", fill="#e8f6f7", font=("Segoe UI", 28, "bold"))
-        c.create_text(x1 + 160, y1 + 70, text="XIAN", anchor="w", fill="#9ac6cc", font=("Segoe UI", 11, "bold"))
+        s.text("amount", x1 + 22, y1 + 70, text=amount_text, anchor="w", fill="#e8f6f7", font=("Segoe UI", 28, "bold"))
+        s.text("unit", x1 + 160, y1 + 70, text="XIAN", anchor="w", fill="#9ac6cc", font=("Segoe UI", 11, "bold"))
 
         # Fiat amount
-        c.create_text(x1 + 22, y1 + 100, text="~ $0.00", anchor="w", fill="#86979b", font=("Segoe UI", 10))
+        s.text("fiat", x1 + 22, y1 + 100, text="~ $0.00", anchor="w", fill="#86979b", font=("Segoe UI", 10))
+        # Staleness of the shown balances
+        s.text("freshness", x2 - 18, y1 + 100, text=self._freshness_text(), anchor="e", fill="#6f8388", font=("Segoe UI", 8))
 
         # Address + copy icon (hoverable)
         addr_hover = self.hover_state['addr']
         addr_color = "#cfe6ea" if addr_hover else "#8aa4aa"
-        c.create_text(x1 + 22, y2 - 24, text=self.address, anchor="w", fill=addr_color, font=("Segoe UI", 9, "underline" if addr_hover else "normal"))
+        s.text("addr", x1 + 22, y2 - 24, text=self.address, anchor="w", fill=addr_color, font=("Segoe UI", 9, "underline" if addr_hover else "normal"))
         # handled via canvas-wide click handler
         copy_hover = self.hover_state['copy']
         copy_color = "#cfe6ea" if copy_hover else "#8aa4aa"
-        c.create_text(x2 - 24, y2 - 24, text="\U0001F4CB", fill=copy_color, font=("Segoe UI Emoji", 12))
+        s.text("copy", x2 - 24, y2 - 24, text="\U0001F4CB", fill=copy_color, font=("Segoe UI Emoji", 12))
         # store hit areas
         self.hit_areas['addr'] = [{'x1': int(x1+12), 'y1': int(y2-36), 'x2': int(x1+180), 'y2': int(y2-14)}]
         self.hit_areas['copy'] = [{'x1': int(x2-36), 'y1': int(y2-36), 'x2': int(x2-12), 'y2': int(y2-12)}]
 
-    def _draw_tabs(self, c):
+    def _freshness_text(self) -> str:
+        if self.loading_balances:
+            return "refreshing..."
+        if not self.balances_stale or self.balances_as_of is None:
+            if self.last_refresh_ms is None:
+                return ""
+            parts = [f"updated in {self.last_refresh_ms / 1000:.2f} s"]
+            if self.chain_height is not None:
+                parts.insert(0, f"block {self.chain_height}")
+            if self.read_node and self.read_node != self.node_url:
+                # Served by a fallback node
+                parts.append("via " + self.read_node.split("://")[-1])
+            if self.live_updates == "live":
+                parts.insert(0, "live")
+            return " \u00b7 ".join(parts)
+        age = max(0, int(time.time() - self.balances_as_of))
+        if age < 60:
+            return "cached just now"
+        if age < 3600:
+            return f"cached {age // 60}m ago"
+        if age < 86400:
+            return f"cached {age // 3600}h ago"
+        return f"cached {age // 86400}d ago"
+
+    def _draw_tabs(self, s):
         pad = 16
         top = 264
         w = self.WIDTH - 2 * pad
@@ -333,8 +647,8 @@ class WalletUI(tk.Tk):
         x1, y1 = pad, top
         container_w = w - (edit_w + edit_gap)
         x2, y2 = x1 + container_w, top + h
-        create_round_rect(c, x1+1, y1+2, x2+1, y2+2, r=20, fill="#0a1215", outline="#0a1215")
-        create_round_rect(c, x1, y1, x2, y2, r=20, fill="#0f1b1f", outline="#1a2a2f")
+        s.round_rect("shadow", x1+1, y1+2, x2+1, y2+2, r=20, fill="#0a1215", outline="#0a1215")
+        s.round_rect("container", x1, y1, x2, y2, r=20, fill="#0f1b1f", outline="#1a2a2f")
 
         # Three segments
         labels = ["Tokens", "Items", "Activity"]
@@ -347,20 +661,20 @@ class WalletUI(tk.Tk):
             hovered = (self.hover_state['tab'] == i)
             pressed = (self.pressed_state.get('tab') == i)
             if active:
-                create_round_rect(c, sx1 + 4, y1 + 4, sx2 - 4, y2 - 4, r=16, fill="#17262b", outline="#22383e")
-                c.create_line(sx1+12, y1+6, sx2-12, y1+6, fill="#223a41")
+                s.round_rect(f"active{i}", sx1 + 4, y1 + 4, sx2 - 4, y2 - 4, r=16, fill="#17262b", outline="#22383e")
+                s.line(f"active_line{i}", sx1+12, y1+6, sx2-12, y1+6, fill="#223a41")
                 color = "#e8f6f7"
                 weight = "bold"
             else:
                 if hovered:
-                    create_round_rect(c, sx1 + 6, y1 + 6, sx2 - 6, y2 - 6, r=14, fill="#142127", outline="#22343a")
+                    s.round_rect(f"hover{i}", sx1 + 6, y1 + 6, sx2 - 6, y2 - 6, r=14, fill="#142127", outline="#22343a")
                     color = "#cfe6ea"
                     weight = "bold"
                 else:
                     color = "#9ab0b5"
                     weight = "normal"
             ty = (y1 + y2) / 2 + (1 if pressed else 0)
-            c.create_text((sx1 + sx2) / 2, ty, text=label, fill=color, font=("Segoe UI", 10, weight))
+            s.text(f"label{i}", (sx1 + sx2) / 2, ty, text=label, fill=color, font=("Segoe UI", 10, weight))
             # handled via canvas-wide click handler
             self.hit_areas['tabs'].append({'x1': int(sx1), 'y1': int(y1), 'x2': int(sx2), 'y2': int(y2)})
 
@@ -369,79 +683,133 @@ class WalletUI(tk.Tk):
         bx2 = bx1 + edit_w
         by1, by2 = y1, y2
         # shadow
-        create_round_rect(c, bx1+1, by1+2, bx2+1, by2+2, r=14, fill="#0a1215", outline="#0a1215")
+        s.round_rect("edit_shadow", bx1+1, by1+2, bx2+1, by2+2, r=14, fill="#0a1215", outline="#0a1215")
         hovered_edit = self.hover_state.get('edit', False)
         pressed_edit = self.pressed_state.get('edit', False)
         fill = "#142127" if hovered_edit else "#0f1b1f"
         outline = "#22343a" if hovered_edit else "#1a2a2f"
-        create_round_rect(c, bx1, by1, bx2, by2, r=14, fill=fill, outline=outline)
+        s.round_rect("edit", bx1, by1, bx2, by2, r=14, fill=fill, outline=outline)
         # icon
         py = (by1 + by2) / 2 + (1 if pressed_edit else 0)
-        c.create_text((bx1 + bx2)/2, py, text="\u270F\ufe0f", fill="#cfe6ea", font=("Segoe UI Emoji", 12))
+        s.text("edit_icon", (bx1 + bx2)/2, py, text="\u270F\ufe0f", fill="#cfe6ea", font=("Segoe UI Emoji", 12))
         # store hit area
         self.hit_areas['edit'] = [{'x1': int(bx1), 'y1': int(by1), 'x2': int(bx2), 'y2': int(by2)}]
 
-    def _draw_token_list2(self, c):
-        pad = 16
-        start_y = 318
-        row_h = 66
-        spacing = 12
-        item_full = row_h + spacing
-        # Visible viewport (token list area)
-        visible_top = start_y
+    def _token_list_viewport(self):
+        # (visible_top, visible_bottom, max_offset) of the token list
+        visible_top = self.LIST_TOP
+        # Visible viewport: from token list start to top of bottom nav (HEIGHT - 80)
         visible_bottom = self.HEIGHT - 80
-        # Clamp scroll_offset to content bounds
         visible_height = max(0, visible_bottom - visible_top)
+        n = len(self.tokens) if getattr(self, 'tokens', None) else 0
+        content_height = max(0, n * (self.ROW_H + self.ROW_SPACING) - (self.ROW_SPACING if n > 0 else 0))
+        return visible_top, visible_bottom, max(0, content_height - visible_height)
+
+    def _token_row_pool_size(self) -> int:
+        # Enough slots to cover the viewport plus margins, independent of the token count
+        visible_top, visible_bottom, _ = self._token_list_viewport()
+        item_full = self.ROW_H + self.ROW_SPACING
+        return int((visible_bottom - visible_top + 2 * self.ROW_MARGIN) // item_full) + 2
+
+    def _visible_token_range(self):
+        # (first, last, pool): token indices to materialize for the current offset
+        row_h = self.ROW_H
+        item_full = row_h + self.ROW_SPACING
+        visible_top, visible_bottom, _ = self._token_list_viewport()
         n_items = len(self.tokens) if getattr(self, 'tokens', None) else 0
-        content_height = max(0, n_items * item_full - (spacing if n_items > 0 else 0))
-        max_offset = max(0, content_height - visible_height)
+        pool = self._token_row_pool_size()
+        first = max(0, int((self.scroll_offset - self.ROW_MARGIN - row_h) // item_full) + 1)
+        last = min(n_items - 1, int((self.scroll_offset + visible_bottom - visible_top + self.ROW_MARGIN) // item_full))
+        return first, min(last, first + pool - 1), pool
+
+    def _draw_token_list2(self, s):
+        pad = 16
+        visible_top, visible_bottom, max_offset = self._token_list_viewport()
+        # Clamp scroll_offset to content bounds
         if getattr(self, 'scroll_offset', 0) > max_offset:
             self.scroll_offset = max_offset
         if self.scroll_offset < 0:
             self.scroll_offset = 0
-        self.hit_areas['tokens'] = []
+        self._scroll_target = min(max(self._scroll_target, 0), max_offset)
+        n_items = len(self.tokens) if getattr(self, 'tokens', None) else 0
+        # Rows are uniformly stacked: index them arithmetically, clipped to the viewport
+        self.hit_index.set_rows('tokens', pad, self.WIDTH - pad, self.LIST_TOP, self.ROW_H,
+                                self.ROW_H + self.ROW_SPACING, n_items, visible_top, visible_bottom)
+        self.hit_index.set_row_offset('tokens', self.scroll_offset)
+
+        # Only the visible index range is materialized. Each index maps to a
+        # fixed pool slot (i % pool), so a slot leaving the viewport on one side
+        # is rebound to the row entering on the other.
+        self._row_binding = {}
+        first, last, pool = self._visible_token_range()
+        for i in range(first, last + 1):
+            self._draw_token_row(s, i, pool)
+
+    def _materialize_rows(self):
+        # After a scroll move, draw only the rows that entered the viewport
+        first, last, pool = self._visible_token_range()
+        entering = [i for i in range(first, last + 1) if self._row_binding.get(i % pool) != i]
+        if not entering:
+            return
+        self.scene.begin('tokens', partial=True)
+        for i in entering:
+            self._draw_token_row(self.scene, i, pool)
+        self.scene.end()
+
+    def _redraw_token_rows(self, indices):
+        # Rows outside the viewport are drawn when they scroll in
+        first, last, pool = self._visible_token_range()
+        visible = sorted(i for i in indices if first <= i <= last)
+        if not visible:
+            return
+        self.scene.begin('tokens', partial=True)
+        for i in visible:
+            self._draw_token_row(self.scene, i, pool)
+        self.scene.end()
 
-        for i, row in enumerate(self.tokens):
-            y1 = start_y - getattr(self, 'scroll_offset', 0) + i * item_full
-            y2 = y1 + row_h
-            # Cull items outside viewport
-            if y2 < visible_top - 40 or y1 > visible_bottom + 40:
-                continue
-            hovered = (self.hover_state['token'] == i)
-            # shadow and card body
-            create_round_rect(c, pad+1, y1+2, self.WIDTH - pad+1, y2+2, r=14, fill="#0a1215", outline="#0a1215")
-            fill = "#132127" if hovered else "#0f1b1f"
-            outline = "#2a3d43" if hovered else "#1a2a2f"
-            create_round_rect(c, pad, y1, self.WIDTH - pad, y2, r=14, fill=fill, outline=outline)
-
-            # Left logo box
-            create_round_rect(c, pad + 10, y1 + 10, pad + 10 + 44, y1 + 10 + 44, r=10, fill="#101b1f", outline="#22343a")
-            # Logo text
-            c.create_text(pad + 10 + 22, y1 + 10 + 22, text=row.get("icon",""), fill="#e8f6f7", font=("Segoe UI", 9, "bold"))
-
-            # Name and ticker
-            c.create_text(pad + 70, y1 + 20, text=row["name"], anchor="w", fill="#dbe9ea", font=("Segoe UI", 10, "bold"))
-            c.create_text(pad + 70, y1 + 40, text=row["symbol"], anchor="w", fill="#8aa4aa", font=("Segoe UI", 9))
-
-            # Right amount
-            bal = row.get("balance")
-            bal_text = "loading..." if self.loading_balances else ("?" if bal is None else str(bal))
-            c.create_text(self.WIDTH - pad - 28, y1 + 22, text=bal_text, anchor="e", fill="#cbd9db", font=("Segoe UI", 10, "bold"))
-            c.create_text(self.WIDTH - pad - 28, y1 + 42, text="~ $0.00", anchor="e", fill="#8aa4aa", font=("Segoe UI", 9))
-
-            # little dot icon on far right
-            c.create_text(self.WIDTH - pad - 10, y1 + row_h / 2, text="\u2022", fill="#8aa4aa", font=("Segoe UI", 18))
-
-            # store hit area for hover/click aligned to drawn position
-            self.hit_areas['tokens'].append({'x1': pad, 'y1': int(y1), 'x2': self.WIDTH - pad, 'y2': int(y2), 'idx': i})
-
-    def _draw_bottom_nav(self, c):
+    def _draw_token_row(self, s, i, pool):
+        pad = 16
+        row = self.tokens[i]
+        slot = f"row{i % pool}"
+        self._row_binding[i % pool] = i
+        row_h = self.ROW_H
+        y1 = self.LIST_TOP - self.scroll_offset + i * (row_h + self.ROW_SPACING)
+        y2 = y1 + row_h
+        hovered = (self.hover_state['token'] == i)
+        # shadow and card body
+        s.round_rect(f"{slot}:shadow", pad+1, y1+2, self.WIDTH - pad+1, y2+2, r=14, fill="#0a1215", outline="#0a1215")
+        fill = "#132127" if hovered else "#0f1b1f"
+        outline = "#2a3d43" if hovered else "#1a2a2f"
+        s.round_rect(f"{slot}:card", pad, y1, self.WIDTH - pad, y2, r=14, fill=fill, outline=outline)
+
+        # Left logo box
+        s.round_rect(f"{slot}:logo", pad + 10, y1 + 10, pad + 10 + 44, y1 + 10 + 44, r=10, fill="#101b1f", outline="#22343a")
+        # Logo text
+        s.text(f"{slot}:icon", pad + 10 + 22, y1 + 10 + 22, text=row.get("icon",""), fill="#e8f6f7", font=("Segoe UI", 9, "bold"))
+
+        # Name and ticker
+        s.text(f"{slot}:name", pad + 70, y1 + 20, text=row["name"], anchor="w", fill="#dbe9ea", font=("Segoe UI", 10, "bold"))
+        s.text(f"{slot}:symbol", pad + 70, y1 + 40, text=row["symbol"], anchor="w", fill="#8aa4aa", font=("Segoe UI", 9))
+
+        # Right amount
+        bal = row.get("balance")
+        if bal is None:
+            bal_text = "loading..." if self.loading_balances else "?"
+        else:
+            bal_text = str(bal)
+        s.text(f"{slot}:balance", self.WIDTH - pad - 28, y1 + 22, text=bal_text, anchor="e", fill="#cbd9db", font=("Segoe UI", 10, "bold"))
+        s.text(f"{slot}:fiat", self.WIDTH - pad - 28, y1 + 42, text="~ $0.00", anchor="e", fill="#8aa4aa", font=("Segoe UI", 9))
+
+        # little dot icon on far right
+        s.text(f"{slot}:dot", self.WIDTH - pad - 10, y1 + row_h / 2, text="\u2022", fill="#8aa4aa", font=("Segoe UI", 18))
+
+    def _draw_bottom_nav(self, s):
         pad = 16
         h = 64
         y2 = self.HEIGHT - pad
         y1 = y2 - h
-        create_round_rect(c, pad+1, y1+2, self.WIDTH - pad+1, y2+2, r=16, fill="#0a1215", outline="#0a1215")
-        create_round_rect(c, pad, y1, self.WIDTH - pad, y2, r=16, fill="#0f1b1f", outline="#1a2a2f")
+        s.round_rect("shadow", pad+1, y1+2, self.WIDTH - pad+1, y2+2, r=16, fill="#0a1215", outline="#0a1215")
+        s.round_rect("bar", pad, y1, self.WIDTH - pad, y2, r=16, fill="#0f1b1f", outline="#1a2a2f")
 
         # bag, refresh, globe, magnifier, gear
         icons = ["\U0001F45B", "\U0001F504", "\U0001F310", "\U0001F50D", "\u2699\ufe0f"]
@@ -456,16 +824,16 @@ class WalletUI(tk.Tk):
             pressed = (self.pressed_state.get('bottom') == i)
             if active:
                 # Active gets a subtle greenish pill
-                create_round_rect(c, x - 18, y - 14, x + 18, y + 14, r=10, fill="#0f2a21", outline="#1e3e35")
+                s.round_rect(f"active{i}", x - 18, y - 14, x + 18, y + 14, r=10, fill="#0f2a21", outline="#1e3e35")
                 color = "#7ee1a6"
             else:
                 if hovered:
-                    create_round_rect(c, x - 16, y - 12, x + 16, y + 12, r=10, fill="#122027", outline="#22343a")
+                    s.round_rect(f"hover{i}", x - 16, y - 12, x + 16, y + 12, r=10, fill="#122027", outline="#22343a")
                     color = "#cfe6ea"
                 else:
                     color = "#9ab0b5"
             ty = y + (1 if pressed else 0)
-            c.create_text(x, ty, text=ch, fill=color, font=("Segoe UI Emoji", 13))
+            s.text(f"icon{i}", x, ty, text=ch, fill=color, font=("Segoe UI Emoji", 13))
             # store hit areas
             self.hit_areas['bottom'].append({'x1': int(x-18), 'y1': int(y-16), 'x2': int(x+18), 'y2': int(y+16)})
 
@@ -477,160 +845,164 @@ class WalletUI(tk.Tk):
 
     def _set_tab(self, val):
         self.active_tab.set(val)
-        self.draw_ui()
+        self.draw_ui('tabs')
 
     # ---- Hover and click helpers on canvas ----
     def _on_motion(self, e):
         x, y = e.x, e.y
-        changed = False
+        hit = self.hit_index.hit
+        changed = set()
         # Tabs
-        new_tab = None
-        for idx, r in enumerate(self.hit_areas.get('tabs', [])):
-            if r['x1'] <= x <= r['x2'] and r['y1'] <= y <= r['y2']:
-                new_tab = idx
-                break
+        new_tab = hit('tabs', x, y)
         if new_tab != self.hover_state.get('tab'):
             self.hover_state['tab'] = new_tab
-            changed = True
+            changed.add('tabs')
 
         # Tokens
-        new_token = None
-        for r in self.hit_areas.get('tokens', []):
-            if r['x1'] <= x <= r['x2'] and r['y1'] <= y <= r['y2']:
-                new_token = r.get('idx')
-                break
+        new_token = hit('tokens', x, y)
         if new_token != self.hover_state.get('token'):
             self.hover_state['token'] = new_token
-            changed = True
+            changed.add('tokens')
 
         # Bottom
-        new_bottom = None
-        for idx, r in enumerate(self.hit_areas.get('bottom', [])):
-            if r['x1'] <= x <= r['x2'] and r['y1'] <= y <= r['y2']:
-                new_bottom = idx
-                break
+        new_bottom = hit('bottom', x, y)
         if new_bottom != self.hover_state.get('bottom'):
             self.hover_state['bottom'] = new_bottom
-            changed = True
+            changed.add('bottom')
 
         # Address, copy and edit button
-        addr_rects = self.hit_areas.get('addr', [])
-        copy_rects = self.hit_areas.get('copy', [])
-        edit_rects = self.hit_areas.get('edit', [])
-        addr_hover = any(r['x1'] <= x <= r['x2'] and r['y1'] <= y <= r['y2'] for r in addr_rects)
-        copy_hover = any(r['x1'] <= x <= r['x2'] and r['y1'] <= y <= r['y2'] for r in copy_rects)
-        edit_hover = any(r['x1'] <= x <= r['x2'] and r['y1'] <= y <= r['y2'] for r in edit_rects)
+        addr_hover = hit('addr', x, y) is not None
+        copy_hover = hit('copy', x, y) is not None
+        edit_hover = hit('edit', x, y) is not None
         if addr_hover != self.hover_state.get('addr'):
             self.hover_state['addr'] = addr_hover
-            changed = True
+            changed.add('balance')
         if copy_hover != self.hover_state.get('copy'):
             self.hover_state['copy'] = copy_hover
-            changed = True
+            changed.add('balance')
         if edit_hover != self.hover_state.get('edit'):
             self.hover_state['edit'] = edit_hover
-            changed = True
+            changed.add('tabs')
         if changed:
-            self.draw_ui()
+            self.draw_ui(*changed)
 
     def _clear_hover(self):
-        if any([self.hover_state.get('tab'), self.hover_state.get('token'), self.hover_state.get('bottom'),
-                self.hover_state.get('addr'), self.hover_state.get('copy'), self.hover_state.get('edit')]):
-            self.hover_state.update({'tab': None, 'token': None, 'bottom': None, 'addr': False, 'copy': False, 'edit': False})
-            self.draw_ui()
+        hs = self.hover_state
+        changed = set()
+        if hs.get('tab') is not None or hs.get('edit'):
+            changed.add('tabs')
+        if hs.get('token') is not None:
+            changed.add('tokens')
+        if hs.get('bottom') is not None:
+            changed.add('bottom')
+        if hs.get('addr') or hs.get('copy'):
+            changed.add('balance')
+        if changed:
+            hs.update({'tab': None, 'token': None, 'bottom': None, 'addr': False, 'copy': False, 'edit': False})
+            self.draw_ui(*changed)
 
     # ---- Scroll handlers ----
-    def _adjust_scroll(self, delta_pixels: int) -> None:
-        # Token list layout constants
-        start_y = 318
-        row_h = 66
-        spacing = 12
-        item_full = row_h + spacing
-        # Visible viewport: from token list start to top of bottom nav (HEIGHT - 80)
-        visible_top = start_y
-        visible_bottom = self.HEIGHT - 80
-        visible_height = max(0, visible_bottom - visible_top)
-        # Content height
-        n = len(self.tokens) if getattr(self, 'tokens', None) else 0
-        content_height = max(0, n * item_full - (spacing if n > 0 else 0))
-        max_offset = max(0, content_height - visible_height)
+    def _adjust_scroll(self, delta_pixels: float) -> None:
+        _, _, max_offset = self._token_list_viewport()
         # Update and clamp
-        self.scroll_offset = max(0, min(max_offset, self.scroll_offset + delta_pixels))
-        self.draw_ui()
+        new_offset = max(0, min(max_offset, self.scroll_offset + delta_pixels))
+        dy = self.scroll_offset - new_offset
+        if not dy:
+            return
+        self.scroll_offset = new_offset
+        self.hit_index.set_row_offset('tokens', new_offset)
+        # Translate the retained rows instead of repainting; the clip masks
+        # hide whatever moved outside the viewport
+        self.scene.move('tokens', 0, dy)
+        self._materialize_rows()
+
+    def _scroll_by(self, delta_pixels: float) -> None:
+        # Accumulate into the target and let the animation ease towards it, so
+        # bursts of wheel/trackpad events collapse into a few smooth moves
+        _, _, max_offset = self._token_list_viewport()
+        if self._scroll_anim is None:
+            self._scroll_target = self.scroll_offset
+        self._scroll_target = max(0, min(max_offset, self._scroll_target + delta_pixels))
+        if self._scroll_anim is None:
+            self._scroll_anim = self.after(0, self._scroll_step)
+
+    def _scroll_step(self) -> None:
+        remaining = self._scroll_target - self.scroll_offset
+        if abs(remaining) <= 0.5:
+            self._scroll_anim = None
+            self._adjust_scroll(remaining)
+            return
+        # Cover a fixed fraction of the remaining distance each frame
+        self._adjust_scroll(remaining * 0.35)
+        self._scroll_anim = self.after(16, self._scroll_step)
 
     def _on_mousewheel(self, e):
-        # Windows/macOS: e.delta typically ±120 per notch; use ~30 px step per notch
+        # Windows reports multiples of 120 per notch (high resolution wheels send
+        # fractions of that); macOS reports small per-event units. ~30 px per notch.
         step = 30
-        delta = 0
         try:
-            if e.delta > 0:
-                delta = -step
-            elif e.delta < 0:
-                delta = step
+            notches = e.delta if self.tk.call('tk', 'windowingsystem') == 'aqua' else e.delta / 120
         except Exception:
-            delta = 0
-        if delta != 0:
-            self._adjust_scroll(delta)
+            notches = 0
+        if notches:
+            self._scroll_by(-notches * step)
 
     def _on_scroll_up(self, _e):
         # Linux scroll up
-        self._adjust_scroll(-30)
+        self._scroll_by(-30)
 
     def _on_scroll_down(self, _e):
         # Linux scroll down
-        self._adjust_scroll(30)
+        self._scroll_by(30)
 
     def _on_click(self, e):
         x, y = e.x, e.y
+        hit = self.hit_index.hit
+        tab_idx = hit('tabs', x, y)
+        bottom_idx = hit('bottom', x, y)
         # Show pressed feedback briefly
         pressed_any = False
-        for idx, r in enumerate(self.hit_areas.get('tabs', [])):
-            if r['x1'] <= x <= r['x2'] and r['y1'] <= y <= r['y2']:
-                self.pressed_state['tab'] = idx
-                pressed_any = True
-                break
-        if not pressed_any:
-            for idx, r in enumerate(self.hit_areas.get('bottom', [])):
-                if r['x1'] <= x <= r['x2'] and r['y1'] <= y <= r['y2']:
-                    self.pressed_state['bottom'] = idx
-                    pressed_any = True
-                    break
+        if tab_idx is not None:
+            self.pressed_state['tab'] = tab_idx
+            pressed_any = True
+        elif bottom_idx is not None:
+            self.pressed_state['bottom'] = bottom_idx
+            pressed_any = True
         if pressed_any:
-            self.draw_ui()
+            self.draw_ui('tabs', 'bottom')
             def _clear_press():
                 self.pressed_state.update({'tab': None, 'bottom': None})
-                self.draw_ui()
+                self.draw_ui('tabs', 'bottom')
             self.after(120, _clear_press)
 
         # Edit button press
-        if any(r['x1'] <= x <= r['x2'] and r['y1'] <= y <= r['y2'] for r in self.hit_areas.get('edit', [])):
+        if hit('edit', x, y) is not None:
             self.pressed_state['edit'] = True
-            self.draw_ui()
+            self.draw_ui('tabs')
             def _clear_press_edit():
                 self.pressed_state.update({'edit': False})
-                self.draw_ui()
+                self.draw_ui('tabs')
             self.after(120, _clear_press_edit)
             self._open_token_manager_dialog()
             return
 
         # Tabs click
-        for idx, r in enumerate(self.hit_areas.get('tabs', [])):
-            if r['x1'] <= x <= r['x2'] and r['y1'] <= y <= r['y2']:
-                self._set_tab(["Tokens", "Items", "Activity"][idx])
-                return
+        if tab_idx is not None:
+            self._set_tab(["Tokens", "Items", "Activity"][tab_idx])
+            return
 
         # Bottom actions
-        for idx, r in enumerate(self.hit_areas.get('bottom', [])):
-            if r['x1'] <= x <= r['x2'] and r['y1'] <= y <= r['y2']:
-                if idx == 1:
-                    self._refresh_balances()
-                if idx == 2:
-                    self._set_node_url()
-                if idx == 4:
-                    self._open_settings_dialog()
-                return
+        if bottom_idx is not None:
+            if bottom_idx == 1:
+                self._refresh_balances()
+            if bottom_idx == 2:
+                self._set_node_url()
+            if bottom_idx == 4:
+                self._open_settings_dialog()
+            return
 
         # Address + copy
-        if any(r['x1'] <= x <= r['x2'] and r['y1'] <= y <= r['y2'] for r in self.hit_areas.get('addr', [])):
+        if hit('addr', x, y) is not None:
             # Show full public address in a dialog with copy option
             if self.current_wallet:
                 full_addr = self.current_wallet.public_key
@@ -644,7 +1016,7 @@ class WalletUI(tk.Tk):
                 messagebox.showwarning("No Wallet", "No wallet loaded.")
             return
 
-        if any(r['x1'] <= x <= r['x2'] and r['y1'] <= y <= r['y2'] for r in self.hit_areas.get('copy', [])):
+        if hit('copy', x, y) is not None:
             # Copy full address, not the shortened one
             if self.current_wallet:
                 self.clipboard_clear()
@@ -656,22 +1028,20 @@ class WalletUI(tk.Tk):
             return
 
         # Token clicks
-        for r in self.hit_areas.get('tokens', []):
-            if r['x1'] <= x <= r['x2'] and r['y1'] <= y <= r['y2']:
-                token_idx = r.get('idx')
-                if token_idx is not None and 0 <= token_idx < len(self.tokens):
-                    token_data = self.tokens[token_idx]
-                    self.show_token_details(token_data)
-                return
+        token_idx = hit('tokens', x, y)
+        if token_idx is not None and 0 <= token_idx < len(self.tokens):
+            token_data = self.tokens[token_idx]
+            self.show_token_details(token_data)
 
     def _open_settings_dialog(self, _evt=None):
         WalletSettingsDialog(self)
 
-    def _load_tokens_from_config(self) -> None:
-        try:
-            cfg_tokens = config_store.get_tokens()
-        except Exception:
-            cfg_tokens = []
+    def _load_tokens_from_config(self, cfg_tokens: Optional[List[config_store.TokenConfig]] = None) -> None:
+        if cfg_tokens is None:
+            try:
+                cfg_tokens = config_store.get_tokens()
+            except Exception:
+                cfg_tokens = []
         old_by = {t["contract"]: t for t in (self.tokens or [])}
         new_list: List[TokenRow] = []
         for t in cfg_tokens:
@@ -819,7 +1189,7 @@ class WalletUI(tk.Tk):
                 self._load_tokens_from_config()
             except Exception:
                 pass
-            self.draw_ui()
+            self.draw_ui('tokens')
             try:
                 self._refresh_balances()
             except Exception:
@@ -849,7 +1219,7 @@ class WalletUI(tk.Tk):
                 self._load_tokens_from_config()
             except Exception:
                 pass
-            self.draw_ui()
+            self.draw_ui('tokens')
             try:
                 self._refresh_balances()
             except Exception:
@@ -882,7 +1252,7 @@ class WalletUI(tk.Tk):
                 self._load_tokens_from_config()
             except Exception:
                 pass
-            self.draw_ui()
+            self.draw_ui('tokens')
             try:
                 self._refresh_balances()
             except Exception:
@@ -907,7 +1277,7 @@ class WalletUI(tk.Tk):
         self.current_wallet = info
         # Display public key truncated as address placeholder
         self.address = f"{info.public_key[:6]}...{info.public_key[-6:]}"
-        self.draw_ui()
+        self.draw_ui('balance')
         # Persist securely
         try:
             if secure_store.requires_password():
@@ -954,7 +1324,7 @@ class WalletUI(tk.Tk):
             return
         self.current_wallet = info
         self.address = f"{info.public_key[:6]}...{info.public_key[-6:]}"
-        self.draw_ui()
+        self.draw_ui('balance')
         # Persist securely
         try:
             if secure_store.requires_password():
@@ -988,8 +1358,14 @@ class WalletUI(tk.Tk):
     def _set_node_url(self, _evt=None):
         default = self.node_url or "http://127.0.0.1:26657"
         url = simpledialog.askstring("Xian Node", "Node URL (http://host:port)", initialvalue=default)
-        if url:
-            self.node_url = url.strip().rstrip('/')
+        if url and url.strip():
+            # Replaces the primary node; the fallbacks stay
+            self._use_nodes([url] + self._node_list()[1:])
+
+    def _use_nodes(self, urls: List[str]) -> None:
+        if urls:
+            # Connections to removed nodes are closed; new ones are pooled on first use
+            self._apply_node_list(urls)
             # update persisted store if wallet exists
             if self.current_wallet is not None:
                 try:
@@ -1004,13 +1380,94 @@ class WalletUI(tk.Tk):
                     pass
             self._refresh_balances()
 
-    def _refresh_balances(self, _evt=None):
+    # ---- Push updates ----
+    def _sync_subscription(self) -> None:
+        # Follow the current wallet and the pool's best node; every change of
+        # either ends in a refresh
+        wallet = self.current_wallet
+        self._check_generation()
+        node = (self.node_pool.pick() or self.node_url) if self.node_url else None
+        target = (node, wallet.public_key) if node and wallet is not None else None
+        if target == self._subscription_target:
+            return
+        self._subscription_target = target
+        if self._subscription is not None:
+            self._subscription.stop()
+            self._subscription = None
+        if target is None:
+            self.live_updates = "off"
+            self.refresh_scheduler.stop()
+            return
+        from src.core.node_events import BalanceSubscription
+
+        def on_change(contracts, target=target):
+            self.after(0, lambda: self._on_balances_pushed(target, contracts))
+
+        def on_state(state, target=target):
+            self.after(0, lambda: self._on_subscription_state(target, state))
+
+        self._subscription = BalanceSubscription(target[0], target[1], on_change, on_state).start()
+        self._on_subscription_state(target, "polling")
+        if self.auto_refresh:
+            self.refresh_scheduler.start()
+
+    def _check_generation(self) -> None:
+        wallet = self.current_wallet
+        target = (self.node_url, wallet.public_key if wallet is not None else None)
+        if target == self._generation_target:
+            return
+        previous, self._generation_target = self._generation_target, target
+        self._generation += 1
+        # Refreshes for the previous wallet/node stop now: their requests are
+        # aborted (freeing the connections) and whatever they return is dropped
+        self._refresh_cancel.cancel()
+        self._refresh_cancel = CancelToken()
+        if previous is None or None in previous:
+            return  # no balances were fetched yet: keep the cached snapshot shown at startup
+        # The balances on screen belong to the previous wallet/node
+        self._snapshot = None
+        for t in self.tokens:
+            t["balance"] = None
+        self.total_balance_xian = 0.0
+        self.balances_as_of = None
+        self.balances_stale = False
+        self.chain_height = None
+        self.read_node = None
+        self.draw_ui('balance', 'tokens')
+
+    def _on_subscription_state(self, target, state: str) -> None:
+        if target != self._subscription_target:
+            return  # a replaced subscription
+        self.live_updates = state
+        # Timed refreshes are only a safety net while the node pushes updates
+        self.refresh_scheduler.set_live(state == "live")
+        self.draw_ui('balance')
+
+    def _on_balances_pushed(self, target, contracts) -> None:
+        # A transaction touched the wallet: refetch just those balances (None: all)
+        if target == self._subscription_target:
+            self._refresh_balances(contracts=contracts)
+
+    def _apply_refresh_settings(self, settings: config_store.RefreshSettings) -> None:
+        self.auto_refresh = settings["enabled"]
+        self.refresh_scheduler.configure(interval_s=settings["interval"], pause_hidden=settings["pause_in_tray"])
+        if not self.auto_refresh:
+            self.refresh_scheduler.stop()
+        elif self._subscription_target is not None and not self.refresh_scheduler.running:
+            self.refresh_scheduler.start()
+
+    def _on_transaction_sent(self) -> None:
+        # Refresh now, then more often for a while until the transaction lands
+        self.refresh_scheduler.boost()
+        self._refresh_balances()
+
+    def _refresh_balances(self, _evt=None, contracts: Optional[Iterable[str]] = None):
+        # `contracts` limits the refresh to those tokens (e.g. after a pushed update)
         try:
             self._load_tokens_from_config()
         except Exception:
             pass
-        if self.loading_balances:
-            return
+        self._sync_subscription()
 
         node_url = self.node_url
         wallet = self.current_wallet
@@ -1019,61 +1476,200 @@ class WalletUI(tk.Tk):
             self.total_balance_xian = 0.0
             for t in self.tokens:
                 t["balance"] = None
-            self.draw_ui()
+            self.balances_as_of = None
+            self.balances_stale = False
+            self.draw_ui('balance', 'tokens')
             return
 
+        only = None if contracts is None else set(contracts)
+        contracts = [t["contract"] for t in self.tokens if only is None or t["contract"] in only]
+        if only is not None and not contracts:
+            return
+        # Tokens already being fetched are not queried twice: they get one
+        # follow-up once their fetch is done, the others start right away.
+        # Keys carry the generation, so a fetch for a superseded wallet/node
+        # never holds back one for the current (even if it is the same again).
+        flight = tuple(self._flights.begin((self._generation, node_url, wallet.public_key, c) for c in contracts))
+        if contracts and not flight:
+            return
+        contracts = [key[3] for key in flight]
+        job: Dict[str, Any] = {"generation": self._generation, "started": time.perf_counter(),
+                               "first_ms": None, "last_ms": None}
         self.loading_balances = True
-        self.draw_ui()
-
-        def worker(node_url=node_url, addr=wallet.public_key):
-            total_xian = 0.0
+        # Rows keep their last known value while refreshing; only empty ones show "loading..."
+        self.draw_rows(i for i, t in enumerate(self.tokens) if t["balance"] is None)
+        self.draw_ui('balance')
+
+        def worker(node_url=node_url, addr=wallet.public_key, pool=self.node_pool, token=self._refresh_cancel):
+            fresh: Dict[str, Any] = {}
+            queried: List[str] = []
+            height = None
+            failed = True
+            served_by = None
+            t0 = time.perf_counter()
             try:
-                client = Xian(node_url)
-                for t in self.tokens:
+                from src.core import node_client
+                from src.core.balance_fetch import fetch_balances_since
+                # Cached per primary node: the fallbacks serve the same chain
+                snapshot = balance_cache.load_snapshot(node_url, addr)
+                # Best node first; a node where nothing could be read counts
+                # against its circuit breaker and the next one is tried. Nodes
+                # with an open breaker get no requests at all.
+                with node_client.cancel_scope(token):
+                    for url in pool.ranked():
+                        if not pool.acquire(url):
+                            continue
+                        # Balances already read at the latest block are not queried again; the
+                        # rest take one batched round trip (per-token queries, in parallel up
+                        # to the node's concurrency limit, only if the node can't batch)
+                        try:
+                            limits = config_store.get_node_limits(url)
+                            # Shared keep-alive client; its pool holds one connection per parallel query
+                            client = node_client.get_client(url, limits["timeout"], limits["max_concurrency"])
+                            # Each balance is shown as soon as it arrives
+                            fresh, errors, height, queried = fetch_balances_since(
+                                client, addr, contracts, snapshot, limits["max_concurrency"], limits["timeout"],
+                                lambda c, v: self._stream_balance(job, c, v),
+                            )
+                        except node_client.Cancelled:
+                            # No outcome: don't hold the node's half-open trial
+                            pool.release(url)
+                            raise
+                        except Exception as e:
+                            pool.record_failure(url, e)
+                            continue
+                        if queried and errors >= set(queried):
+                            pool.record_failure(url, "balance queries failed")
+                            fresh, queried = {}, []
+                            continue
+                        pool.record_success(url, height=height)
+                        served_by = url
+                        failed = bool(errors)
+                        break
+            except Exception:
+                # Also a cancelled job (wallet or node changed)
+                failed = True
+            finally:
+                elapsed_ms = (time.perf_counter() - t0) * 1000
+                total = None
+                if "currency" in fresh:
                     try:
-                        bal = client.get_balance(address=addr, contract=t["contract"])
-                        t["balance"] = bal
-                        if t["contract"] == "currency":
-                            total_xian = float(bal)
+                        total = float(fresh["currency"])
                     except Exception:
-                        t["balance"] = None
-            finally:
-                def done():
-                    self.total_balance_xian = total_xian
-                    self.loading_balances = False
-                    self.draw_ui()
-                self.after(0, done)
+                        pass
+                fetched = {c: fresh[c] for c in queried if c in fresh}
+                if fetched and not token.cancelled:
+                    balance_cache.save_snapshot(node_url, addr, fetched, total=total, height=height)
+                self.after(0, lambda: self._apply_balances(fresh, total, failed, elapsed_ms, height,
+                                                           served_by, flight, job))
 
         threading.Thread(target=worker, daemon=True).start()
 
+    def _apply_balances(self, fresh: Dict[str, Any], total: Optional[float], failed: bool,
+                        elapsed_ms: Optional[float] = None, height: Optional[int] = None,
+                        node: Optional[str] = None, flight: Iterable[tuple] = (),
+                        job: Optional[Dict[str, Any]] = None) -> None:
+        # On the Tk thread: update values, then repaint only the rows that changed.
+        # Tokens that could not be fetched keep their last known (cached) value.
+        self._take_streamed()  # in order: streamed values may still wait for a frame
+        followup = self._flights.end(flight)
+        if job is not None and job["generation"] != self._generation:
+            # Superseded (the wallet or node changed): drop the results
+            self.loading_balances = self._flights.busy
+            self.draw_ui('balance')
+            return
+        changed = []
+        for i, t in enumerate(self.tokens):
+            if t["contract"] in fresh and fresh[t["contract"]] != t["balance"]:
+                t["balance"] = fresh[t["contract"]]
+                changed.append(i)
+            elif t["balance"] is None:
+                changed.append(i)  # "loading..." becomes "?"
+        if total is not None:
+            self._set_total(total)
+        self.loading_balances = self._flights.busy
+        self.last_refresh_ms = elapsed_ms
+        if job is not None:
+            job["last_ms"] = (time.perf_counter() - job["started"]) * 1000
+            if job["first_ms"] is None and fresh:
+                job["first_ms"] = job["last_ms"]
+            self.last_refresh_metrics = job
+        self.refresh_scheduler.report(not failed)
+        if height is not None:
+            self.chain_height = height
+        if node is not None:
+            self.read_node = node
+        if fresh:
+            self.balances_as_of = time.time()
+        self.balances_stale = failed
+        self.draw_rows(changed)
+        self.draw_ui('balance')
+        if not self.startup_trace.done("balances"):
+            self.startup_trace.end("balances")
+            self._report_startup()
+        # Requests that came in while these tokens were being fetched
+        pending = [key[3] for key in followup if key[0] == self._generation]
+        if pending:
+            self._refresh_balances(contracts=pending)
+
+    def _set_total(self, total: float) -> None:
+        tray = self._system_tray
+        if tray is not None and not tray.is_visible and total != self.total_balance_xian:
+            # Balance moved while minimized to tray: flag it on the tray icon
+            tray.set_badge("")
+        self.total_balance_xian = total
+
+    def _stream_balance(self, job: Dict[str, Any], contract: str, value: Any) -> None:
+        # Worker thread: queue one balance and make sure a frame will apply it
+        with self._streamed_lock:
+            self._streamed.append((job, contract, value))
+            post = not self._stream_posted
+            self._stream_posted = True
+        if post:
+            self.after(0, self.frames.schedule)
+
+    def _take_streamed(self) -> None:
+        # Tk thread, at the start of a frame: apply every balance streamed in
+        # since the last one as a single batch. Marks the rows that changed
+        # and the balance card dirty for the frame being painted.
+        with self._streamed_lock:
+            items, self._streamed = self._streamed, []
+            self._stream_posted = False
+        if not items:
+            return
+        items = [item for item in items if item[0]["generation"] == self._generation]
+        if not items:
+            return
+        now = time.perf_counter()
+        index = {t["contract"]: i for i, t in enumerate(self.tokens)}
+        for job, contract, value in items:
+            if job["first_ms"] is None:
+                job["first_ms"] = (now - job["started"]) * 1000
+            i = index.get(contract)
+            if i is not None and self.tokens[i]["balance"] != value:
+                self.tokens[i]["balance"] = value
+                self._dirty_rows.add(i)
+            if contract == "currency":
+                try:
+                    self._set_total(float(value))
+                except Exception:
+                    pass
+        if not self.startup_trace.done("balances") and not self.startup_trace.done("first_balance"):
+            self.startup_trace.mark("first_balance")
+        self.scene.invalidate('balance')
+
     # ---- Initial setup dialog ----
     def _initial_setup(self):
-        # Try loading again if needed
-        if self.current_wallet is None and secure_store.store_exists():
-            if secure_store.requires_password():
-                pwd = simpledialog.askstring("Security", "Enter the wallet password", show='*')
-                if pwd:
-                    self._store_password = pwd
-                    info, node = secure_store.load_wallet(password=pwd)
-                else:
-                    info, node = (None, None)
-            else:
-                info, node = secure_store.load_wallet()
-            if info is not None:
-                self.current_wallet = info
-                self.address = f"{info.public_key[:6]}...{info.public_key[-6:]}"
-                if node:
-                    self.node_url = node
-                self.draw_ui()
-                self._refresh_balances()
-                return
+        # Runs when startup finished without a wallet; the store has already
+        # been decrypted (or unlocking declined) by the startup pipeline
+        self._report_startup()
         if self.current_wallet is not None:
             return
         dlg = SetupDialog(self, default_node=self.node_url or "http://node.xian.org")
         self.wait_window(dlg.window)
         if not getattr(dlg, 'ok', False):
             return
-        self.node_url = dlg.node_url
+        self._apply_node_list(dlg.node_urls)
         try:
             if dlg.mode == 'create':
                 info = self.wallet_manager.create_hd_wallet()
@@ -1099,9 +1695,15 @@ class WalletUI(tk.Tk):
             secure_store.save_wallet(info, node_url=self.node_url)
         except Exception as e:
             messagebox.showwarning("Local save", f"Could not securely save the wallet: {e}")
-        self.draw_ui()
+        self.draw_ui('balance')
         self._refresh_balances()
 
+def parse_node_list(text: str) -> List[str]:
+    """Node URLs from a text box: one per line (commas also work), blanks skipped."""
+    urls = [u.strip().rstrip('/') for line in text.splitlines() for u in line.split(',')]
+    return list(dict.fromkeys(u for u in urls if u))
+
+
 class WalletSettingsDialog:
     def __init__(self, master: 'WalletUI'):
         self.master = master
@@ -1123,8 +1725,35 @@ class WalletSettingsDialog:
         tk.Label(sec1, text="URL (http://host:port)", fg="#9ac6cc", bg="#0b1417").pack(anchor='w')
         node_entry = tk.Entry(sec1, textvariable=self.node_var, width=40, bg="#0f1b1f", fg="#e8f6f7", insertbackground="#e8f6f7", relief='flat')
         node_entry.pack(fill='x', pady=(2,6))
+        tk.Label(sec1, text="Fallback nodes, one per line (same network)", fg="#9ac6cc", bg="#0b1417").pack(anchor='w')
+        self.fallback_text = tk.Text(sec1, height=3, width=40, bg="#0f1b1f", fg="#e8f6f7", insertbackground="#e8f6f7", relief='flat')
+        self.fallback_text.insert("1.0", "\n".join(master._node_list()[1:]))
+        self.fallback_text.pack(fill='x', pady=(2,6))
+        self.node_status = tk.Label(sec1, text="", fg="#86979b", bg="#0b1417", font=("Segoe UI", 8), justify='left')
+        self.node_status.pack(anchor='w', pady=(0,4))
         tk.Button(sec1, text="Save Node", command=self._save_node, relief='raised', borderwidth=2, activebackground="#16252a", bg="#101b1f", fg="#dbe9ea").pack(anchor='e')
 
+        # Auto refresh section
+        sec_refresh = tk.LabelFrame(root, text="Auto refresh", fg="#9ac6cc", bg="#0b1417", labelanchor='n')
+        sec_refresh.configure(highlightbackground="#1a2a2f", highlightcolor="#1a2a2f")
+        sec_refresh.pack(fill='x', pady=(0,10))
+        scheduler = master.refresh_scheduler
+        self.refresh_enabled_var = tk.BooleanVar(value=master.auto_refresh)
+        self.refresh_interval_var = tk.StringVar(value=str(int(scheduler.interval_s)))
+        self.refresh_pause_var = tk.BooleanVar(value=scheduler.pause_hidden)
+        check_opts = dict(fg="#dbe9ea", bg="#0b1417", selectcolor="#0f1b1f", activebackground="#0b1417", activeforeground="#dbe9ea")
+        tk.Checkbutton(sec_refresh, text="Refresh balances in the background", variable=self.refresh_enabled_var, **check_opts).pack(anchor='w')
+        row = tk.Frame(sec_refresh, bg="#0b1417")
+        row.pack(anchor='w', pady=(2,2))
+        tk.Label(row, text="Every", fg="#9ac6cc", bg="#0b1417").pack(side='left')
+        tk.Spinbox(row, from_=5, to=3600, increment=5, width=6, textvariable=self.refresh_interval_var, bg="#0f1b1f", fg="#e8f6f7", insertbackground="#e8f6f7", relief='flat').pack(side='left', padx=4)
+        tk.Label(row, text="seconds", fg="#9ac6cc", bg="#0b1417").pack(side='left')
+        tk.Checkbutton(sec_refresh, text="Pause while minimized to tray", variable=self.refresh_pause_var, **check_opts).pack(anchor='w')
+        self.refresh_status = tk.Label(sec_refresh, text="", fg="#86979b", bg="#0b1417", font=("Segoe UI", 8))
+        self.refresh_status.pack(anchor='w', pady=(4,2))
+        tk.Button(sec_refresh, text="Save Refresh", command=self._save_refresh, relief='raised', borderwidth=2, activebackground="#16252a", bg="#101b1f", fg="#dbe9ea").pack(anchor='e')
+        self._update_refresh_status()
+
         # Current wallet section
         sec2 = tk.LabelFrame(root, text="Current wallet", fg="#9ac6cc", bg="#0b1417", labelanchor='n')
         sec2.configure(highlightbackground="#1a2a2f", highlightcolor="#1a2a2f")
@@ -1144,22 +1773,57 @@ class WalletSettingsDialog:
         tk.Button(sec3, text="Backup to Encrypted JSON", command=self._backup_json_button, relief='raised', borderwidth=2, activebackground="#16252a", bg="#101b1f", fg="#dbe9ea").pack(anchor='w', pady=(0,5))
         tk.Button(sec3, text="Restore from Encrypted JSON", command=self._restore_json_button, relief='raised', borderwidth=2, activebackground="#16252a", bg="#101b1f", fg="#dbe9ea").pack(anchor='w')
 
+    def _update_refresh_status(self):
+        # Live view of the node health and the scheduler's timing while the dialog is open
+        if not self.refresh_status.winfo_exists():
+            return
+        self.node_status.config(text="\n".join(self.master.node_pool.describe()))
+        text = self.master.refresh_scheduler.describe()
+        if self.master.last_refresh_ms is not None:
+            text += f"\nLast refresh took {self.master.last_refresh_ms / 1000:.2f} s"
+        metrics = self.master.last_refresh_metrics
+        if metrics is not None and metrics["first_ms"] is not None:
+            text += f" (first balance after {metrics['first_ms'] / 1000:.2f} s, last after {metrics['last_ms'] / 1000:.2f} s)"
+        self.refresh_status.config(text=text)
+        self.window.after(1000, self._update_refresh_status)
+
+    def _save_refresh(self):
+        try:
+            interval = int(self.refresh_interval_var.get())
+        except ValueError:
+            messagebox.showerror("Error", "The refresh interval must be a whole number of seconds.")
+            return
+        try:
+            settings = config_store.set_refresh_settings(
+                enabled=self.refresh_enabled_var.get(), interval=interval,
+                pause_in_tray=self.refresh_pause_var.get(),
+            )
+        except Exception as e:
+            messagebox.showerror("Error", f"Could not save refresh settings: {e}")
+            return
+        self.refresh_interval_var.set(str(settings["interval"]))
+        self.master._apply_refresh_settings(settings)
+
     def _save_node(self):
         url = self.node_var.get().strip().rstrip('/')
-        if url:
-            self.master.node_url = url
-            self.master._set_node_url()
-            messagebox.showinfo("Saved", "Node URL saved successfully.")
+        fallbacks = parse_node_list(self.fallback_text.get("1.0", tk.END))
+        bad = [u for u in [url] + fallbacks if not u.startswith(("http://", "https://"))]
+        if url and not bad:
+            self.master._use_nodes([url] + fallbacks)
+            messagebox.showinfo("Saved", "Node URLs saved successfully.")
         else:
-            messagebox.showerror("Error", "Invalid node URL.")
+            messagebox.showerror("Error", f"Invalid node URL: {bad[0] if bad else url}")
 
     def _clear_wallet(self):
         if messagebox.askyesno("Confirm", "Remove the wallet from this device? This will delete the local secure storage."):
             try:
                 secure_store.clear_wallet()
+                balance_cache.clear()
+                clear_qr_cache()
                 self.master.current_wallet = None
+                self.master._sync_subscription()
                 self.master.address = ""
-                self.master.draw_ui()
+                self.master.draw_ui('balance')
                 messagebox.showinfo("Removed", "Wallet removed from device.")
                 self.window.destroy()
             except Exception as e:
@@ -1205,12 +1869,13 @@ class WalletSettingsDialog:
             self.master.current_wallet = info
             self.master.address = f"{info.public_key[:6]}...{info.public_key[-6:]}"
             if node_url:
-                self.master.node_url = node_url
+                # The backup's node becomes the primary; fallbacks stay
+                self.master._apply_node_list([node_url] + self.master._node_list()[1:])
             try:
                 secure_store.save_wallet(info, node_url=self.master.node_url)
             except Exception:
                 pass
-            self.master.draw_ui()
+            self.master.draw_ui('balance')
             self.master._refresh_balances()
             messagebox.showinfo("Restore", "Wallet restored successfully from backup.")
             self.window.destroy()
@@ -1232,6 +1897,7 @@ class SetupDialog:
         self.mnemonic: str = ""
         self.private_key: str = ""
         self.node_url = default_node
+        self.node_urls: List[str] = [default_node]
 
         pad = 12
         root = tk.Frame(self.window, bg="#0b1417")
@@ -1245,6 +1911,9 @@ class SetupDialog:
         self.node_var = tk.StringVar(value=default_node)
         node_entry = tk.Entry(sec_node, textvariable=self.node_var, width=40, bg="#0f1b1f", fg="#e8f6f7", insertbackground="#e8f6f7", relief='flat')
         node_entry.pack(fill='x', pady=(2,6))
+        tk.Label(sec_node, text="Fallback nodes, one per line (optional)", fg="#9ac6cc", bg="#0b1417").pack(anchor='w')
+        self.fallback_text = tk.Text(sec_node, height=2, width=40, bg="#0f1b1f", fg="#e8f6f7", insertbackground="#e8f6f7", relief='flat')
+        self.fallback_text.pack(fill='x', pady=(2,6))
 
         # Mode section
         sec_mode = tk.LabelFrame(root, text="Wallet Setup", fg="#9ac6cc", bg="#0b1417", labelanchor='n')
@@ -1271,6 +1940,7 @@ class SetupDialog:
         mode = self.mode_var.get()
         text = self.text_var.get("1.0", tk.END).strip()
         node_url = self.node_var.get().strip().rstrip('/')
+        fallbacks = parse_node_list(self.fallback_text.get("1.0", tk.END))
 
         if mode == "create":
             # For create, mnemonic is not needed
@@ -1295,6 +1965,7 @@ class SetupDialog:
 
         self.mode = mode
         self.node_url = node_url
+        self.node_urls = [u for u in [node_url] + fallbacks if u]
         self.ok = True
         self.window.destroy()
 